@@ -0,0 +1,151 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker, shared_memory
+from threading import Lock, Thread
+
+_EXPORT_GRACE = 30.0		# Seconds A Worker Keeps Exported Segments Open On Windows
+_exports = []
+
+def _init_worker(mixer_format: tuple[int, int, int]):
+	os.environ["SDL_AUDIODRIVER"] = "dummy"		# Workers Only Decode, Never Open A Device
+	os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+	import pygame
+	frequency, size, channels = mixer_format
+	pygame.mixer.init(frequency, size, channels)
+
+	parent = multiprocessing.parent_process()
+	if parent is not None:
+		Thread(target=_exit_with, args=(parent,), daemon=True).start()
+
+def _exit_with(parent):
+	"""Ends The Worker Once Its Parent Is Gone, A Killed Parent Can't Shut The Pool Down"""
+	parent.join()
+	os._exit(0)
+
+def _release_exports():
+	now = time.monotonic()
+	while _exports and now - _exports[0][0] > _EXPORT_GRACE:
+		_exports.pop(0)[1].close()
+
+def _decode_to_shared(path: str) -> tuple[str, int, float]:
+	"""Decodes A File In A Worker And Copies The PCM Into Shared Memory
+
+	Args:
+		path (str): The Audio File Path
+
+	Returns:
+		tuple[str, int, float]: Segment Name, PCM Byte Count And Decode Seconds
+	"""
+	import pygame
+
+	start = time.perf_counter()
+	data = memoryview(pygame.mixer.Sound(path)).cast("B")
+	seconds = time.perf_counter() - start
+
+	shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+	shm.buf[:data.nbytes] = data
+	resource_tracker.unregister(shm._name, "shared_memory")		# The Main Process Unlinks It
+
+	if os.name == "nt":							# Windows Frees Segments With Their Last Handle
+		_release_exports()
+		_exports.append((time.monotonic(), shm))
+	else:
+		shm.close()
+	return shm.name, data.nbytes, seconds
+
+
+class DecodeTimings:
+	"""Per File Decode Timings Recorded From The Worker Processes"""
+	def __init__(self):
+		self.timings = {}		# Path -> (Seconds, Bytes)
+		self._lock = Lock()
+
+	def record(self, path: str, seconds: float, nbytes: int):
+		with self._lock:
+			self.timings[path] = (seconds, nbytes)
+
+	def summary(self) -> dict:
+		"""Gets Totals Over Every Recorded Decode
+
+		Returns:
+			dict: Count, Total, Mean And Slowest Decode Seconds
+		"""
+		with self._lock:
+			seconds = [s for s, _ in self.timings.values()]
+			slowest = max(self.timings, key=lambda p: self.timings[p][0], default=None)
+		return {
+			"count": len(seconds),
+			"total": sum(seconds),
+			"mean": sum(seconds) / len(seconds) if seconds else 0.0,
+			"max": max(seconds, default=0.0),
+			"slowest": slowest,
+		}
+
+
+class DecodePool:
+	"""Decodes Files In Worker Processes Sized To The Machine"""
+	def __init__(self, mixer_format: tuple[int, int, int], workers: int | None = None):
+		self.mixer_format = mixer_format
+		self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+		self.timings = DecodeTimings()
+
+		self._executor = None
+		self._lock = Lock()
+
+	def _get_executor(self) -> ProcessPoolExecutor:
+		with self._lock:
+			if self._executor is None:
+				self._executor = ProcessPoolExecutor(
+					max_workers=self.workers,
+					mp_context=multiprocessing.get_context("spawn"),
+					initializer=_init_worker,
+					initargs=(self.mixer_format,)
+				)
+			return self._executor
+
+	def decode(self, path: str, sound_type):
+		"""Decodes A File In A Worker And Wraps The PCM On This Side
+
+		Blocks Until The Worker Finishes, Call It From A Loader Thread
+
+		Args:
+			path (str): The Audio File Path
+			sound_type (type): pygame.mixer.Sound, Used To Wrap The Buffer
+
+		Returns:
+			pygame.mixer.Sound: The Decoded Sound
+		"""
+		try:
+			name, nbytes, seconds = self._get_executor().submit(_decode_to_shared, path).result()
+		except BrokenProcessPool:
+			with self._lock:
+				self._executor = None			# Respawn On The Next Decode
+			return self._decode_here(path, sound_type)
+
+		shm = shared_memory.SharedMemory(name=name)
+		view = shm.buf[:nbytes]
+		try:
+			sound = sound_type(buffer=view)
+		finally:
+			view.release()
+			shm.close()
+			shm.unlink()
+
+		self.timings.record(path, seconds, nbytes)
+		return sound
+
+	def _decode_here(self, path: str, sound_type):
+		start = time.perf_counter()
+		sound = sound_type(path)
+		self.timings.record(path, time.perf_counter() - start, memoryview(sound).nbytes)
+		return sound
+
+	def shutdown(self):
+		with self._lock:
+			if self._executor is not None:
+				self._executor.shutdown(wait=False, cancel_futures=True)
+				self._executor = None
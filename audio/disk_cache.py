@@ -0,0 +1,215 @@
+import hashlib
+import mmap
+import os
+from threading import Lock
+
+
+class PcmDiskCache:
+	"""On Disk Cache Of Decoded PCM Already In The Mixer's Format
+
+	Entries Are Keyed On Path, Modified Time, Size And Mixer Format And
+	Reloaded Through A Memory Map Instead Of Being Decoded Again
+	"""
+	EXTENSION = ".pcm"
+
+	def __init__(self, directory: str, max_bytes: int):
+		self.directory = directory
+		self.max_bytes = max_bytes
+
+		self.hits = 0
+		self.misses = 0
+		self.writes = 0
+		self.evictions = 0
+
+		self._lock = Lock()
+		self._used_bytes = None		# Scanned On First Use
+
+	def key(self, path: str) -> str | None:
+		"""Gets The Cache Key For A File At The Current Mixer Format
+
+		Args:
+			path (str): The Audio File Path
+
+		Returns:
+			str | None: The Key Or None If The File Can't Be Read
+		"""
+		import pygame
+
+		try:
+			stat = os.stat(path)
+		except OSError:
+			return None
+
+		ident = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{pygame.mixer.get_init()}"
+		return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+	def entry_path(self, path: str) -> str | None:
+		"""Gets The Cached PCM File For An Audio File If One Exists
+
+		Args:
+			path (str): The Audio File Path
+
+		Returns:
+			str | None: Path Of The Cached PCM File
+		"""
+		key = self.key(path)
+		if key is None:
+			return None
+
+		entry = os.path.join(self.directory, key + self.EXTENSION)
+		return entry if os.path.isfile(entry) else None
+
+	def load(self, path: str):
+		"""Loads A Sound From The Cache Through A Memory Map
+
+		Args:
+			path (str): The Audio File Path
+
+		Returns:
+			pygame.mixer.Sound | None: The Sound Or None On A Miss
+		"""
+		import pygame
+
+		entry = self.entry_path(path)
+		sound = None
+
+		if entry and os.path.getsize(entry) > 0:
+			try:
+				with open(entry, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+					sound = pygame.mixer.Sound(buffer=mm)
+				os.utime(entry)							# Mark As Recently Used
+			except (OSError, ValueError, pygame.error):
+				sound = None
+
+		with self._lock:
+			if sound is None:
+				self.misses += 1
+			else:
+				self.hits += 1
+		return sound
+
+	def store(self, path: str, sound):
+		"""Writes A Decoded Sound To The Cache And Trims It To The Size Cap
+
+		Args:
+			path (str): The Audio File Path
+			sound (pygame.mixer.Sound): The Decoded Sound
+		"""
+		key = self.key(path)
+		if key is None:
+			return
+
+		data = memoryview(sound).cast("B")
+		if data.nbytes > self.max_bytes:
+			return
+
+		entry = os.path.join(self.directory, key + self.EXTENSION)
+		temp = f"{entry}.{os.getpid()}.tmp"
+
+		with self._lock:
+			self._scan()								# Count Existing Entries Before Adding This One
+
+		try:
+			os.makedirs(self.directory, exist_ok=True)
+			with open(temp, "wb") as f:
+				f.write(data)
+			os.replace(temp, entry)
+		except OSError:
+			if os.path.exists(temp):
+				os.remove(temp)
+			return
+
+		with self._lock:
+			self.writes += 1
+			self._used_bytes += data.nbytes
+			self._trim()
+
+	def clear(self) -> int:
+		"""Deletes Every Cached Entry
+
+		Returns:
+			int: Bytes Freed
+		"""
+		freed = 0
+		with self._lock:
+			for entry, size, _ in self._entries():
+				try:
+					os.remove(entry)
+					freed += size
+				except OSError:
+					pass
+			self._used_bytes = None
+		return freed
+
+	def used_bytes(self) -> int:
+		with self._lock:
+			self._scan()
+			return self._used_bytes
+
+	def _entries(self) -> list[tuple[str, int, float]]:
+		if not os.path.isdir(self.directory):
+			return []
+
+		entries = []
+		for name in os.listdir(self.directory):
+			if not name.endswith(self.EXTENSION):
+				continue
+			entry = os.path.join(self.directory, name)
+			try:
+				stat = os.stat(entry)
+			except OSError:
+				continue
+			entries.append((entry, stat.st_size, stat.st_mtime))
+		return entries
+
+	def _scan(self):
+		if self._used_bytes is None:
+			self._used_bytes = sum(size for _, size, _ in self._entries())
+
+	def _trim(self):
+		if self._used_bytes <= self.max_bytes:
+			return
+
+		for entry, size, _ in sorted(self._entries(), key=lambda e: e[2]):
+			if self._used_bytes <= self.max_bytes:
+				break
+			try:
+				os.remove(entry)
+			except OSError:
+				continue
+			self._used_bytes -= size
+			self.evictions += 1
+
+	def stats(self) -> dict:
+		"""Gets The Cache Counters
+
+		Returns:
+			dict: Hits, Misses, Writes, Evictions And Byte Usage
+		"""
+		used = self.used_bytes()
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {
+				"hits": self.hits,
+				"misses": self.misses,
+				"hit_rate": self.hits / lookups if lookups else 0.0,
+				"writes": self.writes,
+				"evictions": self.evictions,
+				"used_bytes": used,
+				"max_bytes": self.max_bytes,
+			}
+
+	def report(self) -> str:
+		"""Formats The Cache Counters For Display
+
+		Returns:
+			str: A Human Readable Hit Rate Report
+		"""
+		s = self.stats()
+		mb = 1024 * 1024
+		lookups = s["hits"] + s["misses"]
+		return (
+			f"Hits: {s['hits']} / {lookups} ({s['hit_rate'] * 100:.0f}%)\n"
+			f"Written: {s['writes']}, Evicted: {s['evictions']}\n"
+			f"Size: {s['used_bytes'] / mb:.1f} MB / {s['max_bytes'] / mb:.0f} MB"
+		)
@@ -0,0 +1,401 @@
+import atexit
+import multiprocessing
+import os
+import struct
+import time
+import traceback
+from collections import deque
+from multiprocessing import shared_memory
+from threading import RLock, Thread
+
+import numpy as np
+
+# Control Words At The Start Of The Segment
+HEAD, TAIL, HEARTBEAT, PONG_SEQ, PONG_LAG, TICK_MS, PENDING_LOADS = range(7)
+_CTRL_WORDS = 8
+
+# Commands
+LOAD, PLAY, STOP, FREE, PING, QUIT, PRIORITY = range(1, 8)
+
+_RECORD = struct.Struct("<iiddi")		# Op, Slot, Value, Sent perf_counter, Text Length
+RECORD_SIZE = 1024
+TEXT_SIZE = RECORD_SIZE - _RECORD.size
+
+
+def _segment_size(capacity: int, ring_slots: int) -> int:
+	return _CTRL_WORDS * 8 + capacity * 5 + ring_slots * RECORD_SIZE
+
+def _views(buf, capacity: int, ring_slots: int):
+	"""Splits The Segment Into Control Words, The Gain And Loading Arrays And The Command Records"""
+	ctrl = np.ndarray((_CTRL_WORDS,), np.float64, buf, 0)
+	gains = np.ndarray((capacity,), np.float32, buf, _CTRL_WORDS * 8)
+	loading = np.ndarray((capacity,), np.uint8, buf, _CTRL_WORDS * 8 + capacity * 4)
+	records = buf[_CTRL_WORDS * 8 + capacity * 5:]
+	return ctrl, gains, loading, records
+
+
+def _serve(name: str, capacity: int, ring_slots: int, tick: float):
+	"""Engine Process Main Loop, Runs Commands From The Ring And Applies Changed Gains Every Tick"""
+	os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+	shm = shared_memory.SharedMemory(name=name)					# Shares The Main Process' Resource Tracker
+	ctrl, gains, loading, records = _views(shm.buf, capacity, ring_slots)
+	parent = multiprocessing.parent_process()
+
+	import audio_engine
+	audio_engine.init_audio(local=True)
+
+	nodes = {}								# Slot -> AudioNode
+	wants_play = set()						# Slots Told To Play That Haven't Started, Usually Still Decoding
+	watched = set()							# Slots Flagged As Loading, Cleared Once Their Sound Is Ready
+	applied = np.zeros(capacity, np.float32)
+	last = time.perf_counter()
+	ticks = 0
+	while True:
+		ticks += 1
+		if ticks % 200 == 0 and not parent.is_alive():			# Not A Daemon, So Leave With The App
+			audio_engine.decode_pool.shutdown()
+			return
+
+		now = time.perf_counter()
+		ctrl[TICK_MS] = (now - last) * 1000
+		ctrl[HEARTBEAT] = now
+		last = now
+
+		priorities = {}
+		tail = int(ctrl[TAIL])
+		while tail < int(ctrl[HEAD]):
+			offset = (tail % ring_slots) * RECORD_SIZE
+			op, slot, value, sent, length = _RECORD.unpack_from(records, offset)
+			text = bytes(records[offset + _RECORD.size:offset + _RECORD.size + length]).decode("utf-8")
+
+			try:
+				if op == LOAD:
+					old = nodes.pop(slot, None)
+					wants_play.discard(slot)
+					if old:
+						old.release()
+					nodes[slot] = audio_engine.AudioNode(text, loops=int(value))
+					applied[slot] = 0
+					loading[slot] = 1
+					watched.add(slot)
+				elif op == PLAY and slot in nodes:
+					nodes[slot].loops = int(value)
+					wants_play.add(slot)
+				elif op == STOP and slot in nodes:
+					wants_play.discard(slot)
+					nodes[slot].stop()
+				elif op == FREE and slot in nodes:
+					wants_play.discard(slot)
+					watched.discard(slot)
+					loading[slot] = 0
+					nodes.pop(slot).release()
+				elif op == PRIORITY and slot in nodes:
+					key = nodes[slot].sound_key
+					priorities[key] = min(value, priorities.get(key, value))
+				elif op == PING:
+					ctrl[PONG_LAG] = time.perf_counter() - sent
+					ctrl[PONG_SEQ] = value
+				elif op == QUIT:
+					audio_engine.decode_pool.shutdown()
+					return
+			except Exception:											# One Bad File Mustn't Take Every Node Down
+				traceback.print_exc()
+
+			tail += 1
+			ctrl[TAIL] = tail
+
+		if priorities:
+			audio_engine.prioritize_loads(priorities)
+		ctrl[PENDING_LOADS] = audio_engine.pending_loads()
+
+		watched |= wants_play									# A Replayed Or Evicted Sound Loads Again
+		for slot in list(watched):
+			if slot not in nodes or not nodes[slot].poll_load():
+				watched.discard(slot)
+				loading[slot] = 0
+			else:
+				loading[slot] = 1
+
+		for slot in list(wants_play):						# play() Is A No Op Until The Sound Has Decoded
+			try:
+				nodes[slot].play()
+			except Exception:
+				traceback.print_exc()
+				wants_play.discard(slot)
+				continue
+			if nodes[slot].is_playing:
+				wants_play.discard(slot)
+				applied[slot] = -1								# Reapply The Gain To The Fresh Voice
+
+		if nodes:
+			slots = np.fromiter(nodes, int, len(nodes))
+			current = gains[slots]
+			active = slots[(current > 0) | (current != applied[slots])]		# Heard Or Just Silenced
+			if len(active):
+				audio_engine.set_gains([nodes[slot] for slot in active], gains[active])
+				applied[active] = gains[active]
+
+		time.sleep(tick)
+
+
+class ProcessBackend:
+	"""Plays Nodes In A Child Process Running Its Own Audio Engine
+
+	Gains Go Through A Shared Array The Child Polls Every Tick, Load, Play And Stop
+	Go Through A Command Ring In The Same Segment. A Watchdog Restarts The Child If
+	It Dies Or Stops Beating And Replays Every Live Node Into It
+	"""
+	name = "process"
+	remote = True
+	TICK = 0.005				# Seconds Between Child Ticks, Bounds Gain Latency
+	FLUSH = 0.02				# Seconds Between Moves From The Overflow Queue Into The Ring
+	HEALTH_EVERY = 25			# Flushes Between Liveness Checks
+	STALL = 3.0					# Seconds Without A Heartbeat Before The Child Counts As Hung
+	STARTUP_GRACE = 20.0		# Importing And Opening The Mixer Can Take A While
+	SHORT_LIFE = 10.0			# A Child Dying Sooner Than This Restarts After A Growing Delay
+	MAX_BACKOFF = 30.0
+	PRIORITY_STEP = 16.0		# World Units A Load's Priority Must Move Before It's Sent Again
+
+	def __init__(self, capacity: int = 8192, ring_slots: int = 512):
+		self.capacity = capacity
+		self.ring_slots = ring_slots
+		self.restarts = 0
+
+		self.shm = shared_memory.SharedMemory(create=True, size=_segment_size(capacity, ring_slots))
+		self.ctrl, self.gains, self.loading, self.records = _views(self.shm.buf, capacity, ring_slots)
+		self.ctrl[:] = 0
+		self.gains[:] = 0
+		self.loading[:] = 0
+
+		self._nodes = {}							# Slot -> AudioNode
+		self._slots = {}							# Sound Key -> Slots, To Forward Load Priorities
+		self._sent_priority = {}					# Slot -> Last Priority Bucket Sent
+		self._free = list(range(capacity - 1, -1, -1))
+		self._lock = RLock()						# One Producer At A Time, Held Over Node Changes And A Whole Restart
+		self._overflow = deque()					# Commands Waiting For Room In The Ring, Oldest First
+		self._process = None
+		self._spawned_at = 0.0
+		self._backoff = 1.0
+		self._ping = 0
+		self._stopped = False
+
+	def launch(self):
+		"""Starts The Engine Process And Its Watchdog"""
+		self._spawn()
+		Thread(target=self._watch, name="AudioEngineWatchdog", daemon=True).start()
+		atexit.register(self.shutdown)
+
+	def _spawn(self):
+		self._spawned_at = time.perf_counter()
+		self.ctrl[HEARTBEAT] = self._spawned_at
+		self._process = multiprocessing.get_context("spawn").Process(
+			target=_serve,
+			args=(self.shm.name, self.capacity, self.ring_slots, self.TICK),
+			name="AudioEngine"				# Not A Daemon, Its Decode Pool Needs Child Processes
+		)
+		self._process.start()
+
+	def _watch(self):
+		checks = 0
+		while not self._stopped:
+			time.sleep(self.FLUSH)
+			if self._stopped:
+				return
+
+			if self._overflow:
+				with self._lock:
+					self._flush()
+			checks += 1
+			if checks % self.HEALTH_EVERY:
+				continue
+
+			now = time.perf_counter()
+			beat = self.ctrl[HEARTBEAT]
+			limit = self.STALL if beat > self._spawned_at else self.STARTUP_GRACE
+			if self._process.is_alive() and now - beat < limit:
+				continue
+
+			if now - self._spawned_at > self.SHORT_LIFE:
+				self._backoff = 1.0
+			else:												# Keeps Dying Young, Don't Spin
+				time.sleep(self._backoff)
+				self._backoff = min(self.MAX_BACKOFF, self._backoff * 2)
+			if not self._stopped:
+				self._restart()
+
+	def _restart(self):
+		with self._lock:
+			if self._process.is_alive():
+				self._process.kill()
+				self._process.join(1.0)
+			self.ctrl[HEAD] = 0
+			self.ctrl[TAIL] = 0
+			self._overflow.clear()							# The Replay Below Covers Everything Queued
+			self._sent_priority.clear()						# Resent As The Canvas Ranks Loads Again
+			self.restarts += 1
+			self._spawn()
+
+			for slot, node in self._nodes.items():				# Gains Survive In The Segment
+				self._push(LOAD, slot, node.loops, node.file_path)
+				self._push(PLAY if node.is_playing else STOP, slot, node.loops)
+
+	def _push(self, op: int, slot: int, value: float = 0.0, text: str = ""):
+		"""Writes One Command Without Blocking, Queueing It Locally While The Ring Is Full
+
+		Queued Commands Go Out In Order Ahead Of Newer Ones, Nothing Is Dropped
+		"""
+		data = text.encode("utf-8")
+		if len(data) > TEXT_SIZE:
+			raise ValueError(f"Path Too Long For The Command Ring: {text}")
+
+		with self._lock:
+			self._overflow.append((op, slot, value, data))
+			self._flush()
+
+	def _flush(self):
+		"""Moves Queued Commands Into The Ring While It Has Room, Call With The Lock Held"""
+		head = int(self.ctrl[HEAD])
+		room = self.ring_slots - (head - int(self.ctrl[TAIL]))
+		while self._overflow and room > 0:
+			op, slot, value, data = self._overflow.popleft()
+			offset = (head % self.ring_slots) * RECORD_SIZE
+			_RECORD.pack_into(self.records, offset, op, slot, value, time.perf_counter(), len(data))
+			self.records[offset + _RECORD.size:offset + _RECORD.size + len(data)] = data
+			head += 1
+			room -= 1
+			self.ctrl[HEAD] = head								# Publish Only Once The Record Is Written
+
+	def open(self, node):
+		"""Gives A Node A Slot And Has The Child Load It"""
+		with self._lock:									# A Restart Can't Replay Between The Slot And Its LOAD
+			if not self._free:
+				raise RuntimeError("The Audio Engine Process Is Out Of Node Slots")
+			node.slot = self._free.pop()
+			self.gains[node.slot] = 0
+			self.loading[node.slot] = 1						# Until The Child Reports Otherwise
+			self._nodes[node.slot] = node
+			self._slots.setdefault(node.sound_key, set()).add(node.slot)
+			self._push(LOAD, node.slot, node.loops, node.file_path)
+
+	def free(self, node):
+		slot = node.slot
+		if slot is None:
+			return
+		with self._lock:									# Or Replay A Slot That Was Just Freed
+			self.gains[slot] = 0
+			self._push(FREE, slot)
+			self._nodes.pop(slot, None)
+			self._slots.get(node.sound_key, set()).discard(slot)
+			self._sent_priority.pop(slot, None)
+			self.loading[slot] = 0
+			self._free.append(slot)
+			node.slot = None
+
+	def start(self, node):
+		self._push(PLAY, node.slot, node.loops)
+
+	def stop(self, node):
+		if node.slot is None:
+			return
+		self.gains[node.slot] = 0
+		self._push(STOP, node.slot)
+
+	def set_volume(self, node, volume: float):
+		if node.slot is not None:
+			self.gains[node.slot] = volume
+
+	def set_gains(self, nodes, gains):
+		slots = [node.slot for node in nodes]
+		if slots:
+			self.gains[slots] = gains
+
+	def hand_off(self, node, sound) -> bool:
+		return False
+
+	def is_loading(self, node) -> bool:
+		return node.slot is not None and bool(self.loading[node.slot])
+
+	def pending_loads(self) -> int:
+		return int(self.ctrl[PENDING_LOADS])
+
+	def prioritize(self, priorities: dict):
+		"""Forwards Load Priorities To The Child, Skipping Ones That Barely Moved
+
+		Args:
+			priorities (dict[str, float]): Sound Key To Priority, Lower Loads Sooner
+		"""
+		with self._lock:
+			for key, priority in priorities.items():
+				bucket = priority if abs(priority) == float("inf") else round(priority / self.PRIORITY_STEP)
+				for slot in self._slots.get(key, ()):
+					if self._sent_priority.get(slot) != bucket:
+						self._sent_priority[slot] = bucket
+						self._push(PRIORITY, slot, priority)
+
+	def lost(self, node):
+		pass
+
+	def measure_latency(self, samples: int = 50) -> dict:
+		"""Times Commands From This Process Until The Engine Process Runs Them
+
+		Blocks For Roughly samples * TICK * 2 Seconds, Call It Off The UI Thread
+
+		Args:
+			samples (int): How Many Pings To Send
+
+		Returns:
+			dict: One Way Command And Round Trip Stats In ms, Plus The Child Tick
+		"""
+		one_way = []
+		round_trip = []
+		for _ in range(samples):
+			self._ping += 1
+			seq = self._ping
+			sent = time.perf_counter()
+			self._push(PING, 0, seq)
+			while self.ctrl[PONG_SEQ] < seq and time.perf_counter() - sent < 1.0:
+				time.sleep(0.0002)
+			if self.ctrl[PONG_SEQ] == seq:
+				round_trip.append((time.perf_counter() - sent) * 1000)
+				one_way.append(float(self.ctrl[PONG_LAG]) * 1000)
+			time.sleep(self.TICK * 1.37)						# Land At Different Points In The Child's Tick
+
+		one_way.sort()
+		return {
+			"command_ms": sum(one_way) / len(one_way) if one_way else 0.0,
+			"command_p95_ms": one_way[int(len(one_way) * 0.95)] if one_way else 0.0,
+			"command_max_ms": one_way[-1] if one_way else 0.0,
+			"round_trip_ms": sum(round_trip) / len(round_trip) if round_trip else 0.0,
+			"tick_ms": float(self.ctrl[TICK_MS]),
+			"samples": len(one_way),
+			"restarts": self.restarts,
+		}
+
+	def stats(self) -> dict:
+		alive = self._process is not None and self._process.is_alive()
+		return {
+			"alive": alive,
+			"pid": self._process.pid if alive else None,
+			"restarts": self.restarts,
+			"nodes": len(self._nodes),
+			"queued_commands": int(self.ctrl[HEAD] - self.ctrl[TAIL]) + len(self._overflow),
+			"heartbeat_age_ms": (time.perf_counter() - float(self.ctrl[HEARTBEAT])) * 1000,
+			"tick_ms": float(self.ctrl[TICK_MS]),
+		}
+
+	def shutdown(self):
+		if self._stopped:
+			return
+		self._stopped = True
+		if self._process is not None and self._process.is_alive():
+			self._push(QUIT, 0)							# Lets It Close Its Decode Pool Cleanly
+			self._process.join(2.0)
+		if self._process is not None and self._process.is_alive():
+			self._process.kill()
+			self._process.join(1.0)
+
+		self.ctrl = self.gains = self.loading = None
+		self.records.release()
+		self.shm.close()
+		self.shm.unlink()
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+from threading import Lock
+
+INDEX_VERSION = 2			# Bumped When Fingerprints Change Meaning, Older Indexes Are Rehashed
+
+
+def fingerprint_file(path: str, chunk_bytes: int = 1024 * 1024) -> str:
+	"""Hashes A File's Whole Content, Read In Chunks
+
+	Args:
+		path (str): The File Path
+		chunk_bytes (int): Bytes Read At A Time
+
+	Returns:
+		str: The Hex Fingerprint
+	"""
+	digest = hashlib.blake2b(digest_size=16)
+	with open(path, "rb") as f:
+		while chunk := f.read(chunk_bytes):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+class FingerprintIndex:
+	"""Maps File Paths To Content Fingerprints, Saved Between Sessions
+
+	Paths Are Resolved And Case Folded So Symlinks And Windows Spellings Of
+	One File Share An Entry. Every Lookup Checks Size And Mtime, So A File
+	Rewritten During A Run Is Rehashed
+	"""
+	def __init__(self, index_file: str):
+		self.index_file = index_file
+
+		self._entries = None		# Resolved Path -> [Mtime Ns, Size, Fingerprint], Read On First Use
+		self._session = {}			# Path As Given -> (Mtime Ns, Size, Fingerprint)
+		self._paths = {}			# Fingerprint -> A Readable Path With That Content
+		self._dirty = False
+		self._lock = Lock()
+
+	def get(self, path: str) -> str | None:
+		"""Gets A File's Fingerprint, Hashing It If The Index Is Stale
+
+		Args:
+			path (str): The File Path
+
+		Returns:
+			str | None: The Fingerprint Or None If The File Can't Be Read
+		"""
+		try:
+			stat = os.stat(path)
+		except OSError:
+			return None
+		with self._lock:
+			seen = self._session.get(path)
+		if seen and seen[0] == stat.st_mtime_ns and seen[1] == stat.st_size:
+			return seen[2]
+
+		resolved = os.path.normcase(os.path.realpath(path))
+
+		with self._lock:
+			entry = self._load().get(resolved)
+		if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+			fingerprint = entry[2]
+		else:
+			try:
+				fingerprint = fingerprint_file(resolved)
+			except OSError:
+				return None
+
+		with self._lock:
+			self._entries[resolved] = [stat.st_mtime_ns, stat.st_size, fingerprint]
+			self._dirty |= entry is None or entry[2] != fingerprint or entry[0] != stat.st_mtime_ns
+			self._session[path] = (stat.st_mtime_ns, stat.st_size, fingerprint)
+			self._paths.setdefault(fingerprint, path)
+		return fingerprint
+
+	def path_for(self, fingerprint: str) -> str | None:
+		"""Gets A Path Seen This Session With The Given Content
+
+		Args:
+			fingerprint (str): The Fingerprint
+
+		Returns:
+			str | None: The Path Or None If None Was Seen
+		"""
+		with self._lock:
+			return self._paths.get(fingerprint)
+
+	def _load(self) -> dict:
+		if self._entries is None:
+			try:
+				with open(self.index_file, "r", encoding="utf-8") as f:
+					saved = json.load(f)
+			except (OSError, ValueError):
+				saved = None
+			if isinstance(saved, dict) and saved.get("version") == INDEX_VERSION:
+				self._entries = saved["entries"]
+			else:
+				self._entries = {}
+		return self._entries
+
+	def save(self):
+		"""Writes The Index If Anything Was Hashed Since The Last Save"""
+		with self._lock:
+			if not self._dirty:
+				return
+			entries = dict(self._entries)
+			self._dirty = False
+
+		os.makedirs(os.path.dirname(self.index_file) or ".", exist_ok=True)
+		temp = f"{self.index_file}.tmp"
+		with open(temp, "w", encoding="utf-8") as f:
+			json.dump({"version": INDEX_VERSION, "entries": entries}, f)
+		os.replace(temp, self.index_file)
@@ -0,0 +1,145 @@
+import time
+from collections import deque
+from threading import Event, Lock, Thread
+
+
+class RateCounter:
+	"""Counts Events Over A Rolling Window"""
+	def __init__(self, window: float = 1.0):
+		self.window = window
+		self.total = 0
+
+		self._events = deque()		# (Time, Count)
+		self._lock = Lock()
+
+	def add(self, count: int = 1):
+		if count <= 0:
+			return
+		now = time.monotonic()
+		with self._lock:
+			self.total += count
+			self._events.append((now, count))
+			self._trim(now)
+
+	def rate(self) -> float:
+		"""Gets Events Per Second Over The Window
+
+		Returns:
+			float: The Rate
+		"""
+		with self._lock:
+			self._trim(time.monotonic())
+			return sum(count for _, count in self._events) / self.window
+
+	def _trim(self, now: float):
+		while self._events and now - self._events[0][0] > self.window:
+			self._events.popleft()
+
+
+class GainSmoother:
+	"""Ramps Channel Volumes Toward Their Targets On Its Own Thread
+
+	Writes Smaller Than Epsilon Are Skipped Unless They Land On The Target. The Thread
+	Sleeps While Every Channel Sits At Its Target, A Target Change Wakes It
+	"""
+	def __init__(self, rate_hz: float, ramp_seconds: float, epsilon: float):
+		self.interval = 1.0 / rate_hz
+		self.ramp_seconds = max(ramp_seconds, 1e-3)
+		self.epsilon = epsilon
+		self.writes = RateCounter()
+		self.requests = RateCounter()
+
+		self._entries = {}		# Owner -> [Channel, Current, Target, Written]
+		self._lock = Lock()
+		self._ramping = Event()	# Set While Any Channel Hasn't Reached Its Target
+
+		self._thread = Thread(target=self._run, daemon=True)
+		self._thread.start()
+
+	def bind(self, owner, channel, current: float = 0.0):
+		"""Starts Smoothing An Owner's Channel
+
+		Args:
+			owner (AudioNode): The Node
+			channel (pygame.mixer.Channel): Its Channel
+			current (float): The Volume The Channel Is At
+		"""
+		with self._lock:
+			self._entries[owner] = [channel, current, current, current]
+
+	def unbind(self, owner):
+		with self._lock:
+			self._entries.pop(owner, None)
+
+	def set_target(self, owner, target: float):
+		"""Sets The Volume An Owner Ramps Toward
+
+		Args:
+			owner (AudioNode): The Node
+			target (float): The Volume To Reach
+		"""
+		with self._lock:
+			entry = self._entries.get(owner)
+			if entry and entry[2] != target:
+				entry[2] = target
+				self.requests.add()
+				self._ramping.set()
+
+	def _tick(self, dt: float) -> bool:
+		"""Steps Every Ramp
+
+		Returns:
+			bool: Whether Any Channel Still Has Further To Go
+		"""
+		step = dt / self.ramp_seconds
+		writes = 0
+		ramping = False
+
+		with self._lock:
+			for entry in self._entries.values():
+				channel, current, target, written = entry
+				if current == target and written == target:
+					continue
+
+				if abs(target - current) <= step:
+					current = target
+				else:
+					current += step if target > current else -step
+				entry[1] = current
+
+				if abs(current - written) >= self.epsilon or current == target:
+					channel.set_volume(current)
+					entry[3] = current
+					writes += 1
+				ramping |= entry[1] != target or entry[3] != target
+
+		self.writes.add(writes)
+		return ramping
+
+	def _run(self):
+		last = time.monotonic()
+		while True:
+			if not self._ramping.is_set():
+				self._ramping.wait()					# Nothing To Ramp, Sleep Until A Target Changes
+				last = time.monotonic()
+			time.sleep(self.interval)
+			now = time.monotonic()
+			self._ramping.clear()						# Before The Tick, A Target Set During It Still Wakes Us
+			if self._tick(now - last):
+				self._ramping.set()
+			last = now
+
+	def stats(self) -> dict:
+		"""Gets Smoothing Counters
+
+		Returns:
+			dict: Smoothed Channels, Volume Writes And Target Changes Per Second
+		"""
+		with self._lock:
+			smoothed = len(self._entries)
+		return {
+			"smoothed": smoothed,
+			"volume_writes_per_sec": self.writes.rate(),
+			"target_changes_per_sec": self.requests.rate(),
+			"volume_writes": self.writes.total,
+		}
@@ -0,0 +1,138 @@
+import heapq
+import itertools
+from concurrent.futures import Future
+from threading import Condition, Thread
+
+
+class LoadQueue:
+	"""Loads Files On Worker Threads In Priority Order, Lowest Value First
+
+	Queued Jobs Can Be Reprioritized Or Cancelled Until A Worker Picks Them Up
+	"""
+	def __init__(self, load, workers: int):
+		self._load = load
+		self._workers = workers
+		self._threads = []
+
+		self._heap = []			# (Priority, Seq, Path), Cancelled Entries Skipped On Pop
+		self._reordered = False	# Priorities Changed Since The Heap Was Built, Rebuilt On The Next Pop
+		self._queued = {}		# Path -> (Priority, Seq, Future)
+		self._running = {}		# Path -> Future
+		self._seq = itertools.count()
+		self._cond = Condition()
+
+	def submit(self, path: str, priority: float) -> Future:
+		"""Queues A Load Or Returns The One Already Queued Or Running
+
+		Args:
+			path (str): The Audio File Path
+			priority (float): Lower Loads Sooner
+
+		Returns:
+			Future: Resolves To The Loaded Sound
+		"""
+		with self._cond:
+			if path in self._running:
+				return self._running[path]
+			if path in self._queued:
+				self._reprioritize(path, priority)
+				return self._queued[path][2]
+
+			future = Future()
+			self._push(path, priority, future)
+			self._start_workers()
+			self._cond.notify()
+			return future
+
+	def reprioritize(self, path: str, priority: float):
+		"""Moves A Queued Load To A New Priority
+
+		Args:
+			path (str): The Audio File Path
+			priority (float): Lower Loads Sooner
+		"""
+		with self._cond:
+			if path in self._queued:
+				self._reprioritize(path, priority)
+
+	def reprioritize_many(self, priorities: dict):
+		"""Moves Many Queued Loads At Once, Paths Not Queued Are Ignored
+
+		Args:
+			priorities (dict[str, float]): Path To Priority, Lower Loads Sooner
+		"""
+		with self._cond:
+			for path, priority in priorities.items():
+				if path in self._queued:
+					self._reprioritize(path, priority)
+
+	def cancel(self, path: str) -> bool:
+		"""Drops A Load That Hasn't Started Yet
+
+		Args:
+			path (str): The Audio File Path
+
+		Returns:
+			bool: Whether The Load Was Cancelled
+		"""
+		with self._cond:
+			job = self._queued.pop(path, None)
+		if job is None:
+			return False
+		job[2].cancel()
+		return True
+
+	def pending(self) -> int:
+		with self._cond:
+			return len(self._queued) + len(self._running)
+
+	def queued_paths(self) -> list[str]:
+		with self._cond:
+			return list(self._queued)
+
+	def _reprioritize(self, path: str, priority: float):
+		current, seq, future = self._queued[path]
+		if priority != current:
+			self._queued[path] = (priority, seq, future)		# Updated In Place, The Heap Never Holds Duplicates
+			self._reordered = True
+
+	def _push(self, path: str, priority: float, future: Future):
+		seq = next(self._seq)
+		self._queued[path] = (priority, seq, future)
+		heapq.heappush(self._heap, (priority, seq, path))
+
+	def _start_workers(self):
+		while len(self._threads) < self._workers:
+			thread = Thread(target=self._work, daemon=True)
+			self._threads.append(thread)
+			thread.start()
+
+	def _next(self) -> tuple[str, Future]:
+		with self._cond:
+			while True:
+				if self._reordered:
+					self._heap = [(priority, seq, path) for path, (priority, seq, _) in self._queued.items()]
+					heapq.heapify(self._heap)
+					self._reordered = False
+				while self._heap:
+					_, seq, path = heapq.heappop(self._heap)
+					job = self._queued.get(path)
+					if job is None or job[1] != seq:
+						continue
+
+					del self._queued[path]
+					self._running[path] = job[2]
+					return path, job[2]
+				self._cond.wait()
+
+	def _work(self):
+		while True:
+			path, future = self._next()
+			if future.set_running_or_notify_cancel():
+				try:
+					future.set_result(self._load(path))
+				except BaseException as e:
+					future.set_exception(e)
+
+			with self._cond:
+				self._running.pop(path, None)
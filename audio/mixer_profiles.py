@@ -0,0 +1,72 @@
+import time
+
+# Name -> (Frequency, Sample Size, Channels, Buffer Frames)
+MIXER_PROFILES = {
+	"low_latency": (48000, -16, 2, 256),
+	"balanced": (44100, -16, 2, 1024),
+	"low_cpu": (22050, -16, 2, 4096),
+}
+DEFAULT_PROFILE = "balanced"
+
+
+def profile_settings(name: str) -> tuple[int, int, int, int]:
+	"""Gets A Profile's Mixer Settings, Falling Back To Balanced
+
+	Args:
+		name (str): The Profile Name
+
+	Returns:
+		tuple[int, int, int, int]: Frequency, Sample Size, Channels And Buffer Frames
+	"""
+	return MIXER_PROFILES.get(name, MIXER_PROFILES[DEFAULT_PROFILE])
+
+
+def measure_mixer(channel, buffer_frames: int, seconds: float = 2.0) -> dict:
+	"""Measures How Often The Mixer Pulls Audio And Whether It Ever Starves
+
+	Silent Blocks One Buffer Long Are Queued Back To Back, Each Time The Queue
+	Slot Empties The Mixer Callback Has Run, A Channel Found Idle Is An Underrun
+
+	Args:
+		channel (pygame.mixer.Channel): A Channel Nothing Else Is Using
+		buffer_frames (int): The Requested Buffer Size
+		seconds (float): How Long To Measure
+
+	Returns:
+		dict: Callback Period Stats In Milliseconds And The Underrun Count
+	"""
+	import pygame
+
+	frequency, size, channels = pygame.mixer.get_init()
+	block = pygame.mixer.Sound(buffer=bytes(buffer_frames * channels * (abs(size) // 8)))
+
+	pulls = []
+	underruns = 0
+	channel.set_volume(0.0)
+	channel.play(block)
+	channel.queue(block)
+
+	end = time.perf_counter() + seconds
+	while time.perf_counter() < end:
+		now = time.perf_counter()
+		if not channel.get_busy():
+			underruns += 1
+			channel.play(block)
+		if channel.get_queue() is None:
+			pulls.append(now)
+			channel.queue(block)
+		time.sleep(0.0005)
+	channel.stop()
+
+	periods = sorted((b - a) * 1000 for a, b in zip(pulls, pulls[1:]))
+	return {
+		"frequency": frequency,
+		"channels": channels,
+		"buffer_frames": buffer_frames,
+		"buffer_ms": buffer_frames / frequency * 1000,
+		"callback_ms": sum(periods) / len(periods) if periods else 0.0,
+		"callback_p95_ms": periods[int(len(periods) * 0.95)] if periods else 0.0,
+		"callback_max_ms": periods[-1] if periods else 0.0,
+		"callbacks": len(periods),
+		"underruns": underruns,
+	}
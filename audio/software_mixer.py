@@ -0,0 +1,345 @@
+import time
+from collections import deque
+from threading import Event, Lock, Thread
+
+import numpy as np
+import pygame
+
+from audio.gain_smoother import RateCounter
+from audio.streaming import StreamPump, float_to_mixer, mixer_dtype, mixer_to_float
+
+
+class SoundVoice:
+	"""Mixer Voice Reading A Decoded Sound From Memory"""
+	def __init__(self, sound, loops: int, channels: int, size: int):
+		self.samples = np.asarray(memoryview(sound)).reshape(-1, channels)
+		self.size = size
+		self.loops_left = loops
+		self.pos = 0
+		self.finished = len(self.samples) == 0
+
+	def render(self, frames: int) -> np.ndarray:
+		parts = []
+		while frames > 0 and not self.finished:
+			part = self.samples[self.pos:self.pos + frames]
+			parts.append(part)
+			self.pos += len(part)
+			frames -= len(part)
+			if self.pos >= len(self.samples):
+				self._wrap()
+
+		if not parts:
+			return np.zeros((0, self.samples.shape[1]), np.float32)
+		return mixer_to_float(np.concatenate(parts) if len(parts) > 1 else parts[0], self.size)
+
+	def advance(self, frames: int):
+		"""Moves The Play Position Without Rendering, For Silent Voices"""
+		while frames > 0 and not self.finished:
+			step = min(frames, len(self.samples) - self.pos)
+			self.pos += step
+			frames -= step
+			if self.pos >= len(self.samples):
+				self._wrap()
+
+	def _wrap(self):
+		if self.loops_left == 0:
+			self.finished = True
+			return
+		if self.loops_left > 0:
+			self.loops_left -= 1
+		self.pos = 0
+
+	def close(self):
+		pass
+
+
+class StreamVoice:
+	"""Mixer Voice Reading A Disk Source, Topped Up By The Stream Pump"""
+	CHUNK_SECONDS = 0.25
+	RING_CHUNKS = 4
+
+	def __init__(self, source, loops: int):
+		self.source = source
+		self.loops_left = loops
+		self.finished = False
+		self.underruns = 0
+
+		self._ring = deque()
+		self._head = None			# Partly Consumed Chunk
+		self._exhausted = False
+		self._lock = Lock()
+
+		self._handoff = None		# Makes The Voice That Takes Over At The Loop Boundary
+		self._after = None
+
+		self.source.rewind()
+		self.service()
+		StreamPump.Get().add(self)
+
+	def hand_off(self, make_voice):
+		"""Continues From Memory Once The Current Pass Ends
+
+		Args:
+			make_voice (Callable[[int], SoundVoice]): Builds The Voice For The Remaining Loops
+		"""
+		with self._lock:
+			self._handoff = make_voice
+
+	def service(self):
+		"""Reads Chunks Ahead Of The Mixer, Called By The Pump"""
+		frames = int(self.source.frequency * self.CHUNK_SECONDS)
+		frame_shape = (-1, self.source.channels)
+
+		while not self._exhausted:
+			with self._lock:
+				if len(self._ring) >= self.RING_CHUNKS:
+					return
+
+			data = self.source.read(frames)
+			if data:
+				samples = np.frombuffer(data, mixer_dtype(self.source.size)).reshape(frame_shape)
+				with self._lock:
+					self._ring.append(mixer_to_float(samples, self.source.size))
+				continue
+
+			with self._lock:
+				if self._handoff is not None:
+					self._after = self._handoff(self.loops_left) if self.loops_left != 0 else None
+					self._exhausted = True
+					break
+
+			if self.loops_left == 0:
+				self._exhausted = True
+				break
+			if self.loops_left > 0:
+				self.loops_left -= 1
+			self.source.rewind()
+
+	def render(self, frames: int) -> np.ndarray:
+		parts = []
+		with self._lock:
+			while frames > 0:
+				if self._head is None or len(self._head) == 0:
+					if not self._ring:
+						break
+					self._head = self._ring.popleft()
+				part = self._head[:frames]
+				self._head = self._head[frames:]
+				parts.append(part)
+				frames -= len(part)
+
+			after = self._after if self._exhausted else None
+
+		if frames > 0 and after is not None:
+			part = after.render(frames)
+			parts.append(part)
+			frames -= len(part)
+			self.finished = after.finished
+		elif frames > 0:
+			if self._exhausted:
+				self.finished = True
+			else:
+				self.underruns += 1
+
+		if not parts:
+			return np.zeros((0, self.source.channels), np.float32)
+		return np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+	def advance(self, frames: int):
+		self.render(frames)
+
+	def close(self):
+		StreamPump.Get().remove(self)
+
+
+class SoftwareMixer:
+	"""Mixes Every Playing Node Into One Output Stream With NumPy
+
+	Rendered Blocks Are Queued On A Single Reserved Mixer Channel, Gains Ramp
+	Per Sample Across Each Block So Volume Changes Never Zipper. With No Voices
+	The Thread Sleeps Instead Of Queueing Silence
+	"""
+	name = "numpy"
+	remote = False
+	RESERVED = 1				# Channels Kept From pygame's Own Allocation, Channel 0 Is The Output
+
+	def __init__(self, mixer_format: tuple[int, int, int], block_frames: int, epsilon: float):
+		self.frequency, self.size, self.channels = mixer_format
+		self.block_frames = block_frames
+		self.epsilon = epsilon
+		self.writes = RateCounter()
+
+		self.blocks = 0
+		self.underruns = 0
+		self.render_seconds = 0.0
+
+		self._voices = {}		# Owner -> Voice
+		self._gains = {}		# Owner -> [Current, Target]
+		self._lock = Lock()
+		self._live = Event()	# Set While Any Voice Exists
+
+		pygame.mixer.set_reserved(self.RESERVED)
+		self.output = pygame.mixer.Channel(0)
+
+		self._thread = Thread(target=self._run, daemon=True)
+		self._thread.start()
+
+	def start(self, node):
+		if node.stream:
+			voice = StreamVoice(node.stream.source, node.loops)
+		else:
+			voice = SoundVoice(node.sound, node.loops, self.channels, self.size)
+
+		with self._lock:
+			old = self._voices.get(node)
+			self._voices[node] = voice
+			self._gains.setdefault(node, [0.0, 0.0])
+			self._live.set()
+		if old:
+			old.close()
+
+	def stop(self, node):
+		with self._lock:
+			voice = self._voices.pop(node, None)
+			self._gains.pop(node, None)
+		if voice:
+			voice.close()
+
+	def set_volume(self, node, volume: float):
+		self.set_gains((node,), (volume,))
+
+	def set_gains(self, nodes, gains):
+		"""Sets The Target Gain Of Many Nodes Under One Lock
+
+		Args:
+			nodes (list[AudioNode]): The Nodes
+			gains (Iterable[float]): Their Target Gains, Already Clamped
+		"""
+		writes = 0
+		with self._lock:
+			for node, gain in zip(nodes, gains):
+				entry = self._gains.get(node)
+				if not entry or entry[1] == gain:
+					continue
+				if abs(gain - entry[1]) < self.epsilon and gain != 0:
+					continue
+				entry[1] = float(gain)
+				writes += 1
+		self.writes.add(writes)
+
+	def lost(self, node):
+		pass
+
+	def hand_off(self, node, sound) -> bool:
+		"""Lets A Previewing Stream Voice Continue From A Decoded Sound
+
+		Args:
+			node (AudioNode): The Node
+			sound (pygame.mixer.Sound): Its Whole File Decoded
+
+		Returns:
+			bool: True If The Switch Waits For The Loop Boundary
+		"""
+		with self._lock:
+			voice = self._voices.get(node)
+		if not isinstance(voice, StreamVoice):
+			return False
+
+		voice.hand_off(lambda loops: SoundVoice(sound, loops, self.channels, self.size))
+		return True
+
+	def render(self) -> np.ndarray:
+		"""Mixes One Block Of Every Voice
+
+		Returns:
+			np.ndarray: Float Frames Of Shape (Block, Channels)
+		"""
+		frames = self.block_frames
+		with self._lock:
+			items = [(owner, voice, *self._gains[owner]) for owner, voice in self._voices.items()]
+			for owner, _, _, target in items:
+				self._gains[owner][0] = target
+
+		blocks = []
+		starts = []
+		ends = []
+		finished = []
+		for owner, voice, current, target in items:
+			if current <= 0 and target <= 0:
+				voice.advance(frames)			# Keep Position, Skip The Maths
+			else:
+				block = voice.render(frames)
+				if len(block) < frames:
+					block = np.concatenate([block, np.zeros((frames - len(block), self.channels), np.float32)])
+				blocks.append(block)
+				starts.append(current)
+				ends.append(target)
+			if voice.finished:
+				finished.append((owner, voice))
+
+		if finished:
+			closed = []
+			with self._lock:
+				for owner, voice in finished:
+					if self._voices.get(owner) is voice:	# Not Replaced By A Restart Meanwhile
+						closed.append(self._voices.pop(owner))
+			for voice in closed:
+				voice.close()
+
+		if not blocks:
+			return np.zeros((frames, self.channels), np.float32)
+
+		starts = np.asarray(starts, np.float32)[:, None]
+		ends = np.asarray(ends, np.float32)[:, None]
+		ramp = np.arange(frames, dtype=np.float32)[None, :] / frames
+		gains = starts + (ends - starts) * ramp							# (Voices, Frames)
+		return np.einsum("vf,vfc->fc", gains, np.stack(blocks))
+
+	def _next_block(self):
+		start = time.perf_counter()
+		data = float_to_mixer(self.render(), self.size)
+		self.render_seconds += time.perf_counter() - start
+		self.blocks += 1
+		return pygame.mixer.Sound(buffer=data)
+
+	def _run(self):
+		interval = self.block_frames / self.frequency / 4
+		started = False
+
+		while True:
+			with self._lock:
+				idle = not self._voices
+				if idle:
+					self._live.clear()							# Under The Lock, So A start() Can't Slip Between
+			if idle:
+				self._live.wait()								# Let The Queued Tail Play Out, Then Stay Quiet
+				started = False									# The Output Draining Isn't An Underrun
+				continue
+
+			if not self.output.get_busy():
+				if started:
+					self.underruns += 1
+				self.output.play(self._next_block())
+				started = True
+			if self.output.get_queue() is None:
+				self.output.queue(self._next_block())
+			time.sleep(interval)
+
+	def stats(self) -> dict:
+		"""Gets Mixer Counters
+
+		Returns:
+			dict: Active Voices, Blocks Rendered, Underruns And Mean Render Time
+		"""
+		with self._lock:
+			active = len(self._voices)
+			audible = sum(1 for current, target in self._gains.values() if max(current, target) > 0)
+		return {
+			"active": active,
+			"audible": audible,
+			"blocks": self.blocks,
+			"underruns": self.underruns,
+			"render_ms": self.render_seconds / self.blocks * 1000 if self.blocks else 0.0,
+			"volume_writes_per_sec": self.writes.rate(),
+			"volume_writes": self.writes.total,
+		}
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from threading import RLock
+
+
+def sound_size(sound) -> int:
+	"""Gets The Raw PCM Size Of A Decoded Sound
+
+	Args:
+		sound (pygame.mixer.Sound): The Decoded Sound
+
+	Returns:
+		int: The Size In Bytes
+	"""
+	return memoryview(sound).nbytes
+
+
+class SoundCache:
+	"""LRU Cache Of Decoded Sounds Bounded By A Byte Budget
+
+	Entries Pinned By A Live AudioNode Are Never Evicted
+	"""
+	def __init__(self, budget_bytes: int):
+		self.budget_bytes = budget_bytes
+		self.used_bytes = 0
+
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+		self._entries = OrderedDict()	# Key -> (Sound, Size), Oldest First
+		self._pins = {}					# Key -> Live Node Count
+		self._lock = RLock()
+
+	def __contains__(self, key) -> bool:
+		with self._lock:
+			return key in self._entries
+
+	def __len__(self) -> int:
+		with self._lock:
+			return len(self._entries)
+
+	def get(self, key):
+		"""Gets A Cached Sound And Marks It As Recently Used
+
+		Args:
+			key (str): The Cache Key
+
+		Returns:
+			pygame.mixer.Sound | None: The Sound Or None On A Miss
+		"""
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				self.misses += 1
+				return None
+
+			self.hits += 1
+			self._entries.move_to_end(key)
+			return entry[0]
+
+	def put(self, key, sound):
+		"""Adds A Sound To The Cache And Evicts Down To The Budget
+
+		Args:
+			key (str): The Cache Key
+			sound (pygame.mixer.Sound): The Decoded Sound
+
+		Returns:
+			pygame.mixer.Sound: The Cached Sound, The Existing One If Already Present
+		"""
+		with self._lock:
+			if key in self._entries:
+				self._entries.move_to_end(key)
+				return self._entries[key][0]
+
+			size = sound_size(sound)
+			self._entries[key] = (sound, size)
+			self.used_bytes += size
+			self._evict()
+			return sound
+
+	def discard(self, key):
+		with self._lock:
+			entry = self._entries.pop(key, None)
+			if entry is not None:
+				self.used_bytes -= entry[1]
+
+	def pin(self, key):
+		"""Stops A Key From Being Evicted While A Node Uses It
+
+		Args:
+			key (str): The Cache Key
+		"""
+		with self._lock:
+			self._pins[key] = self._pins.get(key, 0) + 1
+
+	def unpin(self, key):
+		"""Releases A Pin And Evicts If The Cache Is Over Budget
+
+		Args:
+			key (str): The Cache Key
+		"""
+		with self._lock:
+			count = self._pins.get(key, 0) - 1
+			if count > 0:
+				self._pins[key] = count
+			else:
+				self._pins.pop(key, None)
+			self._evict()
+
+	def has_room(self) -> bool:
+		with self._lock:
+			return self.used_bytes < self.budget_bytes
+
+	def is_pinned(self, key) -> bool:
+		with self._lock:
+			return key in self._pins
+
+	def size_of(self, key) -> int:
+		"""Gets The Bytes A Cached Sound Takes, 0 If It Isn't Cached
+
+		Args:
+			key (str): The Cache Key
+
+		Returns:
+			int: The Size In Bytes
+		"""
+		with self._lock:
+			entry = self._entries.get(key)
+			return entry[1] if entry else 0
+
+	def set_budget(self, budget_bytes: int):
+		with self._lock:
+			self.budget_bytes = budget_bytes
+			self._evict()
+
+	def _evict(self):
+		if self.used_bytes <= self.budget_bytes:
+			return
+
+		for key in list(self._entries):
+			if self.used_bytes <= self.budget_bytes:
+				break
+			if key in self._pins:
+				continue
+
+			_, size = self._entries.pop(key)
+			self.used_bytes -= size
+			self.evictions += 1
+
+	def stats(self) -> dict:
+		"""Gets The Cache Counters
+
+		Returns:
+			dict: Hits, Misses, Evictions, Entry Count And Byte Usage
+		"""
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {
+				"hits": self.hits,
+				"misses": self.misses,
+				"evictions": self.evictions,
+				"hit_rate": self.hits / lookups if lookups else 0.0,
+				"entries": len(self._entries),
+				"pinned": len(self._pins),
+				"used_bytes": self.used_bytes,
+				"budget_bytes": self.budget_bytes,
+			}
@@ -0,0 +1,366 @@
+import os
+import time
+import wave
+from collections import deque
+from threading import Event, Lock, Thread
+
+import numpy as np
+import pygame
+
+STREAMABLE_EXTENSIONS = (".wav",)		# pygame Only Decodes Compressed Formats Whole, They Stream Once Cached As PCM
+
+_SAMPLE_TYPES = {
+	8: np.uint8,
+	-8: np.int8,
+	16: np.uint16,
+	-16: np.int16,
+	32: np.float32,
+	-32: np.float32,		# Pygame Reports Float Output As Signed
+}
+
+def _to_float(data: bytes, width: int, channels: int) -> np.ndarray:
+	"""Converts Interleaved PCM Bytes To Float Frames In -1..1"""
+	if width == 1:
+		samples = (np.frombuffer(data, np.uint8).astype(np.float32) - 128.0) / 128.0
+	elif width == 2:
+		samples = np.frombuffer(data, "<i2").astype(np.float32) / 32768.0
+	elif width == 3:
+		raw = np.frombuffer(data, np.uint8).reshape(-1, 3).astype(np.int32)
+		ints = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+		ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+		samples = ints.astype(np.float32) / 8388608.0
+	else:
+		samples = np.frombuffer(data, "<i4").astype(np.float32) / 2147483648.0
+	return samples.reshape(-1, channels)
+
+def float_to_mixer(frames: np.ndarray, size: int) -> bytes:
+	"""Converts Float Frames To Interleaved PCM Bytes In The Mixer Format"""
+	frames = np.clip(frames, -1.0, 1.0)
+	dtype = _SAMPLE_TYPES[size]
+
+	if abs(size) == 32:
+		return frames.astype(dtype).tobytes()
+
+	bits = abs(size)
+	peak = float(2 ** (bits - 1) - 1)
+	if size > 0:
+		return (frames * peak + peak + 1).astype(dtype).tobytes()
+	return (frames * peak).astype(dtype).tobytes()
+
+def mixer_dtype(size: int):
+	return _SAMPLE_TYPES[size]
+
+def mixer_to_float(samples: np.ndarray, size: int) -> np.ndarray:
+	"""Converts Samples In The Mixer Format To Floats In -1..1"""
+	if abs(size) == 32:
+		return samples.astype(np.float32, copy=False)
+
+	scale = float(2 ** (abs(size) - 1))
+	if size > 0:
+		return (samples.astype(np.float32) - scale) / scale
+	return samples.astype(np.float32) / scale
+
+
+class WaveSource:
+	"""Reads A Wave File In Chunks Converted To The Mixer's Rate And Format"""
+	def __init__(self, path: str, mixer_format: tuple[int, int, int]):
+		self.path = path
+		self.frequency, self.size, self.channels = mixer_format
+
+		self._file = wave.open(path, "rb")
+		self._src_rate = self._file.getframerate()
+		self._src_width = self._file.getsampwidth()
+		self._src_channels = self._file.getnchannels()
+		self._step = self._src_rate / self.frequency
+
+		self._carry = None		# Last Source Frame Of The Previous Chunk
+		self._pos = 0.0			# Fractional Read Position Relative To The Carry
+
+	@property
+	def duration(self) -> float:
+		return self._file.getnframes() / self._src_rate
+
+	def rewind(self):
+		self._file.rewind()
+		self._carry = None
+		self._pos = 0.0
+
+	def close(self):
+		self._file.close()
+
+	def read(self, frames: int) -> bytes:
+		"""Reads Up To A Number Of Output Frames
+
+		Args:
+			frames (int): Output Frames Wanted
+
+		Returns:
+			bytes: PCM In The Mixer Format, Empty At The End Of The File
+		"""
+		src_frames = int(frames * self._step) + 1
+		data = self._file.readframes(src_frames)
+		if not data:
+			return b""
+
+		block = _to_float(data, self._src_width, self._src_channels)
+		block = self._map_channels(block)
+
+		if self._step != 1.0:
+			block = self._resample(block)
+		return float_to_mixer(block, self.size)
+
+	def _map_channels(self, block: np.ndarray) -> np.ndarray:
+		src = block.shape[1]
+		if src == self.channels:
+			return block
+		if src == 1:
+			return np.repeat(block, self.channels, axis=1)
+		if self.channels == 1:
+			return block.mean(axis=1, keepdims=True)
+		if src > self.channels:
+			return block[:, :self.channels]
+		return np.concatenate([block, np.repeat(block[:, -1:], self.channels - src, axis=1)], axis=1)
+
+	def _resample(self, block: np.ndarray) -> np.ndarray:
+		if self._carry is not None:
+			block = np.concatenate([self._carry, block])
+
+		last = len(block) - 1
+		positions = np.arange(self._pos, last + 1e-9, self._step)
+		self._carry = block[-1:]
+		if len(positions) == 0:
+			self._pos -= last
+			return block[:0]
+
+		self._pos = positions[-1] + self._step - last
+
+		left = np.floor(positions).astype(np.int64)
+		right = np.minimum(left + 1, last)
+		frac = (positions - left)[:, None].astype(np.float32)
+		return block[left] * (1.0 - frac) + block[right] * frac
+
+
+class PcmFileSource:
+	"""Reads Cached PCM That Is Already In The Mixer's Rate And Format"""
+	def __init__(self, path: str, mixer_format: tuple[int, int, int]):
+		self.path = path
+		self.frequency, self.size, self.channels = mixer_format
+
+		self._frame_bytes = abs(self.size) // 8 * self.channels
+		self._file = open(path, "rb")
+
+	@property
+	def duration(self) -> float:
+		return os.fstat(self._file.fileno()).st_size / self._frame_bytes / self.frequency
+
+	def rewind(self):
+		self._file.seek(0)
+
+	def close(self):
+		self._file.close()
+
+	def read(self, frames: int) -> bytes:
+		return self._file.read(frames * self._frame_bytes)
+
+
+def open_source(path: str):
+	"""Opens A Chunked Reader For A File If Its Format Supports One
+
+	Args:
+		path (str): The Audio File Path
+
+	Returns:
+		WaveSource | None: The Reader, Or None If The File Has To Be Fully Decoded
+	"""
+	if not path.lower().endswith(STREAMABLE_EXTENSIONS):
+		return None
+
+	try:
+		return WaveSource(path, pygame.mixer.get_init())
+	except (wave.Error, EOFError, OSError):
+		return None
+
+def should_stream(path: str, min_seconds: float, min_bytes: int) -> bool:
+	"""Checks Whether A WAV File Is Long Or Large Enough To Stream From Disk
+
+	Other Formats Are Never Streamed On First Play, Only From Their Cached PCM
+
+	Args:
+		path (str): The Audio File Path
+		min_seconds (float): Duration At Or Above Which To Stream
+		min_bytes (int): File Size At Or Above Which To Stream
+
+	Returns:
+		bool: Whether The File Should Be Streamed
+	"""
+	if not path.lower().endswith(STREAMABLE_EXTENSIONS):
+		return False
+
+	try:
+		if os.path.getsize(path) >= min_bytes:
+			return True
+		with wave.open(path, "rb") as f:
+			return f.getnframes() / f.getframerate() >= min_seconds
+	except (wave.Error, EOFError, OSError):
+		return False
+
+
+class SoundStream:
+	"""Plays A Source On A Channel Through A Small Ring Of Decoded Chunks"""
+	CHUNK_SECONDS = 0.5
+	RING_CHUNKS = 4
+
+	def __init__(self, source):
+		self.source = source
+		self.channel = None
+		self.loops = -1
+
+		self._ring = deque()
+		self._loops_left = 0
+		self._finished = False
+		self._lock = Lock()
+
+		self._handoff = None			# In Memory Copy To Loop From Once The Pass Ends
+		self._handoff_loops = 0
+		self._handoff_active = False
+
+	def hand_off(self, sound):
+		"""Switches To A Fully Decoded Copy At The Next Loop Boundary
+
+		The Current Pass Keeps Streaming, Later Repeats Queue The Sound Instead
+
+		Args:
+			sound (pygame.mixer.Sound): The Whole File Decoded
+		"""
+		with self._lock:
+			self._handoff = sound
+
+	def play(self, channel, loops: int = -1):
+		"""Starts Streaming From The Beginning
+
+		Args:
+			channel (pygame.mixer.Channel): The Channel To Feed
+			loops (int): Extra Repeats, -1 Loops Forever
+		"""
+		with self._lock:
+			self.channel = channel
+			self.loops = loops
+			self._loops_left = loops
+			self._finished = False
+			self._handoff_active = False
+			self._ring.clear()
+			self.source.rewind()
+			self._fill()
+			self._feed()
+		StreamPump.Get().add(self)
+
+	def stop(self):
+		StreamPump.Get().remove(self)
+		with self._lock:
+			if self.channel:
+				self.channel.stop()
+				if self.channel.get_busy():		# Halting Can Start The Queued Chunk
+					self.channel.stop()
+			self._ring.clear()
+			self._finished = True
+			self._handoff_active = False
+
+	def close(self):
+		self.stop()
+		self.source.close()
+
+	def service(self):
+		"""Tops Up The Ring And Queues The Next Chunk, Called By The Pump"""
+		with self._lock:
+			if self._finished and not self._ring and not self._handoff_active:
+				return
+			self._fill()
+			self._feed()
+
+	def _fill(self):
+		frames = int(self.source.frequency * self.CHUNK_SECONDS)
+
+		while len(self._ring) < self.RING_CHUNKS and not self._finished:
+			data = self.source.read(frames)
+			if data:
+				self._ring.append(pygame.mixer.Sound(buffer=data))
+				continue
+
+			if self._handoff is not None:			# Loop Boundary, Repeat From Memory From Here
+				self._finished = True
+				self._handoff_active = self._loops_left != 0
+				self._handoff_loops = self._loops_left
+				break
+
+			if self._loops_left == 0:
+				self._finished = True
+				break
+
+			if self._loops_left > 0:
+				self._loops_left -= 1
+			self.source.rewind()
+
+	def _feed(self):
+		if not self.channel:
+			return
+
+		if self._ring:
+			if not self.channel.get_busy():
+				self.channel.play(self._ring.popleft())
+			if self._ring and self.channel.get_queue() is None:
+				self.channel.queue(self._ring.popleft())
+			return
+
+		if self._handoff_active and self.channel.get_queue() is None:
+			if self.channel.get_busy():
+				self.channel.queue(self._handoff)
+			else:
+				self.channel.play(self._handoff)
+
+			if self._handoff_loops > 0:
+				self._handoff_loops -= 1
+			self._handoff_active = self._handoff_loops != 0
+
+
+class StreamPump:
+	"""Background Thread That Keeps Every Playing Stream Fed, Asleep While There Are None"""
+	_instance = None
+	INTERVAL = 0.05
+
+	def __init__(self):
+		self._streams = set()
+		self._lock = Lock()
+		self._live = Event()		# Set While Any Stream Is Registered
+		self._thread = None
+
+	@classmethod
+	def Get(cls):
+		if cls._instance is None:
+			cls._instance = cls()
+
+		return cls._instance
+
+	def add(self, stream: SoundStream):
+		with self._lock:
+			self._streams.add(stream)
+			self._live.set()
+			if self._thread is None:
+				self._thread = Thread(target=self._run, daemon=True)
+				self._thread.start()
+
+	def remove(self, stream: SoundStream):
+		with self._lock:
+			self._streams.discard(stream)
+
+	def _run(self):
+		while True:
+			with self._lock:
+				streams = list(self._streams)
+				if not streams:
+					self._live.clear()			# Under The Lock, So An add() Can't Slip Between
+			if not streams:
+				self._live.wait()
+				continue
+			for stream in streams:
+				stream.service()
+			time.sleep(self.INTERVAL)
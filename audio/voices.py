@@ -0,0 +1,235 @@
+import time
+from threading import RLock
+
+import pygame
+
+from audio.gain_smoother import GainSmoother
+
+
+class VoiceManager:
+	"""Hands Out Mixer Channels To Nodes Only While They Are Audible
+
+	When Every Channel Is Bound The Pool Grows Up To A Limit, After That
+	The Quietest, Least Important Voice Is Stolen. Looping Voices Are Held
+	Through Longer Silences, A Bed Given Back Starts Over From Its Top
+	"""
+	GROW_BY = 16
+
+	def __init__(self, initial: int, maximum: int, idle_release: float, reserved: int = 0, loop_idle_release: float = None):
+		self.maximum = max(initial, maximum)
+		self.idle_release = idle_release
+		self.loop_idle_release = max(idle_release, loop_idle_release or idle_release)
+		self.reserved = reserved	# Channels Below This Belong To Someone Else, Like The Software Mixer Output
+
+		self.acquires = 0
+		self.steals = 0
+		self.grows = 0
+		self.failures = 0
+		self.peak = 0
+
+		self._bound = {}		# Owner -> [Channel, Volume, Importance, Last Audible Time, Idle Release]
+		self._free = []
+		self._capacity = 0
+		self._lock = RLock()
+
+		self._grow_to(initial)
+
+	def _grow_to(self, count: int):
+		count = min(count, self.maximum)
+		if count <= self._capacity:
+			return False
+
+		pygame.mixer.set_num_channels(self.reserved + count)
+		self._free.extend(pygame.mixer.Channel(self.reserved + i) for i in range(self._capacity, count))
+		self._capacity = count
+		return True
+
+	def acquire(self, owner, volume: float, importance: int = 0, looping: bool = False):
+		"""Binds A Channel To An Owner, Growing Or Stealing If Needed
+
+		Args:
+			owner (AudioNode): The Node Asking For A Voice
+			volume (float): Its Current Volume
+			importance (int): Higher Survives Stealing Longer
+			looping (bool): Loops Forever, Kept Through Silences Up To loop_idle_release
+
+		Returns:
+			pygame.mixer.Channel | None: The Channel, Or None If Every Voice Matters More
+		"""
+		with self._lock:
+			voice = self._bound.get(owner)
+			if voice:
+				return voice[0]
+
+			if not self._free:
+				self._reap()
+			if not self._free and self._grow_to(self._capacity + self.GROW_BY):
+				self.grows += 1
+			if not self._free and not self._steal(volume, importance):
+				self.failures += 1
+				return None
+
+			channel = self._free.pop()
+			idle_release = self.loop_idle_release if looping else self.idle_release
+			self._bound[owner] = [channel, volume, importance, time.monotonic(), idle_release]
+			self.acquires += 1
+			self.peak = max(self.peak, len(self._bound))
+			return channel
+
+	def touch(self, owner, volume: float):
+		"""Records An Owner's Volume For Stealing And Idle Tracking
+
+		Args:
+			owner (AudioNode): The Node Holding A Voice
+			volume (float): Its Current Volume
+
+		Returns:
+			bool: False If The Voice Has Been Silent Long Enough To Give Back
+		"""
+		with self._lock:
+			voice = self._bound.get(owner)
+			if voice is None:
+				return False
+
+			voice[1] = volume
+			now = time.monotonic()
+			if volume > 0:
+				voice[3] = now
+				return True
+			return now - voice[3] < voice[4]
+
+	def release(self, owner):
+		"""Returns An Owner's Channel To The Pool
+
+		Args:
+			owner (AudioNode): The Node Giving Up Its Voice
+		"""
+		with self._lock:
+			voice = self._bound.pop(owner, None)
+			if voice:
+				self._free.append(voice[0])
+
+	def _reap(self):
+		now = time.monotonic()
+		idle = [
+			owner for owner, (_, volume, _, last, idle_release) in self._bound.items()
+			if volume <= 0 and now - last >= idle_release
+		]
+		for owner in idle:
+			owner.on_voice_lost()
+			self.release(owner)
+
+	def _steal(self, volume: float, importance: int) -> bool:
+		if not self._bound:
+			return False
+
+		victim = min(self._bound, key=lambda o: (self._bound[o][2], self._bound[o][1], self._bound[o][4]))	# Silent One Shots Before Beds
+		_, victim_volume, victim_importance, _, _ = self._bound[victim]
+		if (victim_importance, victim_volume) >= (importance, volume):
+			return False
+
+		victim.on_voice_lost()
+		self.release(victim)
+		self.steals += 1
+		return True
+
+	def stats(self) -> dict:
+		"""Gets Voice Usage Counters
+
+		Returns:
+			dict: Active, Audible, Capacity, Peak, Steals, Grows And Failures
+		"""
+		with self._lock:
+			return {
+				"active": len(self._bound),
+				"audible": sum(1 for v in self._bound.values() if v[1] > 0),
+				"capacity": self._capacity,
+				"maximum": self.maximum,
+				"peak": self.peak,
+				"acquires": self.acquires,
+				"steals": self.steals,
+				"grows": self.grows,
+				"failures": self.failures,
+			}
+
+
+class ChannelBackend:
+	"""Plays Each Node On Its Own Mixer Channel Handed Out By A VoiceManager
+
+	Volumes Are Targets, A GainSmoother Ramps The Channels Toward Them
+	"""
+	name = "channels"
+	remote = False
+
+	def __init__(self, voices: VoiceManager, smoother: GainSmoother):
+		self.voices = voices
+		self.smoother = smoother
+
+	def start(self, node):
+		if node.channel:
+			self._start_channel(node)
+
+	def stop(self, node):
+		if not node.channel:
+			return
+		self.smoother.unbind(node)
+		self._stop_channel(node)
+		self.voices.release(node)
+		node.channel = None
+
+	def set_volume(self, node, volume: float):
+		if not node.channel:
+			if volume <= 0 or not node.is_playing:
+				return
+			node.channel = self.voices.acquire(node, volume, node.importance, node.loops < 0)
+			if not node.channel:
+				return
+			self._start_channel(node)
+
+		if not self.voices.touch(node, volume):		# Silent Past The Grace Period, Give The Voice Back
+			self.stop(node)
+			return
+
+		self.smoother.set_target(node, volume)
+
+	def set_gains(self, nodes, gains):
+		for node, gain in zip(nodes, gains):
+			self.set_volume(node, gain)
+
+	def hand_off(self, node, sound) -> bool:
+		"""Lets A Previewing Stream Continue From A Decoded Sound
+
+		Args:
+			node (AudioNode): The Node
+			sound (pygame.mixer.Sound): Its Whole File Decoded
+
+		Returns:
+			bool: True If The Switch Waits For The Loop Boundary
+		"""
+		if not node.channel or not node.stream:
+			return False
+		node.stream.hand_off(sound)
+		return True
+
+	def lost(self, node):
+		if node.channel:
+			self.smoother.unbind(node)
+			self._stop_channel(node)
+			node.channel = None
+
+	def _start_channel(self, node):
+		if node.stream:
+			node.stream.play(node.channel, node.loops)
+		else:
+			node.channel.play(node.sound, loops=node.loops)
+		node.channel.set_volume(0.0)
+		self.smoother.bind(node, node.channel)
+
+	def _stop_channel(self, node):
+		if node.stream:
+			node.stream.stop()
+		else:
+			node.channel.stop()
+
+	def stats(self) -> dict:
+		return {**self.voices.stats(), **self.smoother.stats()}
@@ -1,83 +1,455 @@
-from concurrent.futures import ThreadPoolExecutor
+import atexit
+from concurrent.futures import CancelledError
+from threading import Lock
 
-from os import environ
+from os import environ, path as os_path
 
 from enums import PlayStyle
 from utils.options import OptionsManager
+from utils.profiler import profiled
+from audio.sound_cache import SoundCache
+from audio.disk_cache import PcmDiskCache
+from audio.decode_pool import DecodePool
+from audio.load_queue import LoadQueue
+from audio.fingerprints import FingerprintIndex
+from audio.mixer_profiles import measure_mixer, profile_settings
 environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 
-import pygame
+PCM_CACHE_DIR = "./cache/pcm"
+FINGERPRINT_INDEX = "./cache/fingerprints.json"
 
-pygame.mixer.init()
-pygame.mixer.set_num_channels(32)
+sound_cache = SoundCache(int(OptionsManager.Get("sound_cache_mb")) * 1024 * 1024)
+disk_cache = PcmDiskCache(PCM_CACHE_DIR, int(OptionsManager.Get("disk_cache_mb")) * 1024 * 1024)
+fingerprints = FingerprintIndex(FINGERPRINT_INDEX)
+atexit.register(fingerprints.save)
+_SOUND_FUTURES = {}			# Sound Key -> Future
+_futures_lock = Lock()
+_load_listeners = []
 
-_SOUND_CACHE = {}
-_SOUND_FUTURES = {}
+URGENT_PRIORITY = float("-inf")		# Blocking Loads Jump The Queue
+NODE_PRIORITY = 1e9					# Nodes The Canvas Hasn't Ranked Yet
+PREFETCH_PRIORITY = float("inf")	# Imports Not On The Map
 
-_sound_executor = ThreadPoolExecutor(max_workers=2)
+decode_pool = DecodePool(None)		# Mixer Format Filled In By init_audio
+voices = None
+backend = None
+_init_lock = Lock()
+
+def init_audio(local: bool = False):
+	"""Opens The Mixer And Builds The Playback Backend On First Use
+
+	pygame And NumPy Are Only Imported Here, So Startup Doesn't Pay For Them
+	Until A Sound Is Actually Needed. Decode Workers Never Call This
+
+	Args:
+		local (bool): Play In This Process Even If The Engine Process Is Chosen, Set By That Process
+	"""
+	global voices, backend
+	with _init_lock:
+		if backend is not None:
+			return
+
+		if OptionsManager.Get("audio_backend") == "process" and not local:
+			from audio.engine_process import ProcessBackend
+			backend = ProcessBackend()			# The Child Opens The Mixer, This Side Never Does
+			backend.launch()
+			return
+
+		import pygame
+		from audio.voices import ChannelBackend, VoiceManager
+		from audio.gain_smoother import GainSmoother
+
+		frequency, size, channels, buffer = profile_settings(OptionsManager.Get("mixer_profile"))
+		pygame.mixer.pre_init(frequency, size, channels, buffer)
+		pygame.mixer.init()
+		decode_pool.mixer_format = pygame.mixer.get_init()
+		if not pygame.mixer.get_init():
+			return
+
+		epsilon = float(OptionsManager.Get("gain_epsilon"))
+		mixer = None
+		if OptionsManager.Get("audio_backend") == "numpy":
+			from audio.software_mixer import SoftwareMixer
+			mixer = SoftwareMixer(pygame.mixer.get_init(), int(OptionsManager.Get("software_mixer_block")), epsilon)
+
+		voices = VoiceManager(
+			32,
+			int(OptionsManager.Get("max_voices")),
+			float(OptionsManager.Get("voice_idle_release_s")),
+			reserved=mixer.RESERVED if mixer else 0,		# Never Hand Out The Mixer's Output Channel
+			loop_idle_release=float(OptionsManager.Get("voice_loop_idle_release_s")),
+		)
+
+		if mixer:
+			backend = mixer
+		else:
+			smoother = GainSmoother(200, float(OptionsManager.Get("gain_ramp_ms")) / 1000, epsilon)
+			backend = ChannelBackend(voices, smoother)
+
+class _LatencyProbe:
+	"""Holds A Voice While The Mixer Is Measured"""
+	def __init__(self):
+		self.lost = False
+
+	def on_voice_lost(self):
+		self.lost = True
+
+def measure_latency(seconds=2.0) -> dict:
+	"""Measures The Current Mixer Profile On A Borrowed Voice
+
+	Blocks For The Measurement, Call It Off The UI Thread
+
+	Args:
+		seconds (float): How Long To Measure
+
+	Returns:
+		dict: Profile Name, Callback Period Stats And Underruns
+	"""
+	init_audio()
+	profile = OptionsManager.Get("mixer_profile")
+	if backend.remote:
+		return {"profile": profile, **backend.measure_latency()}
+	probe = _LatencyProbe()
+	channel = voices.acquire(probe, 1.0, importance=1 << 30)
+	if channel is None:
+		return {"profile": profile}
+
+	try:
+		result = measure_mixer(channel, profile_settings(profile)[3], seconds)
+	finally:
+		voices.release(probe)
+	return {"profile": profile, **result}
+
+@profiled("set_gains")
+def set_gains(nodes, gains):
+	"""Sets The Volume Of Many Nodes In One Call To The Backend
+
+	Args:
+		nodes (list[AudioNode]): The Nodes
+		gains (Iterable[float]): Their Volumes
+	"""
+	if backend is None:						# No Node Has Been Made Yet, Nothing Is Playing
+		return
+	for node in nodes:
+		if node.progressive:
+			node.poll_full_sound()
+	backend.set_gains(nodes, [max(0.0, min(1.0, float(g))) for g in gains])
+
+def sound_key(path) -> str:
+	"""Gets The Key A File's Decoded Sound Is Shared Under
+
+	Files With The Same Content Share A Key, Unreadable Ones Fall Back To The Path
+
+	Args:
+		path (str): The Audio File Path
+
+	Returns:
+		str: The Sound Key
+	"""
+	return fingerprints.get(path) or path
+
+def _decode_key(key):
+	return _decode(fingerprints.path_for(key) or key)
+
+@profiled("decode")
+def _decode(path):
+	import pygame
+
+	init_audio()
+	sound = disk_cache.load(path)
+	if sound is None:
+		sound = decode_pool.decode(path, pygame.mixer.Sound)
+		disk_cache.store(path, sound)
+	return sound
+
+_load_queue = LoadQueue(_decode_key, decode_pool.workers)	# Threads Wait On The Worker Processes
 
 def _load_sound_sync(path):
-	if path in _SOUND_CACHE:
-		return _SOUND_CACHE[path]
-	sound = pygame.mixer.Sound(path)
-	_SOUND_CACHE[path] = sound
-	return _SOUND_CACHE[path]
-
-def load_sound_async(path):
-	if path in _SOUND_CACHE:
-		return _SOUND_CACHE[path]
-
-	if path in _SOUND_FUTURES:
-		future = _SOUND_FUTURES[path]
-		if future.done():
-			_SOUND_CACHE[path] = future.result()
-			del _SOUND_FUTURES[path]
-			return _SOUND_CACHE[path]
-		return None
+	key = sound_key(path)
+	with _futures_lock:
+		future = _SOUND_FUTURES.pop(key, None)
+	if future is not None:
+		_load_queue.reprioritize(key, URGENT_PRIORITY)
+		try:
+			return sound_cache.put(key, future.result())
+		except CancelledError:
+			pass
+
+	sound = sound_cache.get(key)
+	if sound is None:
+		sound = sound_cache.put(key, _decode(path))
+	return sound
+
+def load_sound_async(path, priority=NODE_PRIORITY):
+	key = sound_key(path)
+	with _futures_lock:
+		future = _SOUND_FUTURES.get(key)
+		if future is not None:
+			if not future.done():
+				return None
+			del _SOUND_FUTURES[key]
 
-	future = _sound_executor.submit(_load_sound_sync, path)
-	_SOUND_FUTURES[path] = future
+	if future is not None and not future.cancelled():
+		return sound_cache.put(key, future.result())
+
+	sound = sound_cache.get(key)
+	if sound is not None:
+		return sound
+
+	with _futures_lock:
+		if key not in _SOUND_FUTURES:
+			_SOUND_FUTURES[key] = future = _load_queue.submit(key, priority)
+			future.add_done_callback(_notify_loaded)
 	return None
 
+def add_load_listener(callback):
+	"""Calls Back Whenever A Queued Load Finishes
+
+	Args:
+		callback (Callable[[], None]): Run On The Loader Thread
+	"""
+	_load_listeners.append(callback)
+
+def _notify_loaded(future):
+	for callback in _load_listeners:
+		callback()
+
+def prioritize_loads(priorities):
+	"""Reorders Queued Loads, Lower Priorities Load Sooner
+
+	Args:
+		priorities (dict[str, float]): Sound Key To Priority
+	"""
+	if backend is not None and backend.remote:			# Loads Queue In The Engine Process
+		backend.prioritize(priorities)
+		return
+	_load_queue.reprioritize_many(priorities)
+
+def pending_loads() -> int:
+	if backend is not None and backend.remote:
+		return backend.pending_loads()
+	return _load_queue.pending()
+
+def audio_stats() -> dict:
+	"""Gets The Sound Cache, Load Queue And Decode Counters
+
+	Returns:
+		dict: Cache Stats, Pending Load Count And Decode Summary
+	"""
+	return {
+		"cache": sound_cache.stats(),
+		"pending_loads": pending_loads(),
+		"decodes": decode_pool.timings.summary(),
+	}
+
+def _cancel_load(key):
+	if _load_queue.cancel(key):
+		with _futures_lock:
+			_SOUND_FUTURES.pop(key, None)
+
+def duplicate_savings(paths) -> tuple[int, int]:
+	"""Counts Files Sharing A Decoded Sound With An Earlier One
+
+	Args:
+		paths (Iterable[str]): The Loaded File Paths
+
+	Returns:
+		tuple[int, int]: Duplicate Files And Decoded Bytes Not Stored Again
+	"""
+	seen = set()
+	duplicates = 0
+	saved = 0
+	for path in paths:
+		key = sound_key(path)
+		if key not in seen:
+			seen.add(key)
+			continue
+		duplicates += 1
+		saved += sound_cache.size_of(key)
+	return duplicates, saved
+
+def _stream_limits():
+	min_seconds = float(OptionsManager.Get("stream_min_seconds"))
+	min_bytes = int(OptionsManager.Get("stream_min_mb")) * 1024 * 1024
+	return min_seconds, min_bytes
+
+def _cached_is_long(entry, path):
+	import pygame
+
+	frequency, size, channels = pygame.mixer.get_init()
+	min_seconds, min_bytes = _stream_limits()
+	seconds = os_path.getsize(entry) / (abs(size) // 8 * channels) / frequency
+	return seconds >= min_seconds or os_path.getsize(path) >= min_bytes
+
+def _should_stream(path):
+	from audio.streaming import should_stream
+
+	entry = disk_cache.entry_path(path)
+	if entry:
+		return _cached_is_long(entry, path)
+	return should_stream(path, *_stream_limits())
+
+def _open_chunked(path):
+	import pygame
+	from audio.streaming import PcmFileSource, SoundStream, open_source
+
+	entry = disk_cache.entry_path(path)				# Decoded Once Before, Stream The Cached PCM
+	if entry:
+		source = PcmFileSource(entry, pygame.mixer.get_init())
+	else:
+		source = open_source(path)
+	return SoundStream(source) if source else None
+
+def _open_stream(path):
+	if not _should_stream(path):
+		return None
+	return _open_chunked(path)
+
+def prefetch_sound(path):
+	"""Starts Decoding A Sound Ahead Of Use If The Cache Has Room For It
+
+	Args:
+		path (str): The Audio File Path
+	"""
+	init_audio()
+	if backend.remote:						# The Engine Process Decodes For Itself
+		return
+	if sound_cache.has_room() and not _should_stream(path):
+		load_sound_async(path, PREFETCH_PRIORITY)
+
 class AudioNode:
 	def __init__(self, file_path, loop_behaviour = PlayStyle.LOOP_FOREVER, loops = -1, is_file_load=False):
+		init_audio()
+
 		self.file_path = file_path
+		self.sound_key = sound_key(file_path)	# Shared With Every File Of The Same Content
 		self.enabled = True
 
 		self.playstyle = loop_behaviour
 		self.loops = loops
+		self.importance = 0
 
 		self.sound = None
-		self.channel = pygame.mixer.find_channel(True)
+		self.stream = None
+		self.channel = None						# Bound By The Voice Manager Only While Audible
+		self.slot = None						# Gain Slot In The Engine Process, If Audio Runs There
 		self.is_playing = False
 
+		self.progressive = False				# Playing A Disk Preview While The Full Decode Runs
+		self._handed_off = False
+
+		if backend.remote:						# Loading And Playback Happen In The Engine Process
+			backend.open(self)
+			self.play()
+			return
+
+		self.stream = _open_stream(file_path)	# Long WAVs, Or Long Files Decoded Before, Play From Disk
+		if not self.stream:
+			sound_cache.pin(self.sound_key)		# Keep Decoded Audio While The Node Lives
+
 		self.update(is_file_load)
 
 	def update(self, is_file_load=False):
-		if is_file_load:
+		if self.stream:
+			pass
+		elif is_file_load:
 			self.sound = _load_sound_sync(self.file_path)
 		else:
 			self.sound = load_sound_async(self.file_path)
+			if self.sound is None:
+				self._start_preview()
 
 		self.play()
 
+	def _start_preview(self):
+		stream = _open_chunked(self.file_path)
+		if stream:
+			self.stream = stream
+			self.progressive = True
+
+	def poll_full_sound(self):
+		"""Swaps A Preview Over To The Decoded Sound Once It Is Ready
+
+		A Playing Preview Keeps Going Until Its Pass Ends, Repeats Come From Memory
+		"""
+		if not self.progressive or self._handed_off:
+			return
+
+		sound = load_sound_async(self.file_path)
+		if sound is None:
+			return
+
+		self.sound = sound
+		if self.is_playing and backend.hand_off(self, sound):
+			self._handed_off = True
+		else:
+			self._end_preview()
+
+	def _end_preview(self):
+		self.stream.close()
+		self.stream = None
+		self.progressive = False
+		self._handed_off = False
+
 	def play(self):
-		if not self.sound or not self.channel:
+		if backend.remote:
+			if not self.is_playing:
+				self.is_playing = True
+				backend.start(self)
+			return
+		if not self.stream and not self.sound:
+			self.sound = load_sound_async(self.file_path)
+		if not self.stream and not self.sound:
 			return
 		if self.is_playing:
 			return
-		
-		self.channel.play(self.sound, loops=self.loops)
-		self.channel.set_volume(0.0)
+
 		self.is_playing = True
+		backend.start(self)
 
 	def stop(self):
-		if not self.channel:
-			return
-		self.channel.stop()
 		self.is_playing = False
+		backend.stop(self)
+		if self._handed_off:
+			self._end_preview()
 
 	def set_volume(self, volume):
-		if self.channel:
-			vol = max(0.0, min(1.0, volume))
-			self.channel.set_volume(vol)
\ No newline at end of file
+		backend.set_volume(self, max(0.0, min(1.0, volume)))
+
+	def on_voice_lost(self):
+		"""Called By The Voice Manager When This Node's Channel Is Taken Away"""
+		backend.lost(self)
+		if self._handed_off:
+			self._end_preview()
+
+	def is_loading(self) -> bool:
+		if backend.remote:
+			return backend.is_loading(self)
+		return self.sound is None and (self.stream is None or self.progressive)
+
+	def poll_load(self) -> bool:
+		"""Picks Up A Finished Load Without Starting Playback
+
+		Returns:
+			bool: Whether The Sound Is Still Loading
+		"""
+		if not backend.remote and not self.stream and not self.sound:
+			self.sound = load_sound_async(self.file_path)
+		return self.is_loading()
+
+	def release(self):
+		"""Stops The Node And Lets Its Sound Be Evicted From The Cache"""
+		self.stop()
+		if backend.remote:
+			backend.free(self)
+			return
+		self.sound = None
+		if self.progressive:
+			self._end_preview()
+		elif self.stream:
+			self.stream.close()
+			return
+
+		sound_cache.unpin(self.sound_key)
+		if not sound_cache.is_pinned(self.sound_key):
+			_cancel_load(self.sound_key)			# No Other Node Is Waiting On It
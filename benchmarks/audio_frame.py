@@ -0,0 +1,122 @@
+"""Times MapCanvas.update_audio As The Node Count Grows
+
+Run From The Repo Root, No Display Needed: python -m benchmarks.audio_frame
+
+Nodes Are Spread At A Fixed Density So About The Same Number Are In Earshot
+At Every Size. Each Stand In Shares One Short Silent Sound, So The Frame Pays
+For Real Voice And Gain Work On The Channel Backend Without Decoding Files.
+Gains Are Set From The Frame Itself, Not The Audio Control Thread, So They Are
+Part Of What's Timed. With The Spatial Index The Per Frame Cost Should Stay Flat
+"""
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")		# Timings Shouldn't Depend On A Sound Card
+
+import pygame
+
+import audio_engine
+from utils.theme import ThemeManager
+from map.map_canvas import MapCanvas, MapNode
+from enums import PlayStyle
+from benchmarks.headless import headless_root
+
+SIZES = (100, 1000, 10000)
+FRAMES = 300
+DENSITY = 1 / (150 * 150)		# Nodes Per Square World Unit
+ORBIT = 300					# Cursor Circle Radius, Kept Inside The 1280x800 View
+
+
+class BenchAudio:
+	"""Stands In For An AudioNode Without Touching The Mixer"""
+	def __init__(self, index: int, sound):
+		self.file_path = f"bench/{index}.wav"
+		self.sound_key = self.file_path
+		self.enabled = True
+		self.playstyle = PlayStyle.CURSOR_ENTER if index % 2 else PlayStyle.LOOP_FOREVER
+		self.loops = -1
+		self.importance = 0
+		self.sound = sound
+		self.stream = None
+		self.channel = None
+		self.is_playing = False
+		self.progressive = False
+
+	def play(self):
+		if not self.is_playing:
+			self.is_playing = True
+			audio_engine.backend.start(self)
+
+	def stop(self):
+		self.is_playing = False
+		audio_engine.backend.stop(self)
+
+	def on_voice_lost(self):
+		audio_engine.backend.lost(self)
+
+	def is_loading(self) -> bool:
+		return False
+
+	def release(self):
+		self.stop()
+
+
+def run(canvas: MapCanvas, count: int, sound) -> tuple[float, float]:
+	for node in canvas.nodes[:]:
+		canvas.remove_node(node)
+
+	side = math.sqrt(count / DENSITY)
+	rng = random.Random(count)
+	for i in range(count):
+		MapNode(canvas, rng.uniform(0, side), rng.uniform(0, side), BenchAudio(i, sound), radius=rng.uniform(60, 240))
+
+	canvas.offset_x = canvas.winfo_width() / 2 - side / 2				# View The Middle, Where The Cursor Circles
+	canvas.offset_y = canvas.winfo_height() / 2 - side / 2
+	canvas.update_all_positions()
+	canvas.cull_nodes()
+	orbit = min(side / 4, ORBIT)
+
+	times = []
+	for frame in range(FRAMES):
+		angle = frame / FRAMES * math.tau
+		canvas.cursor_x = side / 2 + math.cos(angle) * orbit
+		canvas.cursor_y = side / 2 + math.sin(angle) * orbit
+		cx, cy = canvas.get_cursor_center()
+		canvas.coords(canvas.cursor, cx - 6, cy - 6, cx + 6, cy + 6)
+
+		start = time.perf_counter()
+		canvas.update_audio()
+		times.append(time.perf_counter() - start)
+
+	times.sort()
+	return sum(times) / len(times) * 1000, times[int(len(times) * 0.95)] * 1000
+
+
+def main():
+	ThemeManager.Get()
+	audio_engine.init_audio(local=True)
+	if audio_engine.backend is None:
+		sys.exit("The Mixer Failed To Start")
+	frequency, size, channels = pygame.mixer.get_init()
+	sound = pygame.mixer.Sound(buffer=bytes(frequency // 10 * abs(size) // 8 * channels))
+
+	root = headless_root()
+	canvas = MapCanvas(root)
+	if canvas.audio_control:
+		canvas.audio_control.stop()
+		canvas.audio_control = None									# Time The Gains With The Frame
+
+	print(f"Backend: {audio_engine.backend.name}")
+	print(f"{'Nodes':>8}  {'Mean ms':>8}  {'P95 ms':>8}")
+	for count in SIZES:
+		mean, p95 = run(canvas, count, sound)
+		print(f"{count:>8}  {mean:8.3f}  {p95:8.3f}")
+		sys.stdout.flush()
+	pygame.mixer.quit()
+
+
+if __name__ == "__main__":
+	main()
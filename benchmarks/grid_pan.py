@@ -0,0 +1,84 @@
+"""Times Grid Redraws While Panning, Recreated Lines Against The Line Pool
+
+Run From The Repo Root, No Display Needed: python -m benchmarks.grid_pan
+
+The Canvas Is Headless, So Frame Times Cover The Python And Tcl Side Of Each
+Redraw But Not Tk Repainting The Lines
+"""
+import math
+import time
+
+from utils.theme import ThemeManager
+from map.map_canvas import MapCanvas
+from benchmarks.headless import headless_root
+
+FRAMES = 600
+PAN_STEP = 3				# Pixels Per Frame, Like A Mouse Drag
+
+
+def draw_grid_recreate(canvas: MapCanvas):
+	"""The Grid Redraw Before Pooling, Deletes And Recreates Every Line"""
+	canvas.delete("grid")
+
+	w = canvas.winfo_width()
+	h = canvas.winfo_height()
+
+	start_x = math.floor((-canvas.offset_x / canvas.scale_factor) / canvas.grid_size) * canvas.grid_size
+	start_y = math.floor((-canvas.offset_y / canvas.scale_factor) / canvas.grid_size) * canvas.grid_size
+	end_x = (w - canvas.offset_x) / canvas.scale_factor
+	end_y = (h - canvas.offset_y) / canvas.scale_factor
+
+	x = start_x
+	while x <= end_x:
+		screen_x = x * canvas.scale_factor + canvas.offset_x
+		canvas.create_line(screen_x, 0, screen_x, h, fill=ThemeManager.Get("Grid_Color"), tags="grid")
+		x += canvas.grid_size
+
+	y = start_y
+	while y <= end_y:
+		screen_y = y * canvas.scale_factor + canvas.offset_y
+		canvas.create_line(0, screen_y, w, screen_y, fill=ThemeManager.Get("Grid_Color"), tags="grid")
+		y += canvas.grid_size
+
+	canvas.tag_lower("grid")
+
+
+def pan(canvas: MapCanvas, redraw) -> tuple[float, int]:
+	canvas.offset_x = canvas.offset_y = 0
+	first_item = canvas.create_line(0, 0, 0, 0)
+	canvas.delete(first_item)
+
+	times = []
+	for frame in range(FRAMES):
+		canvas.offset_x += PAN_STEP
+		canvas.offset_y += PAN_STEP * 0.5
+		start = time.perf_counter()
+		redraw()
+		canvas.update_idletasks()
+		times.append(time.perf_counter() - start)
+
+	last_item = canvas.create_line(0, 0, 0, 0)
+	canvas.delete(last_item)
+	return sum(times) / len(times) * 1000, last_item - first_item - 1
+
+
+def main():
+	ThemeManager.Get()
+	root = headless_root(1280, 800)
+	canvas = MapCanvas(root)
+	if canvas.audio_control:
+		canvas.audio_control.stop()
+
+	recreate_ms, recreate_items = pan(canvas, lambda: draw_grid_recreate(canvas))
+	canvas.delete("grid")
+	canvas._grid_columns = [[], 0]
+	canvas._grid_rows = [[], 0]
+	pooled_ms, pooled_items = pan(canvas, canvas.draw_grid)
+
+	print(f"{'Grid':<10}  {'Frame ms':>9}  {'Items Created':>13}")
+	print(f"{'Recreate':<10}  {recreate_ms:9.3f}  {recreate_items:>13}")
+	print(f"{'Pooled':<10}  {pooled_ms:9.3f}  {pooled_items:>13}")
+
+
+if __name__ == "__main__":
+	main()
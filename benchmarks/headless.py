@@ -0,0 +1,150 @@
+"""Runs MapCanvas Without A Display, For Benchmarks On Headless Machines
+
+Tcl Runs Without Tk And The Widget Commands Tkinter Sends Are Answered By A
+Small Item Store, So Every Canvas Call Still Pays Its Round Trip Through Tcl.
+Only Tk's Own Layout And Drawing Are Left Out
+"""
+import tkinter as tk
+
+
+class FakeCanvas:
+	"""Answers The Canvas Widget Commands MapCanvas Sends"""
+	def __init__(self, root: tk.Tk, width: int, height: int):
+		self.root = root
+		self.width = width
+		self.height = height
+
+		self.items = {}			# Id -> [Coords, Tags, Options]
+		self.tagged = {}		# Tag -> Ids
+		self.next_id = 1
+
+	def __call__(self, command, *args):
+		handler = getattr(self, f"_{command}", None)
+		return handler(*args) if handler else ""
+
+	def _find(self, spec: str) -> list:
+		if spec == "all":
+			return list(self.items)
+		if spec.isdigit():
+			return [int(spec)] if int(spec) in self.items else []
+		return list(self.tagged.get(spec, ()))
+
+	def _split_options(self, args) -> tuple[list, dict]:
+		values = []
+		args = list(args)
+		while args and not (args[0].startswith("-") and not _is_number(args[0])):
+			values.append(args.pop(0))
+		return values, dict(zip(args[::2], args[1::2]))
+
+	def _create(self, kind, *args):
+		coords, options = self._split_options(args)
+		if len(coords) == 1:
+			coords = self.root.tk.splitlist(coords[0])
+		item = self.next_id
+		self.next_id += 1
+		tags = self.root.tk.splitlist(options.pop("-tags", ""))
+		self.items[item] = [[float(c) for c in coords], list(tags), options]
+		for tag in tags:
+			self.tagged.setdefault(tag, set()).add(item)
+		return item
+
+	def _coords(self, spec, *coords):
+		items = self._find(spec)
+		if not items:
+			return ""
+		if not coords:
+			return " ".join(str(c) for c in self.items[items[0]][0])
+		if len(coords) == 1:
+			coords = self.root.tk.splitlist(coords[0])
+		self.items[items[0]][0] = [float(c) for c in coords]
+		return ""
+
+	def _itemconfigure(self, spec, *args):
+		_, options = self._split_options(args)
+		for item in self._find(spec):
+			self.items[item][2].update(options)
+		return ""
+
+	def _itemcget(self, spec, option):
+		items = self._find(spec)
+		return self.items[items[0]][2].get(option, "") if items else ""
+
+	def _move(self, spec, dx, dy):
+		dx, dy = float(dx), float(dy)
+		for item in self._find(spec):
+			coords = self.items[item][0]
+			coords[0::2] = [x + dx for x in coords[0::2]]
+			coords[1::2] = [y + dy for y in coords[1::2]]
+		return ""
+
+	def _scale(self, spec, x0, y0, sx, sy):
+		x0, y0, sx, sy = float(x0), float(y0), float(sx), float(sy)
+		for item in self._find(spec):
+			coords = self.items[item][0]
+			coords[0::2] = [x0 + (x - x0) * sx for x in coords[0::2]]
+			coords[1::2] = [y0 + (y - y0) * sy for y in coords[1::2]]
+		return ""
+
+	def _delete(self, *specs):
+		for spec in specs:
+			for item in self._find(spec):
+				for tag in self.items.pop(item)[1]:
+					self.tagged[tag].discard(item)
+		return ""
+
+	def _gettags(self, spec):
+		items = self._find(spec)
+		return " ".join(self.items[items[0]][1]) if items else ""
+
+	def _type(self, spec):
+		return "oval" if self._find(spec) else ""
+
+
+def _is_number(text: str) -> bool:
+	try:
+		float(text)
+	except ValueError:
+		return False
+	return True
+
+
+def headless_root(width: int = 1280, height: int = 800) -> tk.Tk:
+	"""Makes A Tcl Interpreter That Can Host MapCanvas Without A Display
+
+	Args:
+		width (int): Width Every Canvas Reports
+		height (int): Height Every Canvas Reports
+
+	Returns:
+		tk.Tk: The Root To Pass To MapCanvas
+	"""
+	root = tk.Tk(useTk=False)
+	tk._default_root = root				# Tk Only Sets This When It Loads, Variables Need It
+	canvases = {}
+
+	def canvas(path, *_):
+		canvases[path] = FakeCanvas(root, width, height)
+		root.tk.createcommand(path, canvases[path])
+		return path
+
+	def menu(path, *_):
+		root.tk.createcommand(path, lambda *_: "")
+		return path
+
+	def winfo(query, path="", *_):
+		if query == "width":
+			return canvases[path].width if path in canvases else width
+		if query == "height":
+			return canvases[path].height if path in canvases else height
+		if query == "viewable":
+			return 1
+		if query == "toplevel":
+			return "."
+		return 0
+
+	root.tk.createcommand("canvas", canvas)
+	root.tk.createcommand("menu", menu)
+	root.tk.createcommand("winfo", winfo)
+	for command in ("bind", "focus", "destroy", "wm"):
+		root.tk.createcommand(command, lambda *_: "")
+	return root
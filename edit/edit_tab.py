@@ -1,8 +1,19 @@
 import tkinter as tk
 from tkinter import ttk
 from map.map_canvas import MapNode
+from map.falloff import format_points, parse_points
 from utils.theme import *
+from utils.alerts import AlertManager
 from audio_engine import PlayStyle
+from enums import Falloff
+
+FALLOFF_LABELS = {
+	Falloff.LINEAR: "Linear",
+	Falloff.EQUAL_POWER: "Equal Power",
+	Falloff.LOGARITHMIC: "Logarithmic",
+	Falloff.INVERSE_SQUARE: "Inverse Square",
+	Falloff.CUSTOM: "Custom Spline",
+}
 
 class EditTab(tk.Frame):
 	def __init__(self, parent, map_tab):
@@ -139,8 +150,71 @@ class EditTab(tk.Frame):
 		loops.set(audio.loops)
 		loops.grid(row=1, column=1, sticky="e", padx=6, pady=4)
 
+		ttk.Label(
+			content,
+			text="Falloff",
+			style="Edit.TLabel",
+			background=ThemeManager.Get("BG_Dark")
+		).grid(row=2, column=0, sticky="w", padx=6, pady=4)
+
+		falloff = ttk.Combobox(
+			content,
+			state="readonly",
+			values=list(FALLOFF_LABELS.values()),
+			style="Edit.TCombobox",
+			width=22
+		)
+		falloff.set(FALLOFF_LABELS[node.falloff])
+		falloff.grid(row=2, column=1, padx=6, pady=4, sticky="e")
+
+		points_label = ttk.Label(
+			content,
+			text="Spline (Distance:Gain)",
+			style="Edit.TLabel",
+			background=ThemeManager.Get("BG_Dark")
+		)
+		points_label.grid(row=3, column=0, sticky="w", padx=6, pady=4)
+
+		points = tk.Entry(
+			content,
+			bg=ThemeManager.Get("BG_Panel"),
+			fg=ThemeManager.Get("Text"),
+			insertbackground=ThemeManager.Get("Text"),
+			relief="flat",
+			font=("Segoe UI", 10),
+			width=24
+		)
+		points.insert(0, format_points(node.falloff_points))
+		points.grid(row=3, column=1, sticky="e", padx=6, pady=4)
+
+		def show_points():
+			if node.falloff == Falloff.CUSTOM:
+				points_label.grid()
+				points.grid()
+			else:
+				points_label.grid_remove()
+				points.grid_remove()
+
+		show_points()
+
+		def apply_falloff(event=None):
+			chosen = next(key for key, label in FALLOFF_LABELS.items() if label == falloff.get())
+			try:
+				node.set_falloff(chosen, parse_points(points.get()))
+			except ValueError as e:
+				AlertManager.Get().CreateWarning(f"Invalid Spline Points: {e}")
+				node.set_falloff(chosen)
+			points.delete(0, tk.END)
+			points.insert(0, format_points(node.falloff_points))
+			show_points()
+			content.focus_set()
+
+		falloff.bind("<<ComboboxSelected>>", apply_falloff)
+		points.bind("<FocusOut>", apply_falloff)
+		points.bind("<Return>", apply_falloff)
+
 		def apply_changes(event=None):
-			audio.playstyle = (
+			node.playstyle = (
 				PlayStyle.LOOP_FOREVER
 				if playstyle.get() == "Loop Forever"
 				else PlayStyle.CURSOR_ENTER
@@ -186,7 +260,7 @@ class EditTab(tk.Frame):
 			relief="flat",
 			command=lambda: self.focus_node(node)
 		)
-		focus_button.grid(row=2, column=0, columnspan=2, pady=6)
+		focus_button.grid(row=4, column=0, columnspan=2, pady=6)
 	
 	def focus_node(self, node):
 		main = self.winfo_toplevel()
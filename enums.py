@@ -5,4 +5,11 @@ class PlayStyle:
 class GlideMode:
 	SNAP = "snap"
 	LINEAR = "linear"
-	EASE_OUT = "ease_out"
\ No newline at end of file
+	EASE_OUT = "ease_out"
+
+class Falloff:
+	LINEAR = "linear"
+	EQUAL_POWER = "equal_power"
+	LOGARITHMIC = "logarithmic"
+	INVERSE_SQUARE = "inverse_square"
+	CUSTOM = "custom"
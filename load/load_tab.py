@@ -3,7 +3,7 @@ from tkinter import ttk
 from tkinter import filedialog
 from threading import Thread
 from utils.theme import *
-from audio_engine import load_sound_async
+from audio_engine import duplicate_savings, prefetch_sound, sound_key
 
 
 class LoadTab(tk.Frame):
@@ -70,6 +70,15 @@ class LoadTab(tk.Frame):
 		)
 		self.add_music.pack(side="left", padx=5)
 
+		self.savings_label = tk.Label(
+			self.button_row,
+			text="",
+			bg=ThemeManager.Get("BG_Panel"),
+			fg=ThemeManager.Get("Text"),
+			font=("Segoe UI", 9)
+		)
+		self.savings_label.pack(side="left", padx=5)
+
 		self.canvas.bind("<Enter>", self.bind_mousewheel)
 		self.canvas.bind("<Leave>", self.unbind_mousewheel)
 
@@ -98,7 +107,7 @@ class LoadTab(tk.Frame):
 	def add_file_thread(self, files):
 		for f in files:
 			if f not in self.shared_files:
-				load_sound_async(f)
+				prefetch_sound(f)
 				self.shared_files.append(f)
 		self.refresh_all()
 
@@ -112,13 +121,18 @@ class LoadTab(tk.Frame):
 			widget.destroy()
 
 		# Rebuild File Lists
+		seen = set()
 		for file_path in self.shared_files:
 			row = tk.Frame(self.list_frame, bg=ThemeManager.Get("BG_Dark"))
 			row.pack(fill="x", pady=2)
 
+			key = sound_key(file_path)
+			text = f"{file_path}  (Duplicate)" if key in seen else file_path		# Shares An Earlier File's Audio
+			seen.add(key)
+
 			label = tk.Label(
 				row,
-				text=file_path,
+				text=text,
 				bg=ThemeManager.Get("BG_Dark"),
 				fg=ThemeManager.Get("Text"),
 				anchor="w",
@@ -147,6 +161,16 @@ class LoadTab(tk.Frame):
 			button.bind("<Enter>", on_enter)
 			button.bind("<Leave>", on_leave)
 
+		self.update_savings()
+
+	def update_savings(self):
+		duplicates, saved = duplicate_savings(self.shared_files)
+		if duplicates:
+			text = f"{duplicates} Duplicate File{'s' if duplicates != 1 else ''}, {saved / (1024 * 1024):.1f} MB Shared"
+		else:
+			text = ""
+		self.savings_label.configure(text=text)
+
 	def update_theme(self):
 		self.configure(bg=ThemeManager.Get("BG_Panel"))
 
@@ -159,6 +183,7 @@ class LoadTab(tk.Frame):
 		)
 
 		self.button_row.configure(bg=ThemeManager.Get("BG_Panel"))
+		self.savings_label.configure(bg=ThemeManager.Get("BG_Panel"), fg=ThemeManager.Get("Text"))
 
 		self.canvas.configure(bg=ThemeManager.Get("BG_Dark"))
 
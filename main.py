@@ -1,9 +1,19 @@
+import time
+_START = time.perf_counter()
+
+import sys
 import tkinter as tk
 from tkinter import ttk, filedialog
+from multiprocessing import freeze_support
+from threading import Thread
 from load.load_tab import LoadTab
-from map.map_tab import MapTab
-from edit.edit_tab import EditTab
+import audio_engine
 from utils.theme import *
+from utils.startup_profile import StartupProfile
+from utils.profiler import Profiler
+
+PROFILE = StartupProfile(_START, "--profile-startup" in sys.argv)
+PROFILE.mark("Imports")
 
 class App(tk.Tk):
 	def __init__(self):
@@ -20,11 +30,14 @@ class App(tk.Tk):
 		self.configure(bg=ThemeManager.Get("BG_Dark"))
 
 		self.loaded_files = []
+		PROFILE.mark("Window")
 
 		self._setup_style()
 		self.create_custom_menu()
+		PROFILE.mark("Style And Menus")
 
 		self._setup_tabs()
+		PROFILE.mark("Tabs")
 
 		self.menu_bar.bind("<Button-1>", self.start_move)
 		self.menu_bar.bind("<B1-Motion>", self.do_move)
@@ -145,24 +158,63 @@ class App(tk.Tk):
 
 	def _setup_tabs(self):
 		tabs = ttk.Notebook(self, style="TNotebook")
-		self.map_tab = MapTab(tabs, self.loaded_files)
 		self.load_tab = LoadTab(tabs, self.loaded_files, self.remove_file, self.refresh)
 		
 		self.tabs = tabs
-		self.edit_tab = EditTab(tabs, self.map_tab)
+		self._built_tabs = {}		# Name -> Tab, Built The First Time It's Opened Or Needed
+		self._placeholders = {}		# Name -> Empty Frame Holding Its Place In The Notebook
 
 		tabs.add(self.load_tab, text="Load")
-		tabs.add(self.map_tab, text="Map")
-		tabs.add(self.edit_tab, text="Edit")
+		for name, text in (("map", "Map"), ("edit", "Edit")):
+			placeholder = tk.Frame(tabs, bg=ThemeManager.Get("BG_Panel"))
+			tabs.add(placeholder, text=text)
+			self._placeholders[name] = placeholder
 		tabs.pack(fill="both", expand=True)
 
 		tabs.bind("<<NotebookTabChanged>>", self.on_tab_change)
 
+	@property
+	def map_tab(self):
+		return self._get_tab("map")
+
+	@property
+	def edit_tab(self):
+		return self._get_tab("edit")
+
+	def _get_tab(self, name):
+		tab = self._built_tabs.get(name)
+		if tab is None:
+			tab = self._build_tab(name)
+		return tab
+
+	def _build_tab(self, name):
+		if name == "map":
+			from map.map_tab import MapTab				# Pulls In The Canvas And NumPy
+			tab = MapTab(self.tabs, self.loaded_files)
+		else:
+			from edit.edit_tab import EditTab
+			tab = EditTab(self.tabs, self.map_tab)
+		self._built_tabs[name] = tab
+
+		placeholder = self._placeholders.pop(name)
+		selected = self.tabs.select() == str(placeholder)
+		self.tabs.insert(placeholder, tab, text=self.tabs.tab(placeholder, "text"))
+		if selected:
+			self.tabs.select(tab)						# Before Forgetting, So No Other Tab Gets Selected
+		self.tabs.forget(placeholder)
+		placeholder.destroy()
+		return tab
+
 	def on_tab_change(self, event):
+		selected = self.tabs.select()
+		for name, placeholder in list(self._placeholders.items()):
+			if str(placeholder) == selected:
+				self._get_tab(name)
 		self.refresh()
 
 	def remove_file(self, file_path):
-		self.map_tab.remove_file(file_path)
+		if "map" in self._built_tabs:
+			self.map_tab.remove_file(file_path)
 
 		if file_path in self.loaded_files:
 			self.loaded_files.remove(file_path)
@@ -189,9 +241,9 @@ class App(tk.Tk):
 			self.refresh()
 
 	def refresh(self):
-		self.map_tab.refresh()
 		self.load_tab.refresh()
-		self.edit_tab.refresh()
+		for tab in self._built_tabs.values():
+			tab.refresh()
 
 	def create_custom_menu(self):
 		self.menu_bar = tk.Frame(self, bg=ThemeManager.Get("BG_Panel"), height=30)
@@ -246,6 +298,42 @@ class App(tk.Tk):
 
 		self.view_menu.add_command(label="Theme", command=self.theme_changer)
 		self.view_menu.add_command(label="Reload Themes", command=self.reload_themes)
+		self.view_menu.add_separator()
+		self.view_menu.add_command(label="Audio Cache Report", command=self.audio_cache_report)
+		self.view_menu.add_command(label="Clear Audio Cache", command=self.clear_audio_cache)
+		self.view_menu.add_command(label="Voice Usage", command=self.voice_report)
+
+		self.audio_backend = tk.StringVar(value=OptionsManager.Get("audio_backend"))
+		self.backend_menu = tk.Menu(
+			self.view_menu,
+			tearoff=0,
+			bg=ThemeManager.Get("BG_Dark"),
+			fg=ThemeManager.Get("Text"),
+			activebackground=ThemeManager.Get("Accent"),
+			activeforeground=ThemeManager.Get("BG_Dark"),
+		)
+		self.backend_menu.add_radiobutton(label="Mixer Channels", value="channels", variable=self.audio_backend, command=self.set_audio_backend)
+		self.backend_menu.add_radiobutton(label="NumPy Mixer", value="numpy", variable=self.audio_backend, command=self.set_audio_backend)
+		self.backend_menu.add_radiobutton(label="Engine Process", value="process", variable=self.audio_backend, command=self.set_audio_backend)
+		self.view_menu.add_cascade(label="Audio Backend", menu=self.backend_menu)
+
+		self.mixer_profile = tk.StringVar(value=OptionsManager.Get("mixer_profile"))
+		self.profile_menu = tk.Menu(
+			self.view_menu,
+			tearoff=0,
+			bg=ThemeManager.Get("BG_Dark"),
+			fg=ThemeManager.Get("Text"),
+			activebackground=ThemeManager.Get("Accent"),
+			activeforeground=ThemeManager.Get("BG_Dark"),
+		)
+		self.profile_menu.add_radiobutton(label="Low Latency", value="low_latency", variable=self.mixer_profile, command=self.set_mixer_profile)
+		self.profile_menu.add_radiobutton(label="Balanced", value="balanced", variable=self.mixer_profile, command=self.set_mixer_profile)
+		self.profile_menu.add_radiobutton(label="Low CPU", value="low_cpu", variable=self.mixer_profile, command=self.set_mixer_profile)
+		self.view_menu.add_cascade(label="Mixer Profile", menu=self.profile_menu)
+		self.view_menu.add_command(label="Measure Mixer Latency", command=self.latency_report)
+		self.view_menu.add_separator()
+		self.view_menu.add_command(label="Profiler Overlay (F3)", command=lambda: self.map_tab.canvas.toggle_profiler())
+		self.view_menu.add_command(label="Dump Profiler Trace", command=self.dump_profiler_trace)
 
 		self.view_btn.config(menu=self.view_menu)
 
@@ -276,6 +364,75 @@ class App(tk.Tk):
 		tm.set_theme(tm.current_theme_name)
 		self.apply_theme()
 
+	def audio_cache_report(self):
+		decodes = audio_engine.decode_pool.timings.summary()
+		report = (
+			f"{audio_engine.disk_cache.report()}\n\n"
+			f"Decoded: {decodes['count']} Files In {decodes['total']:.1f}s\n"
+			f"Mean: {decodes['mean']:.2f}s, Slowest: {decodes['max']:.2f}s"
+		)
+		AlertManager.Get().CreateAlert(report)
+
+	def clear_audio_cache(self):
+		freed = audio_engine.disk_cache.clear()
+		AlertManager.Get().CreateAlert(f"Cleared {freed / (1024 * 1024):.1f} MB Of Cached Audio")
+
+	def voice_report(self):
+		audio_engine.init_audio()
+		backend = audio_engine.backend
+		lines = [f"Backend: {backend.name}"]
+		for key, value in backend.stats().items():
+			value = f"{value:.2f}" if isinstance(value, float) else value
+			lines.append(f"{key.replace('_', ' ').title()}: {value}")
+		AlertManager.Get().CreateAlert("\n".join(lines))
+
+	def set_audio_backend(self):
+		OptionsManager.Set("audio_backend", self.audio_backend.get())
+		AlertManager.Get().CreateAlert("The Audio Backend Changes On The Next Launch")
+
+	def set_mixer_profile(self):
+		OptionsManager.Set("mixer_profile", self.mixer_profile.get())
+		AlertManager.Get().CreateAlert("The Mixer Profile Changes On The Next Launch")
+
+	def dump_profiler_trace(self):
+		profiler = Profiler.Get()
+		if not profiler.enabled:
+			AlertManager.Get().CreateAlert("Turn On The Profiler Overlay (F3) To Record A Trace")
+			return
+		AlertManager.Get().CreateAlert(f"Trace Written To {profiler.dump()}")
+
+	def latency_report(self):
+		Thread(target=self._latency_report_thread, daemon=True).start()		# Measuring Takes A Couple Of Seconds
+
+	def _latency_report_thread(self):
+		result = audio_engine.measure_latency()
+		if "command_ms" in result:
+			if not result["samples"]:
+				AlertManager.Get().CreateAlert("The Audio Engine Process Isn't Answering")
+				return
+			report = (
+				f"Profile: {result['profile'].replace('_', ' ').title()}\n"
+				f"Command: {result['command_ms']:.1f} ms Mean, {result['command_p95_ms']:.1f} ms P95, {result['command_max_ms']:.1f} ms Max\n"
+				f"Round Trip: {result['round_trip_ms']:.1f} ms\n"
+				f"Engine Tick: {result['tick_ms']:.1f} ms\n"
+				f"Restarts: {result['restarts']}"
+			)
+			AlertManager.Get().CreateAlert(report)
+			return
+
+		if "callback_ms" not in result:
+			AlertManager.Get().CreateAlert("No Free Voice To Measure With")
+			return
+
+		report = (
+			f"Profile: {result['profile'].replace('_', ' ').title()}\n"
+			f"{result['frequency']} Hz, {result['channels']} Channels, {result['buffer_frames']} Frame Buffer\n"
+			f"Buffer: {result['buffer_ms']:.1f} ms\n"
+			f"Callback: {result['callback_ms']:.1f} ms Mean, {result['callback_p95_ms']:.1f} ms P95, {result['callback_max_ms']:.1f} ms Max\n"
+			f"Underruns: {result['underruns']}"
+		)
+		AlertManager.Get().CreateAlert(report)
+
 	def theme_changer(self):
 		tm = ThemeManager.Get()
 		theme_names = tm.get_theme_names()
@@ -367,12 +524,38 @@ class App(tk.Tk):
 			activebackground=ThemeManager.Get("Accent"),
 			activeforeground=ThemeManager.Get("BG_Dark"),
 		)
+		self.backend_menu.configure(
+			bg=ThemeManager.Get("BG_Dark"),
+			fg=ThemeManager.Get("Text"),
+			activebackground=ThemeManager.Get("Accent"),
+			activeforeground=ThemeManager.Get("BG_Dark"),
+		)
+		self.profile_menu.configure(
+			bg=ThemeManager.Get("BG_Dark"),
+			fg=ThemeManager.Get("Text"),
+			activebackground=ThemeManager.Get("Accent"),
+			activeforeground=ThemeManager.Get("BG_Dark"),
+		)
+
+		for placeholder in self._placeholders.values():
+			placeholder.configure(bg=ThemeManager.Get("BG_Panel"))
 
 		self.load_tab.update_theme()
-		self.map_tab.update_theme()
-		self.edit_tab.update_theme()
+		for tab in self._built_tabs.values():
+			tab.update_theme()
 		self.refresh()
 
+	def report_startup(self):
+		self.update_idletasks()
+		PROFILE.mark("First Frame")
+		print(PROFILE.report())
+
 if __name__ == "__main__":
+	freeze_support()
 	ThemeManager.Get()
-	App().mainloop()
\ No newline at end of file
+	PROFILE.mark("Themes")
+
+	app = App()
+	if PROFILE.enabled:
+		app.after_idle(app.report_startup)
+	app.mainloop()
\ No newline at end of file
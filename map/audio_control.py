@@ -0,0 +1,145 @@
+import time
+import traceback
+from collections import namedtuple
+from threading import Event, Lock, Thread
+
+import numpy as np
+
+from audio_engine import PlayStyle, set_gains
+from map.falloff import FalloffTable
+from map.node_store import playstyle_code
+
+# Immutable Views Of UI State, Replaced Whole So The Audio Thread Never Sees Half An Update
+NodeSnapshot = namedtuple("NodeSnapshot", "audio index x y radius enabled falloff cursor_enter")
+CursorSnapshot = namedtuple("CursorSnapshot", "x y target_x target_y mode")
+
+
+class AudioControl:
+	"""Turns The Cursor Position Into Node Gains On Its Own Thread At A Fixed Rate
+
+	The UI Publishes Snapshots By Swapping A Reference, So Reading Them Takes No Lock
+	And A Blocked Tk Loop Never Stalls The Gains. Between Cursor Snapshots The Glide
+	Is Integrated Here, So A Glide Keeps Sounding Right While The UI Is Frozen. Once
+	Nothing Moves The Thread Sleeps Until The Next Publish
+	"""
+	MAX_DT = 0.25
+
+	def __init__(self, glide, rate_hz: int = 100):
+		self.glide = glide				# (Pos, Target, Mode, dt) -> Pos, Must Not Touch Tk
+		self.interval = 1.0 / max(1, rate_hz)
+		self.lock = Lock()				# Held For Each Step, The UI Takes It To Release Nodes
+		self.nodes = None
+		self.cursor = None
+		self.steps = 0
+
+		self._seen_nodes = None
+		self._seen_cursor = None
+		self._pos = (0.0, 0.0)
+		self._heard = set()				# AudioNodes Audible Last Step
+		self._stop = Event()
+		self._published = Event()		# Set By Either Publish, Wakes An Idle Thread
+		self._thread = None
+
+	def publish_nodes(self, store):
+		"""Snapshots The Node Arrays, Called When Nodes Change Rather Than Every Frame
+
+		Args:
+			store (NodeStore): The Canvas Node Store
+		"""
+		audio = tuple(store.audio)
+		self.nodes = NodeSnapshot(
+			audio=audio,
+			index={node: row for row, node in enumerate(audio)},
+			x=store.x.copy(),
+			y=store.y.copy(),
+			radius=np.maximum(store.radius, 1e-6),
+			enabled=store.enabled.copy(),
+			falloff=store.falloff.copy(),
+			cursor_enter=store.playstyle == playstyle_code(PlayStyle.CURSOR_ENTER),
+		)
+		self._published.set()
+
+	def publish_cursor(self, x: float, y: float, target_x: float, target_y: float, mode: str):
+		"""Snapshots The Cursor In World Space, Only Replacing It When Something Changed"""
+		cursor = CursorSnapshot(float(x), float(y), float(target_x), float(target_y), mode)
+		if cursor != self.cursor:
+			self.cursor = cursor
+			self._published.set()
+
+	def start(self):
+		if self._thread is None:
+			self._thread = Thread(target=self._run, name="AudioControl", daemon=True)
+			self._thread.start()
+
+	def stop(self):
+		self._stop.set()
+		self._published.set()
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+
+	def _run(self):
+		last = time.monotonic()
+		while not self._stop.wait(self.interval):
+			now = time.monotonic()
+			self._published.clear()						# Before The Step, A Publish During It Still Wakes Us
+			try:
+				busy = self.step(min(now - last, self.MAX_DT))
+			except Exception:
+				traceback.print_exc()
+				busy = True
+			last = now
+			if not busy:
+				self._published.wait()					# Idle, Sleep Until The UI Publishes Something
+				last = time.monotonic()
+
+	def step(self, dt: float) -> bool:
+		"""Advances The Cursor And Sets The Gains Of Every Node That Is Or Was Just Heard
+
+		Args:
+			dt (float): Seconds Since The Last Step
+
+		Returns:
+			bool: False When Nothing Changed, Stepping Again Before A Publish Would Do Nothing
+		"""
+		with self.lock:
+			nodes, cursor = self.nodes, self.cursor
+			if nodes is None or cursor is None:
+				return False
+
+			target = (cursor.target_x, cursor.target_y)
+			if cursor is not self._seen_cursor:
+				self._seen_cursor = cursor
+				self._pos = (cursor.x, cursor.y)
+			elif (
+				nodes is self._seen_nodes and self._pos == target
+				and not any(audio.progressive or not audio.is_playing for audio in self._heard)
+			):
+				return False									# Nothing Moved, Gains Already Match And Every Heard Node Started
+			else:
+				self._pos = self.glide(self._pos, target, cursor.mode, dt)
+			self._seen_nodes = nodes
+			self.steps += 1
+
+			wx, wy = self._pos
+			dist = np.hypot(nodes.x - wx, nodes.y - wy)
+			vols = np.where(nodes.enabled, FalloffTable.Get().gains(nodes.falloff, dist, nodes.radius), 0.0)
+			audible = vols > 0
+
+			rows = set(np.flatnonzero(audible).tolist())
+			rows.update(nodes.index[audio] for audio in self._heard if audio in nodes.index)
+			if not rows:
+				self._heard = set()
+				return True										# The Cursor May Still Be Gliding
+			rows = sorted(rows)
+
+			audio_nodes = [nodes.audio[row] for row in rows]
+			for row, audio in zip(rows, audio_nodes):
+				if audible[row] and not audio.is_playing:
+					audio.play()
+				elif not audible[row] and nodes.cursor_enter[row] and nodes.enabled[row] and audio.is_playing:
+					audio.stop()
+
+			set_gains(audio_nodes, vols[rows])
+			self._heard = {audio for row, audio in zip(rows, audio_nodes) if audible[row]}
+			return True
@@ -0,0 +1,105 @@
+import math
+
+
+class ClusterGrid:
+	"""Node Counts And Centroids On A Stack Of Grids, Each Level Twice As Coarse
+
+	A Level Is Built The First Time It's Asked For, From The Finest Cached Level
+	Below It When There Is One, Then Kept Up To Date As Items Move
+	"""
+	def __init__(self, base_cell: float = 64, max_level: int = 10):
+		self.base_cell = base_cell
+		self.max_level = max_level
+
+		self._points = {}		# Item -> (X, Y)
+		self._levels = {}		# Level -> {(Col, Row): [Count, Sum X, Sum Y]}
+
+	def __len__(self) -> int:
+		return len(self._points)
+
+	def cell_size(self, level: int) -> float:
+		return self.base_cell * (1 << level)
+
+	def level_for(self, cell: float) -> int:
+		"""Gets The Finest Level Whose Cells Are At Least A Given Size
+
+		Args:
+			cell (float): Wanted Cell Size In World Units
+
+		Returns:
+			int: The Level
+		"""
+		if cell <= self.base_cell:
+			return 0
+		return min(self.max_level, math.ceil(math.log2(cell / self.base_cell)))
+
+	def insert(self, item, x: float, y: float):
+		"""Adds An Item Or Moves It, Updating Every Cached Level
+
+		Args:
+			item (Hashable): The Item, Usually A MapNode
+			x (float): World X
+			y (float): World Y
+		"""
+		old = self._points.get(item)
+		if old == (x, y):
+			return
+		if old:
+			self._file(*old, -1)
+		self._points[item] = (x, y)
+		self._file(x, y, 1)
+
+	def remove(self, item):
+		old = self._points.pop(item, None)
+		if old:
+			self._file(*old, -1)
+
+	def clear(self):
+		self._points.clear()
+		self._levels.clear()
+
+	def clusters(self, level: int) -> dict:
+		"""Gets The Occupied Cells Of A Level
+
+		Args:
+			level (int): The Level
+
+		Returns:
+			dict: (Col, Row) -> [Count, Sum X, Sum Y], Not To Be Modified
+		"""
+		cells = self._levels.get(level)
+		if cells is None:
+			cells = self._levels[level] = self._build(level)
+		return cells
+
+	def _build(self, level: int) -> dict:
+		cells = {}
+		finer = [cached for cached in self._levels if cached < level]
+		if finer:
+			child = max(finer)
+			shift = level - child
+			for (col, row), (count, sx, sy) in self._levels[child].items():
+				cell = cells.setdefault((col >> shift, row >> shift), [0, 0.0, 0.0])
+				cell[0] += count
+				cell[1] += sx
+				cell[2] += sy
+			return cells
+
+		size = self.cell_size(level)
+		for x, y in self._points.values():
+			cell = cells.setdefault((math.floor(x / size), math.floor(y / size)), [0, 0.0, 0.0])
+			cell[0] += 1
+			cell[1] += x
+			cell[2] += y
+		return cells
+
+	def _file(self, x: float, y: float, sign: int):
+		for level, cells in self._levels.items():
+			size = self.cell_size(level)
+			key = (math.floor(x / size), math.floor(y / size))
+			cell = cells.setdefault(key, [0, 0.0, 0.0])
+			cell[0] += sign
+			cell[1] += x * sign
+			cell[2] += y * sign
+			if cell[0] <= 0:
+				del cells[key]
@@ -0,0 +1,164 @@
+import numpy as np
+
+from enums import Falloff
+
+LUT_SIZE = 1025				# Samples Over Distance / Radius From 0 To 1, Nearest Lookup Is Off By At Most 1/2048
+FALLOFFS = (Falloff.LINEAR, Falloff.EQUAL_POWER, Falloff.LOGARITHMIC, Falloff.INVERSE_SQUARE)		# Index Is The Table Row
+DEFAULT_SPLINE = ((0.0, 1.0), (0.5, 0.7), (1.0, 0.0))
+LOG_RANGE_DB = 60			# Logarithmic Drops This Many dB From Center To Edge
+INVERSE_SQUARE_REF = 0.1	# Distance / Radius Where Inverse Square Has Fallen To Half
+
+
+def _builtin(falloff: str, d: np.ndarray) -> np.ndarray:
+	if falloff == Falloff.LINEAR:
+		return 1 - d
+	if falloff == Falloff.EQUAL_POWER:
+		return np.cos(d * np.pi / 2)
+	if falloff == Falloff.LOGARITHMIC:
+		floor = 10 ** (-LOG_RANGE_DB / 20)
+		return (10 ** (-LOG_RANGE_DB / 20 * d) - floor) / (1 - floor)		# Shifted So The Edge Is Silent
+	if falloff == Falloff.INVERSE_SQUARE:
+		gain = 1 / (1 + (d / INVERSE_SQUARE_REF) ** 2)
+		edge = gain[-1]
+		return (gain - edge) / (1 - edge)
+	raise ValueError(f"Unknown Falloff: {falloff}")
+
+def normalize_points(points) -> tuple:
+	"""Cleans Spline Control Points Into A Hashable Form
+
+	Args:
+		points (Iterable[tuple[float, float]]): (Distance / Radius, Gain) Pairs
+
+	Returns:
+		tuple: Sorted Points Clamped To 0..1, One Per Distance
+	"""
+	cleaned = {}
+	for d, gain in points:
+		cleaned[round(min(1.0, max(0.0, float(d))), 4)] = round(min(1.0, max(0.0, float(gain))), 4)
+	if len(cleaned) < 2:
+		raise ValueError("A Spline Needs At Least Two Points At Different Distances")
+	return tuple(sorted(cleaned.items()))
+
+def spline(points, d: np.ndarray) -> np.ndarray:
+	"""Evaluates A Monotone Cubic Through The Points, So It Never Overshoots Them
+
+	Past The First And Last Point The Curve Holds Their Gain
+
+	Args:
+		points (tuple): Points From normalize_points
+		d (np.ndarray): Distances / Radius To Evaluate At
+
+	Returns:
+		np.ndarray: Gains
+	"""
+	px, py = (np.array(column, float) for column in zip(*points))
+	h = np.diff(px)
+	delta = np.diff(py) / h
+
+	# Fritsch-Carlson Tangents
+	m = np.empty(len(px))
+	m[0], m[-1] = delta[0], delta[-1]
+	m[1:-1] = (delta[:-1] + delta[1:]) / 2
+	m[1:-1][delta[:-1] * delta[1:] <= 0] = 0
+	for k in range(len(delta)):
+		if delta[k] == 0:
+			m[k] = m[k + 1] = 0
+			continue
+		a, b = m[k] / delta[k], m[k + 1] / delta[k]
+		if a * a + b * b > 9:
+			tau = 3 / np.hypot(a, b)
+			m[k], m[k + 1] = tau * a * delta[k], tau * b * delta[k]
+
+	k = np.clip(np.searchsorted(px, d, side="right") - 1, 0, len(h) - 1)
+	t = np.clip((d - px[k]) / h[k], 0, 1)
+	t2, t3 = t * t, t * t * t
+	return (
+		(2 * t3 - 3 * t2 + 1) * py[k] + (t3 - 2 * t2 + t) * h[k] * m[k]
+		+ (-2 * t3 + 3 * t2) * py[k + 1] + (t3 - t2) * h[k] * m[k + 1]
+	)
+
+def parse_points(text: str) -> tuple:
+	"""Reads Spline Points Written As "Distance:Gain" Pairs Split By Commas
+
+	Args:
+		text (str): e.g. "0:1, 0.5:0.7, 1:0"
+
+	Returns:
+		tuple: Points From normalize_points
+	"""
+	points = []
+	for pair in text.replace(";", ",").split(","):
+		if not pair.strip():
+			continue
+		d, _, gain = pair.partition(":")
+		points.append((float(d), float(gain)))
+	return normalize_points(points)
+
+def format_points(points) -> str:
+	return ", ".join(f"{d:g}:{gain:g}" for d, gain in points)
+
+
+class FalloffTable:
+	"""Gain Lookup Tables For Every Falloff Curve In Use, One Row Per Curve
+
+	The Built In Curves Take The First Rows, Each Distinct Custom Spline Gets A Row
+	The First Time It's Used. Rows Are Never Removed, So A Row Number Handed To
+	Another Thread Stays Valid After The Table Grows
+	"""
+	_instance = None
+
+	def __init__(self):
+		if FalloffTable._instance is not None:
+			raise RuntimeError("Use Get()")
+		FalloffTable._instance = self
+
+		d = np.linspace(0, 1, LUT_SIZE)
+		self.lut = np.vstack([_builtin(falloff, d) for falloff in FALLOFFS]).astype(np.float32)
+		self.lut[:, -1] = 0								# Silent At The Edge Whatever The Curve
+		self._custom = {}								# Points -> Row
+
+	@classmethod
+	def Get(cls):
+		if cls._instance is None:
+			cls._instance = cls()
+
+		return cls._instance
+
+	def row(self, falloff: str, points=None) -> int:
+		"""Gets The Table Row Of A Curve, Building It For A New Custom Spline
+
+		Args:
+			falloff (str): A Falloff Value
+			points (Iterable | None): Control Points, Only Used For Falloff.CUSTOM
+
+		Returns:
+			int: The Row To Store For The Node
+		"""
+		if falloff != Falloff.CUSTOM:
+			if falloff not in FALLOFFS:
+				raise ValueError(f"Unknown Falloff: {falloff}")
+			return FALLOFFS.index(falloff)
+
+		points = normalize_points(points or DEFAULT_SPLINE)
+		row = self._custom.get(points)
+		if row is None:
+			curve = spline(points, np.linspace(0, 1, LUT_SIZE)).astype(np.float32)
+			curve[-1] = 0
+			row = self._custom[points] = len(self.lut)
+			self.lut = np.vstack([self.lut, curve])		# Swapped Whole, Readers Keep The Old One Until Done
+		return row
+
+	def gains(self, rows: np.ndarray, dist: np.ndarray, radius: np.ndarray) -> np.ndarray:
+		"""Looks Up Gains For Many Nodes At Once
+
+		Args:
+			rows (np.ndarray): Each Node's Table Row
+			dist (np.ndarray): Cursor Distance To Each Node
+			radius (np.ndarray): Each Node's Radius, Above Zero
+
+		Returns:
+			np.ndarray: Gains, Zero Outside The Radius
+		"""
+		lut = self.lut
+		index = np.minimum(dist / radius, 1.0) * (LUT_SIZE - 1)
+		return lut[rows, (index + 0.5).astype(np.intp)]
@@ -1,39 +1,66 @@
 import tkinter as tk
 import math
+import time
+from threading import Event
 
 import itertools
 _node_itr = itertools.count(1)
 
 import numpy as np
-from audio_engine import AudioNode, PlayStyle
-from enums import GlideMode
+from audio_engine import AudioNode, PlayStyle, add_load_listener, audio_stats, pending_loads, prioritize_loads, set_gains
+from enums import Falloff, GlideMode
+from map.falloff import DEFAULT_SPLINE, FalloffTable
+from map.node_store import NodeStore, playstyle_code
+from map.spatial_index import SpatialGrid
+from map.clusters import ClusterGrid
+from map.audio_control import AudioControl
+from utils.frame_stats import FrameStats
+from utils.profiler import Profiler, profiled
 from utils.theme import *
 
 class MapNode:
-	def __init__(self, canvas, x, y, audio_node, radius=120):
+	"""Canvas Items For One Node, Its Position And Audio State Live In A Row Of The Canvas' NodeStore"""
+	def __init__(self, canvas, x, y, audio_node, radius=120, falloff=Falloff.LINEAR, falloff_points=DEFAULT_SPLINE):
 		self.canvas = canvas
 		self.audio_node = audio_node
-		self.radius = radius
 		self.id = next(_node_itr)
-
-		self.real_x = x
+		self.tag = f"node{self.id}"					# Shared By All Its Items, Hides Or Shows Them In One Call
+
+		self.falloff_points = falloff_points		# Kept While Another Curve Is Picked, Used By Falloff.CUSTOM
+		self._falloff = falloff
+		curve = FalloffTable.Get().row(falloff, falloff_points)
+		self.row = canvas.store.add(self, x, y, radius, audio_node.enabled, audio_node.playstyle, curve)
+		canvas.spatial.insert(self, x, y, radius)
+		canvas.clusters.insert(self, x, y)
+		canvas.nodes_changed()
+		canvas.track_load(self)
 		self.offset_x = 0
-		self.real_y = y
 		self.offset_y = 0
 
+		# Last Drawn State, Canvas Calls Are Skipped When It Hasn't Changed
+		self.shown_bucket = canvas.volume_bucket(0)
+		self.shown_fill = ThemeManager.Get("Text_Ghost")
+		self.shown_link = False
+		self.shown_link_coords = None
+
 		# Create Node Elements
 		self.circle = self.canvas.create_oval(
 			x - radius, y - radius,
 			x + radius, y + radius,
 			outline=ThemeManager.Get("Node_Circle"),
-			width=0.5
+			width=0.5,
+			state="hidden",
+			tags=("world", "scaled", "radius", self.tag)
 		)
 
-		self.node = self.canvas.create_oval(
-			x - 8, y - 8,
-			x + 8, y + 8,
+		# A Round Capped 1px Line, Canvas Scale Leaves Line Widths Alone So The Dot Keeps Its Size
+		self.node = self.canvas.create_line(
+			x, y, x + 1, y,
 			fill=ThemeManager.Get("Node"),
-			outline=""
+			width=MapCanvas.DOT_SIZE,
+			capstyle="round",
+			state="hidden",
+			tags=("world", "dot", self.tag)
 		)
 
 		# Visual Connect To Cursor
@@ -42,7 +69,8 @@ class MapNode:
 			fill=ThemeManager.Get("Link_Line"),
 			width=1.5,
 			dash=(4, 4),
-			state="hidden"
+			state="hidden",
+			tags=("world", "scaled", "link", self.tag)
 		)
 
 		self.canvas.tag_lower(self.link_line, self.node)
@@ -51,11 +79,13 @@ class MapNode:
 		# Debug Info
 		filename = self.audio_node.file_path.split("/")[-1]
 		self.text = self.canvas.create_text(
-			x + 8, y,
-			text=f"#{self.id} {filename}\nVol: 0.00",
+			x + MapCanvas.LABEL_GAP, y,
+			text=self.canvas.get_node_text(self, 0),
 			anchor="w",
-			fill=ThemeManager.Get("Text"),
-			font=("Segoe UI", 9)
+			fill=ThemeManager.Get("Text_Ghost"),
+			font=("Segoe UI", 9),
+			state="hidden",
+			tags=("world", "label", self.tag)
 		)
 
 		# Bind For Interaction
@@ -64,6 +94,74 @@ class MapNode:
 		self.canvas.tag_bind(self.node, "<ButtonRelease-1>", self.on_release)
 		self.canvas.tag_bind(self.node, "<ButtonRelease-3>", self.on_right_click)
 
+		# Items Start Hidden Like The Row, So Showing Goes Through The Canvas And Gets The Detail Tier
+		if canvas.cull_node(self):
+			self.place()
+
+	@property
+	def real_x(self) -> float:
+		return float(self.canvas.store.x[self.row])
+
+	@real_x.setter
+	def real_x(self, value: float):
+		self.canvas.store.x[self.row] = value
+
+	@property
+	def real_y(self) -> float:
+		return float(self.canvas.store.y[self.row])
+
+	@real_y.setter
+	def real_y(self, value: float):
+		self.canvas.store.y[self.row] = value
+
+	@property
+	def radius(self) -> float:
+		return float(self.canvas.store.radius[self.row])
+
+	@radius.setter
+	def radius(self, value: float):
+		self.canvas.store.radius[self.row] = value
+		self.canvas.spatial.insert(self, self.real_x, self.real_y, value)
+		self.canvas.nodes_changed()
+
+	@property
+	def enabled(self) -> bool:
+		return bool(self.canvas.store.enabled[self.row])
+
+	@enabled.setter
+	def enabled(self, value: bool):
+		self.canvas.store.enabled[self.row] = value
+		self.audio_node.enabled = value
+		self.canvas.nodes_changed()
+
+	@property
+	def playstyle(self) -> str:
+		return self.audio_node.playstyle
+
+	@playstyle.setter
+	def playstyle(self, value: str):
+		self.canvas.store.playstyle[self.row] = playstyle_code(value)
+		self.audio_node.playstyle = value
+		self.canvas.nodes_changed()
+
+	@property
+	def falloff(self) -> str:
+		return self._falloff
+
+	def set_falloff(self, falloff: str, points=None):
+		"""Picks How The Node's Gain Falls Off Towards The Edge Of Its Radius
+
+		Args:
+			falloff (str): A Falloff Value
+			points (Iterable | None): Spline Control Points For Falloff.CUSTOM, The Current Ones If None
+		"""
+		points = points or self.falloff_points
+		curve = FalloffTable.Get().row(falloff, points)		# Raises Before Anything Changes On Bad Points
+		self._falloff = falloff
+		self.falloff_points = points
+		self.canvas.store.falloff[self.row] = curve
+		self.canvas.nodes_changed()
+
 	def on_right_click(self, event):				# Context Menu
 		self.canvas.right_clicked_node = self
 		node = self.canvas.right_clicked_node
@@ -92,16 +190,24 @@ class MapNode:
 		self.canvas.dragging_node = False
 		self.canvas.update_all_positions()
 
+	@profiled("move_to")
 	def move_to(self, x, y):						# Set Location
 		self.real_x = x
 		self.real_y = y
-		r = self.radius
-		sx = x * self.canvas.scale_factor + self.canvas.offset_x
-		sy = y * self.canvas.scale_factor + self.canvas.offset_y
-		sr = r * self.canvas.scale_factor
+		self.canvas.spatial.insert(self, x, y, self.radius)
+		self.canvas.clusters.insert(self, x, y)
+		if self.canvas.cull_node(self):
+			self.place()
+		self.canvas.nodes_changed()
+
+	def place(self):								# Put Items At The World Position
+		sf = self.canvas.scale_factor
+		sx = self.real_x * sf + self.canvas.offset_x
+		sy = self.real_y * sf + self.canvas.offset_y
+		sr = self.radius * sf
 		self.canvas.coords(self.circle, sx-sr, sy-sr, sx+sr, sy+sr)
-		self.canvas.coords(self.node, sx-8, sy-8, sx+8, sy+8)
-		self.canvas.coords(self.text, sx + 12, sy)
+		self.canvas.coords(self.node, sx, sy, sx + 1, sy)
+		self.canvas.coords(self.text, sx + MapCanvas.LABEL_GAP, sy)
 
 	def center(self) -> tuple[float, float]:
 		"""Gets The Center Coord Of The Node
@@ -109,11 +215,25 @@ class MapNode:
 		Returns:
 			float,float: Returns X And Y Seperately
 		"""
-		x1, y1, x2, y2 = self.canvas.coords(self.node)
-		return (x1+x2)/2, (y1+y2)/2
+		sf = self.canvas.scale_factor
+		return self.real_x * sf + self.canvas.offset_x, self.real_y * sf + self.canvas.offset_y
 
 
 class MapCanvas(tk.Canvas):
+	HIDDEN_INTERVAL_MS = 250		# While Minimized Or On Another Tab
+	LOAD_POLL_MS = 100				# Checks For Finished Loads While Asleep With Loads Pending
+	SETTLE_DISTANCE = 0.05			# Cursor Snaps To Its Target Inside This
+	MAX_DT = 0.25					# Longer Stalls Glide As If Only This Much Time Passed
+	STATS_EVERY = 30				# Frames Between Debug Overlay Refreshes
+	DOT_SIZE = 16					# Node Dot Diameter In Screen Pixels At Any Zoom
+	LABEL_GAP = 12					# Screen Pixels From A Node's Center To Its Label
+	CULL_MARGIN = 160				# Screen Pixels Kept Drawn Past The Edges, Labels Reach Out This Far
+	LOD_FULL, LOD_DOTS, LOD_CLUSTERS = range(3)
+	LOD_NAMES = ("Full", "Dots", "Clusters")
+	LABELS_MIN_ZOOM = 0.6			# Below This Labels And Radius Circles Are Dropped
+	DOTS_MIN_ZOOM = 0.35			# Below This Nodes Merge Into Cluster Glyphs
+	CLUSTER_PX = 48					# Smallest Screen Size Of A Cluster Cell
+
 	def __init__(self, parent, grid_size=40):
 		super().__init__(
 			parent,
@@ -124,7 +244,25 @@ class MapCanvas(tk.Canvas):
 		self.scale_factor = 1.0
 		self.offset_x = 0
 		self.offset_y = 0
-		self.nodes = []
+		self.store = NodeStore()
+		self._grid_columns = [[], 0]	# Pooled Grid Line Items And How Many Are Shown
+		self._grid_rows = [[], 0]
+		self.spatial = SpatialGrid()
+		self.clusters = ClusterGrid()
+		self.lod = self.LOD_FULL
+		self._cluster_glyphs = [[], 0]	# Pooled (Oval, Count) Item Pairs And How Many Are Shown
+		self._audible = set()			# Nodes Heard Last Frame, Rechecked Until They Fall Silent
+		self._loading = set()			# Nodes Whose Sound Was Still Loading, The Only Ones Reprioritized
+		self.tcl_calls = 0				# Canvas Calls Made By The Audio Update
+		self._glide_job = None			# Pending Glide Loop, None While Asleep
+		self._dirty = False
+		self._sound_loaded = Event()	# Set By Loader Threads, Which Must Never Call Into Tk
+		self._load_poll_job = None
+		self._nodes_changed = False		# Node State Edited Since The Audio Thread Last Got A Snapshot
+		self.audio_control = None		# Owns Gains On Its Own Thread, None To Set Them From The Glide Loop
+		self._last_tick = None			# Monotonic Time Of The Last Glide Frame, None After Sleeping
+		self.frame_tcl_calls = 0		# Of Those, How Many The Last Frame Made
+		self._view_rect = (0, 0, 0, 0)	# World Rect Nodes Are Drawn In, Set By cull_nodes
 		self.dragging_node = False
 		self.drop_outline = None
 
@@ -158,6 +296,15 @@ class MapCanvas(tk.Canvas):
 			font=("Segoe UI", 10, "bold"),
 		)
 
+		self.profile_text = self.create_text(
+			self.winfo_width() - 10, self.winfo_height() - 10,
+			anchor="se",
+			justify="right",
+			fill=ThemeManager.Get("Accent"),
+			font=("Consolas", 9),
+			state="hidden"
+		)
+
 		self.grid_size = grid_size
 		self.snap_to_grid = tk.BooleanVar(value=OptionsManager.Get("snap_to_grid"))
 		def _on_snap_change(*_):
@@ -172,7 +319,15 @@ class MapCanvas(tk.Canvas):
 		self.is_simple = tk.BooleanVar(value=OptionsManager.Get("simple_ui"))
 		def _on_simple_change(*_):
 			OptionsManager.Set("simple_ui", self.is_simple.get())
+			self.refresh_node_texts()
 		self.is_simple.trace_add("write", _on_simple_change)
+
+		self.tick_hz = tk.IntVar(value=OptionsManager.Get("glide_tick_hz"))
+		self.frame_stats = FrameStats(self.tick_interval())
+		def _on_tick_change(*_):
+			OptionsManager.Set("glide_tick_hz", self.tick_hz.get())
+			self.frame_stats.reset(self.tick_interval())
+		self.tick_hz.trace_add("write", _on_tick_change)
 		
 		# Cursor
 		self.cursor = self.create_oval(
@@ -196,11 +351,22 @@ class MapCanvas(tk.Canvas):
 		self.bind("<B1-Motion>", self.drag_cursor)
 
 		self.bind("<KeyPress-f>", self.refocus)
+		self.bind("<F3>", lambda e: self.toggle_profiler())
 		self.configure(takefocus=True)
 		self.bind("<Button-1>", lambda e: self.focus_set(), add="+")
 
-		# Glide Loop Every 16~ ms
-		self.after(16, self._glide_loop)
+		# Glide Loop Every 16~ ms, Asleep While Nothing Changes
+		self.bind("<Map>", lambda e: self.wake(), add="+")
+		add_load_listener(self._sound_loaded.set)
+		self.wake()
+
+		if OptionsManager.Get("audio_thread"):
+			self.audio_control = AudioControl(self.glide_step, int(OptionsManager.Get("audio_control_hz")))
+			self.audio_control.start()
+
+	@property
+	def nodes(self) -> list[MapNode]:
+		return self.store.nodes
 
 	def _calc_zoom_from_dist(self, x: float) -> float:
 		scalar = ((586 / self.winfo_width()) + (536 / self.winfo_height())) / 2
@@ -209,17 +375,9 @@ class MapCanvas(tk.Canvas):
 		return min(magic, 2) / scalar
 
 	def _refocus_nodes(self):
-		big_num = 1000000000.0
-		coords_min = np.array([big_num, big_num])
-		coords_max = np.array([-big_num, -big_num])
-		for node in self.nodes:
-			cx, cy = node.center()
-			coord = np.array([cx,cy])							# Get Pos Without Panning / Zooming
-			coord -= np.array([self.offset_x,self.offset_y])	#
-			coord /= self.scale_factor							#
-			
-			coords_min = np.minimum(coords_min, coord)
-			coords_max = np.maximum(coords_max, coord)
+		coords = np.stack([self.store.x, self.store.y], axis=1)		# World Positions, No Panning / Zooming
+		coords_min = coords.min(axis=0)
+		coords_max = coords.max(axis=0)
 
 		node_dist = np.linalg.norm(coords_max-coords_min)
 		calc_zoom = self._calc_zoom_from_dist(node_dist)
@@ -299,16 +457,21 @@ class MapCanvas(tk.Canvas):
 		"""
 		self.cursor_target_x = (x - self.offset_x) / self.scale_factor
 		self.cursor_target_y = (y - self.offset_y) / self.scale_factor
+		self.wake()
 
 		if self.glide_mode.get() == GlideMode.SNAP:
 			self.cursor_x = self.cursor_target_x
 			self.cursor_y = self.cursor_target_y
 			self.update_cursor_position()
 
-	def glide_linear(self, current: np.ndarray[float, float], target: np.ndarray[float, float], speed: float) -> np.ndarray[float, float]:
+	def tick_interval(self) -> float:
+		"""Gets The Seconds Between Glide Frames At The Configured Tick Rate"""
+		return 1.0 / max(1, self.tick_hz.get())
+
+	def glide_linear(self, current: np.ndarray[float, float], target: np.ndarray[float, float], speed: float, dt: float) -> np.ndarray[float, float]:
 		delta = target - current
 		delta_size = np.linalg.norm(delta)
-		step = speed * .016666
+		step = speed * dt
 
 		if delta_size <= step:
 			return target
@@ -319,35 +482,122 @@ class MapCanvas(tk.Canvas):
 		else:
 			return current
 		
-	def glide_ease_out(self, current: np.ndarray[float, float], target: np.ndarray[float, float], speed: float) -> np.ndarray[float, float]:
+	def glide_ease_out(self, current: np.ndarray[float, float], target: np.ndarray[float, float], speed: float, dt: float) -> np.ndarray[float, float]:
 		delta = target - current
-		step = delta * .016666 * speed
+		step = delta * (1 - math.exp(-speed * dt))			# Same Curve At Any Frame Rate
 		return current + step
 
-	def update_cursor_position(self):
-		if self.glide_mode.get() == GlideMode.SNAP:
-			self.cursor_x = self.cursor_target_x
-			self.cursor_y = self.cursor_target_y
-		else:
-			pos = np.array([self.cursor_x, self.cursor_y])
-			target = np.array([self.cursor_target_x, self.cursor_target_y])
-			real = np.array([0,0])
-			
-			if self.glide_mode.get() == GlideMode.LINEAR:
-				real = self.glide_linear(pos, target, 75)
-			elif self.glide_mode.get() == GlideMode.EASE_OUT:
-				real = self.glide_ease_out(pos, target, 2)
-			self.cursor_x = real[0]
-			self.cursor_y = real[1]
+	@profiled("update_cursor_position")
+	def update_cursor_position(self, dt: float | None = None):
+		"""Moves The Cursor Toward Its Target And Updates The Audio
+
+		Args:
+			dt (float | None): Seconds Since The Last Glide Frame, The Tick Interval If None
+		"""
+		if dt is None:
+			dt = self.tick_interval()
+
+		mode = self.glide_mode.get()
+		target = (self.cursor_target_x, self.cursor_target_y)
+		self.cursor_x, self.cursor_y = self.glide_step((self.cursor_x, self.cursor_y), target, mode, dt)
 
 		sx = self.cursor_x * self.scale_factor + self.offset_x
 		sy = self.cursor_y * self.scale_factor + self.offset_y
 		self.coords(self.cursor, sx-6, sy-6, sx+6, sy+6)
+
+		if self.audio_control:
+			if self._nodes_changed:
+				self._nodes_changed = False
+				self.audio_control.publish_nodes(self.store)
+			self.audio_control.publish_cursor(self.cursor_x, self.cursor_y, *target, mode)
 		self.update_audio()
 
+	def glide_step(self, pos: tuple[float, float], target: tuple[float, float], mode: str, dt: float) -> tuple[float, float]:
+		"""Moves A Position One Frame Toward A Target, Safe To Call Off The Tk Thread
+
+		Args:
+			pos (tuple[float, float]): Current World Position
+			target (tuple[float, float]): Target World Position
+			mode (str): A GlideMode Value
+			dt (float): Seconds To Advance
+
+		Returns:
+			tuple[float, float]: The New Position, Exactly The Target Once Settled
+		"""
+		if mode == GlideMode.SNAP:
+			return target
+
+		current = np.array(pos)
+		goal = np.array(target)
+		real = current
+		if mode == GlideMode.LINEAR:
+			real = self.glide_linear(current, goal, 75, dt)
+		elif mode == GlideMode.EASE_OUT:
+			real = self.glide_ease_out(current, goal, 2, dt)
+		if np.linalg.norm(goal - real) < self.SETTLE_DISTANCE:
+			return target
+		return float(real[0]), float(real[1])
+
+	def nodes_changed(self):
+		"""Marks Node State As Edited, The Audio Thread Gets A New Snapshot Next Frame"""
+		self._nodes_changed = True
+		self.wake()
+
+	def sync_audio_nodes(self):
+		"""Hands The Audio Thread A Node Snapshot Right Away Instead Of Next Frame"""
+		if self.audio_control:
+			self._nodes_changed = False
+			self.audio_control.publish_nodes(self.store)
+
+	def wake(self):
+		"""Marks The Map As Changed And Restarts The Glide Loop If It's Asleep"""
+		self._dirty = True
+		if self._glide_job is None:
+			self._glide_job = self.after_idle(self._glide_loop)
+
+	def _poll_loads(self):
+		"""Wakes The Loop Once A Load Has Finished, Polling While Asleep Until None Are Pending"""
+		self._load_poll_job = None
+		pending = pending_loads()								# Read First, A Load Flags Before It Stops Counting
+		if self._sound_loaded.is_set():
+			self._sound_loaded.clear()
+			self.wake()
+		elif pending:
+			self._load_poll_job = self.after(self.LOAD_POLL_MS, self._poll_loads)
+
+	def cursor_settled(self) -> bool:
+		return self.cursor_x == self.cursor_target_x and self.cursor_y == self.cursor_target_y
+
+	@profiled("frame")
 	def _glide_loop(self):
-		self.update_cursor_position()
-		self.after(16, self._glide_loop)
+		now = time.monotonic()
+		if self._last_tick is None:								# Woke From Sleep, The Gap Isn't Lateness
+			dt = self.tick_interval()
+		else:
+			dt = now - self._last_tick
+			if self.winfo_viewable():
+				self.frame_stats.record(dt)
+				if self.frame_stats.frames % self.STATS_EVERY == 0:
+					self.update_debug_info()
+					self.update_profile_overlay()
+		self._last_tick = now
+
+		self._dirty = False
+		self._sound_loaded.clear()								# This Frame Picks Up Anything Already Loaded
+		self.update_cursor_position(min(dt, self.MAX_DT))
+
+		if not self._dirty and self.cursor_settled():
+			self._glide_job = None								# Sleep Until Something Wakes Us
+			self._last_tick = None
+			if self._load_poll_job is None:
+				self._poll_loads()
+			return
+
+		if self.winfo_viewable():
+			interval = round(self.tick_interval() * 1000)
+		else:
+			interval = self.HIDDEN_INTERVAL_MS
+		self._glide_job = self.after(interval, self._glide_loop)
 
 	def drag_cursor(self, event):
 		if self.dragging_node:
@@ -364,8 +614,7 @@ class MapCanvas(tk.Canvas):
 			file_path (str): The File Path For The Audio File
 		"""
 		audio = AudioNode(file_path)
-		node = MapNode(self, x / self.scale_factor, y / self.scale_factor, audio)
-		self.nodes.append(node)
+		MapNode(self, x / self.scale_factor, y / self.scale_factor, audio)
 		self.update_all_positions()
 
 		
@@ -386,51 +635,289 @@ class MapCanvas(tk.Canvas):
 		return x, y
 
 
+	@profiled("update_audio")
 	def update_audio(self):
+		store = self.store
+		sf = self.scale_factor
 		cx, cy = self.get_cursor_center()
+		wx = (cx - self.offset_x) / sf										# Cursor In World Space
+		wy = (cy - self.offset_y) / sf
 
-		for node in self.nodes:
-			if hasattr(node.audio_node, "enabled") and not node.audio_node.enabled:
-				node.audio_node.set_volume(0)
-				self.itemconfig(node.text, fill=ThemeManager.Get("Text_Ghost"))
-				continue
-			
-			nx, ny = node.center()
-			dist = math.dist((cx, cy), (nx, ny))
-			nRad = node.radius * self.scale_factor
+		nodes = self.spatial.query(wx, wy) | self._audible					# Only Nodes That Can Be Or Were Just Heard
+		if len(store) and pending_loads():
+			self._prioritize_loads(wx, wy, nodes)
 
-			if dist < nRad:
-				vol = 1 - (dist / nRad)
+		if not nodes:
+			self._count_frame(self.tcl_calls)
+			return
+		rows = np.fromiter((node.row for node in nodes), int, len(nodes))
+
+		dist = np.hypot(store.x[rows] - wx, store.y[rows] - wy)
+		radius = np.maximum(store.radius[rows], 1e-6)
+		vols = np.where(store.enabled[rows], FalloffTable.Get().gains(store.falloff[rows], dist, radius), 0.0)
+		audible = vols > 0
+		cursor_enter = store.playstyle[rows] == playstyle_code(PlayStyle.CURSOR_ENTER)
+
+		if self.audio_control is None:										# Otherwise Its Thread Plays And Sets Gains
+			audio_nodes = [store.audio[row] for row in rows]
+			for i, audio in enumerate(audio_nodes):
+				if audible[i] and not audio.is_playing:
+					audio.play()
+				elif not audible[i] and cursor_enter[i] and store.enabled[rows[i]] and audio.is_playing:
+					audio.stop()
 
-				self.coords(
-					node.link_line,
-					nx, ny,
-					cx, cy
-				)
+			set_gains(audio_nodes, vols)									# One Backend Call For The Whole Gain Vector
+
+		calls = self.tcl_calls
+		sx = store.x[rows] * sf + self.offset_x
+		sy = store.y[rows] * sf + self.offset_y
+		visible = store.visible[rows]
+		labels = self.lod == self.LOD_FULL
+		text_color = ThemeManager.Get("Text")
+		ghost_color = ThemeManager.Get("Text_Ghost")
+		self._audible = set()
+		for i, row in enumerate(rows):
+			node = store.nodes[row]
+			if audible[i]:
+				self._audible.add(node)
+			if not visible[i]:
+				continue														# Culled, Drawn Once It's Back In View
+
+			if not store.enabled[row]:
+				if labels:
+					self._show_fill(node, ghost_color)
+				continue
 
-				self.itemconfig(node.link_line, state="normal")
+			if audible[i]:
+				self._show_link(node, (round(sx[i], 1), round(sy[i], 1), round(cx, 1), round(cy, 1)))
 			else:
-				vol = 0
-				self.itemconfig(node.link_line, state="hidden")
+				self._show_link(node, None)
 
-			audio = node.audio_node
+			if labels:
+				self._show_text(node, vols[i])
+				self._show_fill(node, text_color if audible[i] else ghost_color)
 
-			if audio.playstyle == PlayStyle.CURSOR_ENTER:
-				if vol > 0 and not audio.is_playing:
-					audio.play()
-				elif vol == 0 and audio.is_playing:
-					audio.stop()
-			elif audio.playstyle == PlayStyle.LOOP_FOREVER:
-				if vol > 0 and not audio.is_playing:
-					audio.play()
+		self._count_frame(calls)
 
-			audio.set_volume(vol)
+	def _count_frame(self, calls_before: int):
+		shown = self.frame_tcl_calls
+		self.frame_tcl_calls = self.tcl_calls - calls_before
+		if self.frame_tcl_calls != shown:
+			self.update_debug_info()
 
+	def _show_text(self, node: MapNode, vol: float):
+		bucket = self.volume_bucket(vol)
+		if bucket != node.shown_bucket:
+			node.shown_bucket = bucket
+			self.tcl_calls += 1
 			self.itemconfig(node.text, text=self.get_node_text(node, vol))
-			if vol > 0:
-				self.itemconfig(node.text, fill=ThemeManager.Get("Text"))
+
+	def _show_fill(self, node: MapNode, fill: str):
+		if fill != node.shown_fill:
+			node.shown_fill = fill
+			self.tcl_calls += 1
+			self.itemconfig(node.text, fill=fill)
+
+	def _show_link(self, node: MapNode, coords: tuple | None):
+		"""Shows The Link Line At Coords, Or Hides It For None"""
+		# Keyed On The View Too, Pans And Zooms Move The Line Without Going Through Here
+		shown = (self.scale_factor, self.offset_x, self.offset_y, coords)
+		if coords is not None and shown != node.shown_link_coords:
+			node.shown_link_coords = shown
+			self.tcl_calls += 1
+			self.coords(node.link_line, *coords)
+
+		visible = coords is not None
+		if visible != node.shown_link:
+			node.shown_link = visible
+			self.tcl_calls += 1
+			self.itemconfig(node.link_line, state="normal" if visible else "hidden")
+
+	def track_load(self, node: MapNode):
+		"""Ranks A Node's Load By Cursor Distance Each Frame Until It Finishes"""
+		if node.audio_node.is_loading():
+			self._loading.add(node)
+
+	def _prioritize_loads(self, wx: float, wy: float, nearby: set):
+		"""Orders Queued Loads By Cursor Distance, Visiting Only Nodes Still Loading
+
+		Args:
+			wx (float): Cursor World X
+			wy (float): Cursor World Y
+			nearby (set[MapNode]): Nodes In Earshot, Which May Have Started Reloading An Evicted Sound
+		"""
+		self._loading.update(node for node in nearby if node.audio_node.is_loading())
+		self._loading = {node for node in self._loading if node.row is not None and node.audio_node.is_loading()}
+		if not self._loading:
+			return
+
+		store = self.store
+		loading = list(self._loading)
+		rows = np.fromiter((node.row for node in loading), int, len(loading))
+		priorities = np.hypot(store.x[rows] - wx, store.y[rows] - wy) - store.radius[rows]	# Negative While The Cursor Is Inside
+		load_priorities = {}
+		for node, row, priority in zip(loading, rows, priorities.tolist()):
+			if store.enabled[row]:
+				key = node.audio_node.sound_key
+				load_priorities[key] = min(priority, load_priorities.get(key, priority))
+		if load_priorities:
+			prioritize_loads(load_priorities)
+
+	def refresh_node_texts(self):
+		"""Redraws The Labels Of Nodes Out Of Earshot, Heard Ones On The Frame It Wakes
+
+		The Simple UI Toggle And update_theme Both Come Through Here
+		"""
+		ghost_color = ThemeManager.Get("Text_Ghost")
+		labels = self.lod == self.LOD_FULL
+		for node, visible in zip(self.nodes, self.store.visible):
+			node.shown_bucket = None
+			node.shown_fill = None
+			if labels and visible and node not in self._audible:
+				self._show_text(node, 0)
+				self._show_fill(node, ghost_color)
+		self.wake()												# Heard Labels Redraw Next Frame, Even If The Loop Slept
+
+	def visible_rect(self) -> tuple[float, float, float, float]:
+		"""Gets The World Rect On Screen, Padded By The Cull Margin
+
+		Returns:
+			tuple[float, float, float, float]: Left, Top, Right And Bottom In World Coords
+		"""
+		sf = self.scale_factor
+		m = self.CULL_MARGIN
+		return (
+			(-m - self.offset_x) / sf, (-m - self.offset_y) / sf,
+			(self.winfo_width() + m - self.offset_x) / sf, (self.winfo_height() + m - self.offset_y) / sf
+		)
+
+	@profiled("cull_nodes")
+	def cull_nodes(self):
+		"""Hides The Items Of Nodes That Left The View And Shows Ones That Entered It
+
+		Only Nodes Crossing The Edge Cost Canvas Calls, Audio Still Runs For Hidden Ones
+		"""
+		self._view_rect = x0, y0, x1, y1 = self.visible_rect()
+		store = self.store
+		r = store.radius
+		visible = (store.x + r >= x0) & (store.x - r <= x1) & (store.y + r >= y0) & (store.y - r <= y1)
+		visible &= self.lod != self.LOD_CLUSTERS							# Clusters Stand In For Every Node
+		for row in np.flatnonzero(visible != store.visible):
+			node = store.nodes[row]
+			self._set_node_shown(node, bool(visible[row]))
+			if visible[row]:
+				node.place()
+
+	def cull_node(self, node: MapNode) -> bool:
+		"""Hides Or Shows One Node Against The Current View After It Moved
+
+		Args:
+			node (MapNode): The Node
+
+		Returns:
+			bool: Whether It's In View
+		"""
+		x0, y0, x1, y1 = self._view_rect
+		x, y, r = node.real_x, node.real_y, node.radius
+		visible = x + r >= x0 and x - r <= x1 and y + r >= y0 and y - r <= y1 and self.lod != self.LOD_CLUSTERS
+		if visible != self.store.visible[node.row]:
+			self._set_node_shown(node, visible)
+		return visible
+
+	def _set_node_shown(self, node: MapNode, shown: bool):
+		self.store.visible[node.row] = shown
+		self.itemconfig(node.tag, state="normal" if shown else "hidden")
+		if shown:
+			node.shown_link = True								# Showing The Tag Showed The Link Line Too
+			labels = self.lod == self.LOD_FULL
+			if not labels:
+				self.itemconfig(node.text, state="hidden")
+				self.itemconfig(node.circle, state="hidden")
+			if node not in self._audible:
+				self._show_link(node, None)
+				if labels:
+					self._show_text(node, 0)
+					self._show_fill(node, ThemeManager.Get("Text_Ghost"))
+			self.wake()
+
+	def update_lod(self):
+		"""Picks The Detail Tier For The Zoom, Switching Tiers Hides Every Node To Be Reshown By Culling"""
+		if self.scale_factor >= self.LABELS_MIN_ZOOM:
+			lod = self.LOD_FULL
+		elif self.scale_factor >= self.DOTS_MIN_ZOOM:
+			lod = self.LOD_DOTS
+		else:
+			lod = self.LOD_CLUSTERS
+		if lod == self.lod:
+			return
+
+		self.lod = lod
+		self.itemconfig("world", state="hidden")
+		self.store.visible[:] = False
+
+	@profiled("draw_clusters")
+	def draw_clusters(self):
+		"""Draws One Glyph Per Occupied Cluster Cell In View, Or None Above The Cluster Tier"""
+		glyphs = []
+		if self.lod == self.LOD_CLUSTERS:
+			sf = self.scale_factor
+			x0, y0, x1, y1 = self._view_rect
+			level = self.clusters.level_for(self.CLUSTER_PX / sf)
+			for count, sum_x, sum_y in self.clusters.clusters(level).values():
+				x, y = sum_x / count, sum_y / count
+				if x0 <= x <= x1 and y0 <= y <= y1:
+					glyphs.append((x * sf + self.offset_x, y * sf + self.offset_y, count))
+
+		items, shown = self._cluster_glyphs
+		existing = len(items)
+		for i, (x, y, count) in enumerate(glyphs):
+			r = min(24, 6 + 3 * math.log2(count))
+			label = str(count) if count > 1 else ""
+			if i < existing:
+				oval, text = items[i]
+				self.coords(oval, x - r, y - r, x + r, y + r)
+				self.coords(text, x, y)
+				self.itemconfig(text, text=label)
 			else:
-				self.itemconfig(node.text, fill=ThemeManager.Get("Text_Ghost"))
+				items.append((
+					self.create_oval(
+						x - r, y - r, x + r, y + r,
+						fill=ThemeManager.Get("Node"),
+						outline=ThemeManager.Get("Node_Circle"),
+						tags=("cluster", "cluster_glyph")
+					),
+					self.create_text(
+						x, y,
+						text=label,
+						fill=ThemeManager.Get("BG_Dark"),
+						font=("Segoe UI", 8, "bold"),
+						tags=("cluster", "cluster_count")
+					)
+				))
+
+		for pair in items[shown:min(len(glyphs), existing)]:
+			for item in pair:
+				self.itemconfig(item, state="normal")
+		for pair in items[len(glyphs):shown]:
+			for item in pair:
+				self.itemconfig(item, state="hidden")
+		self._cluster_glyphs[1] = len(glyphs)
+
+		if len(items) > existing:
+			self.tag_lower("cluster", self.cursor)
+
+	def volume_bucket(self, vol: float) -> int:
+		"""Gets The Step Of A Volume The Node Label Can Show
+
+		Args:
+			vol (float): The Volume
+
+		Returns:
+			int: Equal Buckets Draw The Same Label
+		"""
+		if self.is_simple.get():
+			return int(vol * 100)
+		return math.ceil(vol * 24)
 
 	def get_node_text(self, node: MapNode, vol: float) -> str:
 		"""Creates And Returns The Text To The Right Of The Node
@@ -454,43 +941,68 @@ class MapCanvas(tk.Canvas):
 			return f"#{node.id} {filename}\n[{bars}]"
 
 	def get_cursor_center(self):
-		x1, y1, x2, y2 = self.coords(self.cursor)
-		return (x1 + x2) / 2, (y1 + y2) / 2
+		return self.cursor_x * self.scale_factor + self.offset_x, self.cursor_y * self.scale_factor + self.offset_y
 
+	@profiled("draw_grid")
 	def draw_grid(self):
-		self.delete("grid")
-
+		"""Positions The Grid Lines, Reusing Pooled Items Instead Of Recreating Them"""
 		w = self.winfo_width()
 		h = self.winfo_height()
+		sf = self.scale_factor
+		gs = self.grid_size
 
-		start_x = -self.offset_x / self.scale_factor
-		start_y = -self.offset_y / self.scale_factor
-		end_x = (w - self.offset_x) / self.scale_factor
-		end_y = (h - self.offset_y) / self.scale_factor
-
-		start_x = math.floor(start_x / self.grid_size) * self.grid_size
-		start_y = math.floor(start_y / self.grid_size) * self.grid_size
+		start_x = math.floor((-self.offset_x / sf) / gs) * gs
+		start_y = math.floor((-self.offset_y / sf) / gs) * gs
+		end_x = (w - self.offset_x) / sf
+		end_y = (h - self.offset_y) / sf
 
+		xs = []
 		x = start_x
 		while x <= end_x:
-			screen_x = x * self.scale_factor + self.offset_x
-			self.create_line(screen_x, 0, screen_x, h, fill=ThemeManager.Get("Grid_Color"), tags="grid")
-			x += self.grid_size
+			xs.append(x * sf + self.offset_x)
+			x += gs
 
+		ys = []
 		y = start_y
 		while y <= end_y:
-			screen_y = y * self.scale_factor + self.offset_y
-			self.create_line(0, screen_y, w, screen_y, fill=ThemeManager.Get("Grid_Color"), tags="grid")
-			y += self.grid_size
+			ys.append(y * sf + self.offset_y)
+			y += gs
+
+		self._place_grid_lines(self._grid_columns, [(sx, 0, sx, h) for sx in xs])
+		self._place_grid_lines(self._grid_rows, [(0, sy, w, sy) for sy in ys])
+
+	def _place_grid_lines(self, pool: list, lines: list[tuple]):
+		"""Moves Pooled Lines Into Place, Growing The Pool Or Hiding Spares
+
+		Args:
+			pool (list): [Items, Visible Count] For One Direction
+			lines (list[tuple]): Screen Coords For Each Line Needed
+		"""
+		items, shown = pool
+		existing = len(items)
+		for i, line in enumerate(lines):
+			if i < len(items):
+				self.coords(items[i], *line)
+			else:
+				items.append(self.create_line(*line, fill=ThemeManager.Get("Grid_Color"), tags="grid"))
 
-		self.tag_lower("grid")
+		for item in items[shown:min(len(lines), existing)]:
+			self.itemconfig(item, state="normal")
+		for item in items[len(lines):shown]:
+			self.itemconfig(item, state="hidden")
+		pool[1] = len(lines)
 
+		if len(items) > existing:
+			self.tag_lower("grid")
 
 	def on_resize(self, event):
+		self.cull_nodes()
+		self.draw_clusters()
 		self.draw_grid()
 		x = self.winfo_width() - 10
 		y = 10
 		self.coords(self.debug_text, x, y)
+		self.coords(self.profile_text, x, self.winfo_height() - 10)
 
 	def show_drop_indicator(self):
 		if self.drop_outline:
@@ -520,7 +1032,6 @@ class MapCanvas(tk.Canvas):
 		new_scale = old_scale + factor
 		new_scale = max(0.2, min(3.0, new_scale))
 
-		factor = new_scale / old_scale
 		mouse_x, mouse_y = event.x, event.y
 
 		grid_x = (mouse_x - self.offset_x) / old_scale
@@ -528,12 +1039,29 @@ class MapCanvas(tk.Canvas):
 
 		self.scale_factor = new_scale
 		self.scale_factor = round(self.scale_factor, 1)
+		factor = self.scale_factor / old_scale
 
 		self.offset_x = mouse_x - grid_x * self.scale_factor
 		self.offset_y = mouse_y - grid_y * self.scale_factor
 
-		self.update_all_positions()
-		self.update_debug_info()
+		# Circles And Links Scale About The Mouse In One Call, Text Keeps Its Size But The
+		# Label Gap Scales Too, Which Is The Same Shift For Every Label. Dots Would Stretch
+		# Into Pills, So Only Those In View Are Put Back, The Rest Are Placed When Shown
+		self.scale("scaled", mouse_x, mouse_y, factor, factor)
+		self.scale("label", mouse_x, mouse_y, factor, factor)
+		self.move("label", self.LABEL_GAP * (1 - factor), 0)
+		self.place_dots()
+		self.view_changed()
+
+	def place_dots(self):
+		"""Puts The Dots Of Nodes In View At Their Screen Position"""
+		store = self.store
+		rows = np.flatnonzero(store.visible)
+		sx = store.x[rows] * self.scale_factor + self.offset_x
+		sy = store.y[rows] * self.scale_factor + self.offset_y
+		for row, x, y in zip(rows, sx, sy):
+			self.coords(store.nodes[row].node, x, y, x + 1, y)
+		self.tcl_calls += len(rows)
 
 	def set_zoom(self, zoom):
 		self.scale_factor = zoom
@@ -550,13 +1078,31 @@ class MapCanvas(tk.Canvas):
 		dy = event.y - self.pan_start[1]
 		self.offset_x += dx
 		self.offset_y += dy
-		self.update_all_positions()
+		self.move("world", dx, dy)
 		self.pan_start = (event.x, event.y)
+		self.view_changed()
+
+	def view_changed(self):
+		"""Follows Up A Pan Or Zoom That Already Moved The World Items
+
+		Only The Grid And Cursor Are Redrawn, So The Cost Doesn't Grow With The Node Count
+		"""
+		self.move_cursor(
+			self.cursor_x * self.scale_factor + self.offset_x,
+			self.cursor_y * self.scale_factor + self.offset_y
+		)
+		self.update_lod()
+		self.cull_nodes()
+		self.draw_clusters()
+		self.draw_grid()
 		self.update_debug_info()
 
-	def update_all_positions(self):
+	def update_all_positions(self):					# Full Resync From World Coords
+		self.update_lod()
+		self._view_rect = self.visible_rect()
 		for node in self.nodes:
 			node.move_to(node.real_x, node.real_y)
+		self.draw_clusters()
 		
 		self.move_cursor(
 			self.cursor_x * self.scale_factor + self.offset_x,
@@ -565,35 +1111,98 @@ class MapCanvas(tk.Canvas):
 		self.draw_grid()
 
 	def update_debug_info(self):
-		text = f"Offset: ({int(self.offset_x)}, {int(self.offset_y)})\nZoom: {self.scale_factor:.1f}"
+		text = (
+			f"Offset: ({int(self.offset_x)}, {int(self.offset_y)})\nZoom: {self.scale_factor:.1f}\n"
+			f"Canvas Calls: {self.frame_tcl_calls} / Frame\n"
+			f"Visible: {int(np.count_nonzero(self.store.visible))} / {len(self.store)} Nodes, "
+			f"Detail: {self.LOD_NAMES[self.lod]}"
+		)
+		frames = self.frame_stats.stats()
+		if frames["frames"]:
+			text += f"\nFrame: {frames['mean_ms']:.1f} ms ±{frames['jitter_ms']:.1f}, Late: {frames['late']}"
 		self.itemconfig(self.debug_text, text=text, fill=ThemeManager.Get("Accent"))
 
+	def toggle_profiler(self):
+		"""Turns Hot Path Timing And Its Overlay On Or Off"""
+		profiler = Profiler.Get()
+		profiler.enabled = not profiler.enabled
+		if profiler.enabled:
+			profiler.reset()
+		self.itemconfig(self.profile_text, state="normal" if profiler.enabled else "hidden")
+		self.update_profile_overlay()
+		self.wake()
+
+	def update_profile_overlay(self):
+		profiler = Profiler.Get()
+		if not profiler.enabled:
+			return
+
+		frames = self.frame_stats.stats()
+		lines = [
+			f"Frame  p50 {frames['p50_ms']:.1f}  p95 {frames['p95_ms']:.1f}  p99 {frames['p99_ms']:.1f}  max {frames['max_ms']:.1f} ms",
+		]
+		for name, stat in sorted(profiler.stats().items()):
+			lines.append(f"{name}  {stat['mean_ms']:.2f} / {stat['p95_ms']:.2f} ms  x{stat['calls']}")
+
+		audio = audio_stats()
+		cache = audio["cache"]
+		decodes = audio["decodes"]
+		lines += [
+			f"Canvas Calls  {self.frame_tcl_calls} / Frame  {self.tcl_calls} Total",
+			f"Sound Cache  {cache['entries']} Entries  {cache['hit_rate']:.0%} Hits  "
+			f"{cache['used_bytes'] / (1024 * 1024):.0f} / {cache['budget_bytes'] / (1024 * 1024):.0f} MB",
+			f"Decoding  {audio['pending_loads']} Queued  {decodes['count']} Done  {decodes['mean']:.2f}s Mean",
+		]
+		self.itemconfig(self.profile_text, text="\n".join(lines), fill=ThemeManager.Get("Accent"))
+
 	def enable_node(self):
 		node = self.right_clicked_node
 		if node:
-			node.audio_node.enabled = True
+			node.enabled = True
 			self.itemconfig(node.node, fill=ThemeManager.Get("Node"))
 			self.update_audio()
 
 	def disable_node(self):
 		node = self.right_clicked_node
 		if node:
-			node.audio_node.enabled = False
+			node.enabled = False
 			self.itemconfig(node.node, fill=ThemeManager.Get("Node_Disabled"))
+			self.sync_audio_nodes()
 			node.audio_node.set_volume(0)
 			self.update_audio()
 
 	def delete_node(self):
 		node = self.right_clicked_node
 		if node:
-			node.audio_node.channel.stop()
-			self.delete(node.node)
-			self.delete(node.circle)
-			self.delete(node.text)
-			self.delete(node.link_line)
-			self.nodes.remove(node)
+			self.remove_node(node)
 			self.update_audio()
 
+	def remove_node(self, node: MapNode):
+		"""Releases A Node's Audio And Deletes Its Items And Row
+
+		Args:
+			node (MapNode): The Node To Remove
+		"""
+		if self.audio_control:
+			with self.audio_control.lock:								# The Audio Thread Must Not Touch It Once Released
+				node.audio_node.release()
+				self.store.remove(node)
+				self.sync_audio_nodes()
+		else:
+			node.audio_node.release()
+			self.store.remove(node)
+		self.delete(node.node)
+		self.delete(node.circle)
+		self.delete(node.text)
+		self.delete(node.link_line)
+		self.spatial.remove(node)
+		self.clusters.remove(node)
+		self._audible.discard(node)
+		self._loading.discard(node)
+		if self.lod == self.LOD_CLUSTERS:
+			self.draw_clusters()
+		self.wake()
+
 	def adjust_node_radius(self):
 		node = self.right_clicked_node
 		if not node:
@@ -650,20 +1259,13 @@ class MapCanvas(tk.Canvas):
 	def remove_nodes_with_file(self, file_path):
 		for node in self.nodes[:]:
 			if node.audio_node.file_path == file_path:
-				if node.audio_node.channel:
-					node.audio_node.channel.stop()
-
-				self.delete(node.node)
-				self.delete(node.circle)
-				self.delete(node.text)
-				self.delete(node.link_line)
-
-				self.nodes.remove(node)
+				self.remove_node(node)
 
 		self.update_audio()
 
 	def update_theme(self):
 		self.update_debug_info()
+		self.update_profile_overlay()
 		self.configure(bg=ThemeManager.Get("BG_Dark"))
 
 		self.itemconfig(self.cursor, fill=ThemeManager.Get("Text"))
@@ -677,11 +1279,15 @@ class MapCanvas(tk.Canvas):
 			fg=ThemeManager.Get("Text")
 		)
 
+		self.itemconfig("grid", fill=ThemeManager.Get("Grid_Color"))
 		self.draw_grid()
 
-		for node in self.nodes:
-			self.itemconfig(node.circle, outline=ThemeManager.Get("Node_Circle"))
-			self.itemconfig(node.link_line, fill=ThemeManager.Get("Link_Line"))
-			self.itemconfig(node.text, fill=ThemeManager.Get("Text"))
-			node_color = ThemeManager.Get("Node") if node.audio_node.enabled else ThemeManager.Get("Node_Disabled")
-			self.itemconfig(node.node, fill=node_color)
\ No newline at end of file
+		self.itemconfig("radius", outline=ThemeManager.Get("Node_Circle"))
+		self.itemconfig("link", fill=ThemeManager.Get("Link_Line"))
+		self.itemconfig("dot", fill=ThemeManager.Get("Node"))
+		self.itemconfig("cluster_glyph", fill=ThemeManager.Get("Node"), outline=ThemeManager.Get("Node_Circle"))
+		self.itemconfig("cluster_count", fill=ThemeManager.Get("BG_Dark"))
+		for row in np.flatnonzero(~self.store.enabled):
+			self.itemconfig(self.store.nodes[row].node, fill=ThemeManager.Get("Node_Disabled"))
+
+		self.refresh_node_texts()
\ No newline at end of file
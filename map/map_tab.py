@@ -3,9 +3,10 @@ from tkinter import ttk
 import json
 import gzip
 
-from enums import GlideMode
+from enums import Falloff, GlideMode
+from map.falloff import DEFAULT_SPLINE, normalize_points
 from map.map_canvas import MapCanvas, MapNode
-from audio_engine import AudioNode, PlayStyle, load_sound_async
+from audio_engine import AudioNode, PlayStyle, prefetch_sound
 from utils.theme import *
 from utils.alerts import AlertManager
 
@@ -118,6 +119,36 @@ class MapTab(tk.Frame):
 
 		self.glide_combo.bind("<<ComboboxSelected>>", on_glide_change)
 
+		# Glide Tick Rate
+		self.tick_frame = tk.Frame(self, bg=ThemeManager.Get("BG_Panel"))
+		self.tick_frame.pack(anchor="nw", padx=10, pady=2, fill="x")
+
+		self.tick_label = tk.Label(
+			self.tick_frame,
+			text="Tick Rate",
+			bg=ThemeManager.Get("BG_Panel"),
+			fg=ThemeManager.Get("Text"),
+			font=("Segoe UI", 9)
+		)
+		self.tick_label.pack(side="left")
+
+		self.tick_combo = ttk.Combobox(
+			self.tick_frame,
+			state="readonly",
+			values=["30 Hz", "60 Hz", "120 Hz"],
+			width=10,
+			style="Dark.TCombobox"
+		)
+		self.tick_combo.pack(side="right")
+		self.tick_combo.set(f"{self.canvas.tick_hz.get()} Hz")
+
+		def on_tick_change(event):
+			self.canvas.tick_hz.set(int(self.tick_combo.get().split()[0]))
+			self.tick_combo.selection_clear()
+			self.tick_combo.master.focus_set()
+
+		self.tick_combo.bind("<<ComboboxSelected>>", on_tick_change)
+
 		# Simple Debug Info
 		self.simple_ui_check = tk.Checkbutton(
 			self,
@@ -242,15 +273,19 @@ class MapTab(tk.Frame):
 
 		for node in self.canvas.nodes:
 			audio = node.audio_node
-			data["nodes"].append({
+			node_data = {
 				"file_path": audio.file_path,
 				"x": node.real_x,
 				"y": node.real_y,
 				"radius": node.radius,
 				"enabled": audio.enabled,
 				"playstyle": audio.playstyle,
-				"loops": audio.loops
-			})
+				"loops": audio.loops,
+				"falloff": node.falloff
+			}
+			if node.falloff == Falloff.CUSTOM:
+				node_data["falloff_points"] = [list(point) for point in node.falloff_points]
+			data["nodes"].append(node_data)
 
 		with gzip.open(file_path, "wt", encoding="utf-8") as f:
 			json.dump(data, f)
@@ -261,11 +296,7 @@ class MapTab(tk.Frame):
 				data = json.load(f)
 
 			for node in self.canvas.nodes[:]:
-				node.audio_node.channel.stop()
-				self.canvas.delete(node.node)
-				self.canvas.delete(node.circle)
-				self.canvas.delete(node.text)
-			self.canvas.nodes.clear()
+				self.canvas.remove_node(node)
 
 			cursor = data.get("cursor", {"x": 200, "y": 200})
 			self.canvas.cursor_x = cursor["x"]
@@ -275,7 +306,7 @@ class MapTab(tk.Frame):
 
 			for node_data in data.get("nodes", []):
 				file = node_data["file_path"]
-				load_sound_async(file)
+				prefetch_sound(file)
 
 				if file not in shared_files:
 					shared_files.append(file)
@@ -293,8 +324,9 @@ class MapTab(tk.Frame):
 					node_data["y"],
 					audio,
 					radius=node_data.get("radius", 120),
+					falloff=node_data.get("falloff", Falloff.LINEAR),
+					falloff_points=normalize_points(node_data.get("falloff_points", DEFAULT_SPLINE)),
 				)
-				self.canvas.nodes.append(node)
 
 				node_color = ThemeManager.Get("Node")
 				if not audio.enabled:
@@ -358,4 +390,11 @@ class MapTab(tk.Frame):
 			fg=ThemeManager.Get("Text")
 		)
 
+		self.tick_frame.configure(bg=ThemeManager.Get("BG_Panel"))
+
+		self.tick_label.configure(
+			bg=ThemeManager.Get("BG_Panel"),
+			fg=ThemeManager.Get("Text")
+		)
+
 		self.canvas.update_theme()
\ No newline at end of file
@@ -0,0 +1,121 @@
+import numpy as np
+
+from enums import PlayStyle
+
+PLAYSTYLES = (PlayStyle.LOOP_FOREVER, PlayStyle.CURSOR_ENTER)		# Index Is The Stored Code
+
+
+def playstyle_code(playstyle: str) -> int:
+	"""Gets The Array Code For A Playstyle, -1 If Unknown"""
+	return PLAYSTYLES.index(playstyle) if playstyle in PLAYSTYLES else -1
+
+
+class NodeStore:
+	"""Map Node State Kept In Parallel NumPy Arrays, One Row Per Node
+
+	Rows Stay In Insertion Order, Removing A Node Shifts The Rows After It
+	"""
+	def __init__(self, capacity: int = 64):
+		self.nodes = []			# Row -> MapNode
+		self.audio = []			# Row -> AudioNode
+
+		self._x = np.zeros(capacity)
+		self._y = np.zeros(capacity)
+		self._radius = np.zeros(capacity)
+		self._enabled = np.zeros(capacity, bool)
+		self._playstyle = np.zeros(capacity, np.int8)
+		self._visible = np.zeros(capacity, bool)		# False While Its Items Are Culled
+		self._falloff = np.zeros(capacity, np.int16)	# Row In The FalloffTable
+
+	def __len__(self) -> int:
+		return len(self.nodes)
+
+	@property
+	def x(self) -> np.ndarray:
+		return self._x[:len(self.nodes)]
+
+	@property
+	def y(self) -> np.ndarray:
+		return self._y[:len(self.nodes)]
+
+	@property
+	def radius(self) -> np.ndarray:
+		return self._radius[:len(self.nodes)]
+
+	@property
+	def enabled(self) -> np.ndarray:
+		return self._enabled[:len(self.nodes)]
+
+	@property
+	def playstyle(self) -> np.ndarray:
+		return self._playstyle[:len(self.nodes)]
+
+	@property
+	def visible(self) -> np.ndarray:
+		return self._visible[:len(self.nodes)]
+
+	@property
+	def falloff(self) -> np.ndarray:
+		return self._falloff[:len(self.nodes)]
+
+	def add(self, node, x: float, y: float, radius: float, enabled: bool, playstyle: str, falloff: int = 0) -> int:
+		"""Appends A Row For A Node
+
+		Args:
+			node (MapNode): The Node The Row Belongs To
+			x (float): World X
+			y (float): World Y
+			radius (float): World Radius
+			enabled (bool): Whether It Can Be Heard
+			playstyle (str): A PlayStyle Value
+			falloff (int): Its FalloffTable Row
+
+		Returns:
+			int: The New Row
+		"""
+		row = len(self.nodes)
+		if row == len(self._x):
+			self._grow(row * 2)
+
+		self._x[row] = x
+		self._y[row] = y
+		self._radius[row] = radius
+		self._enabled[row] = enabled
+		self._playstyle[row] = playstyle_code(playstyle)
+		self._visible[row] = False				# Shown By The First Cull
+		self._falloff[row] = falloff
+
+		self.nodes.append(node)
+		self.audio.append(node.audio_node)
+		return row
+
+	def remove(self, node):
+		"""Drops A Node's Row And Moves Later Rows Up One
+
+		Args:
+			node (MapNode): The Node To Remove
+		"""
+		row = node.row
+		count = len(self.nodes)
+		for array in self._arrays():
+			array[row:count - 1] = array[row + 1:count]
+
+		del self.nodes[row]
+		del self.audio[row]
+		for moved in self.nodes[row:]:
+			moved.row -= 1
+		node.row = None
+
+	def clear(self):
+		for node in self.nodes:
+			node.row = None
+		self.nodes.clear()
+		self.audio.clear()
+
+	def _arrays(self):
+		return (self._x, self._y, self._radius, self._enabled, self._playstyle, self._visible, self._falloff)
+
+	def _grow(self, capacity: int):
+		self._x, self._y, self._radius, self._enabled, self._playstyle, self._visible, self._falloff = (
+			np.resize(array, capacity) for array in self._arrays()
+		)
@@ -0,0 +1,79 @@
+import math
+
+
+class SpatialGrid:
+	"""Uniform Grid Over Node Circles For Point Queries
+
+	Each Item Is Filed Under Every Cell Its Bounding Box Touches, So A Point
+	Query Only Looks At One Cell. Moving An Item Within Its Cells Is Free
+	"""
+	def __init__(self, cell_size: float = 256):
+		self.cell_size = cell_size
+
+		self._cells = {}		# (Col, Row) -> Set Of Items
+		self._spans = {}		# Item -> (Col0, Row0, Col1, Row1)
+
+	def __len__(self) -> int:
+		return len(self._spans)
+
+	def __contains__(self, item) -> bool:
+		return item in self._spans
+
+	def insert(self, item, x: float, y: float, radius: float):
+		"""Adds An Item Or Refiles It After A Move Or Radius Change
+
+		Args:
+			item (Hashable): The Item, Usually A MapNode
+			x (float): Center X
+			y (float): Center Y
+			radius (float): Circle Radius
+		"""
+		cs = self.cell_size
+		span = (
+			math.floor((x - radius) / cs), math.floor((y - radius) / cs),
+			math.floor((x + radius) / cs), math.floor((y + radius) / cs)
+		)
+		old = self._spans.get(item)
+		if old == span:
+			return
+
+		if old:
+			self._unfile(item, old)
+		self._spans[item] = span
+		c0, r0, c1, r1 = span
+		for col in range(c0, c1 + 1):
+			for row in range(r0, r1 + 1):
+				self._cells.setdefault((col, row), set()).add(item)
+
+	def remove(self, item):
+		span = self._spans.pop(item, None)
+		if span:
+			self._unfile(item, span)
+
+	def query(self, x: float, y: float) -> set:
+		"""Gets Every Item Whose Bounding Box Might Cover A Point
+
+		Args:
+			x (float): Point X
+			y (float): Point Y
+
+		Returns:
+			set: Candidate Items, Still Needing An Exact Distance Check
+		"""
+		cs = self.cell_size
+		return self._cells.get((math.floor(x / cs), math.floor(y / cs)), set())
+
+	def clear(self):
+		self._cells.clear()
+		self._spans.clear()
+
+	def _unfile(self, item, span):
+		c0, r0, c1, r1 = span
+		for col in range(c0, c1 + 1):
+			for row in range(r0, r1 + 1):
+				cell = self._cells.get((col, row))
+				if cell is None:
+					continue
+				cell.discard(item)
+				if not cell:
+					del self._cells[(col, row)]
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from map.clusters import ClusterGrid
+
+
+def _fresh(points: dict, level: int, base_cell: float) -> dict:
+	grid = ClusterGrid(base_cell)
+	for item, (x, y) in points.items():
+		grid.insert(item, x, y)
+	return grid.clusters(level)
+
+
+def _same(a: dict, b: dict):
+	assert a.keys() == b.keys()
+	for key in a:
+		assert a[key][0] == b[key][0]
+		assert a[key][1] == pytest.approx(b[key][1])
+		assert a[key][2] == pytest.approx(b[key][2])
+
+
+def test_counts_and_centroids():
+	grid = ClusterGrid(base_cell=10)
+	grid.insert("a", 1, 1)
+	grid.insert("b", 3, 5)
+	grid.insert("c", 15, 1)
+
+	assert grid.clusters(0) == {(0, 0): [2, 4.0, 6.0], (1, 0): [1, 15.0, 1.0]}
+	assert grid.clusters(1) == {(0, 0): [3, 19.0, 7.0]}
+
+
+def test_coarse_levels_built_from_finer_match_a_fresh_build():
+	rng = random.Random(3)
+	points = {i: (rng.uniform(-500, 500), rng.uniform(-500, 500)) for i in range(300)}
+	grid = ClusterGrid(base_cell=16)
+	for item, (x, y) in points.items():
+		grid.insert(item, x, y)
+
+	grid.clusters(1)
+	for level in (2, 4, 6):
+		_same(grid.clusters(level), _fresh(points, level, 16))
+
+
+def test_moves_and_removes_keep_cached_levels_current():
+	rng = random.Random(5)
+	points = {i: (rng.uniform(0, 400), rng.uniform(0, 400)) for i in range(100)}
+	grid = ClusterGrid(base_cell=16)
+	for item, (x, y) in points.items():
+		grid.insert(item, x, y)
+	for level in (0, 3):
+		grid.clusters(level)
+
+	for item in range(0, 100, 3):
+		points[item] = (rng.uniform(0, 400), rng.uniform(0, 400))
+		grid.insert(item, *points[item])
+	for item in range(1, 100, 7):
+		del points[item]
+		grid.remove(item)
+
+	assert len(grid) == len(points)
+	for level in (0, 3):
+		_same(grid.clusters(level), _fresh(points, level, 16))
+
+
+def test_level_for_picks_the_finest_big_enough_cells():
+	grid = ClusterGrid(base_cell=64, max_level=4)
+
+	assert grid.level_for(10) == 0
+	assert grid.level_for(65) == 1
+	assert grid.level_for(256) == 2
+	assert grid.level_for(1e9) == 4
@@ -0,0 +1,129 @@
+import pytest
+
+from audio.engine_process import (
+	_RECORD, FREE, HEAD, LOAD, PENDING_LOADS, PLAY, PRIORITY, RECORD_SIZE, STOP, TAIL, TEXT_SIZE, ProcessBackend
+)
+
+
+class Node:
+	def __init__(self, path: str, key: str = None):
+		self.file_path = path
+		self.sound_key = key or path
+		self.loops = -1
+		self.slot = None
+		self.is_playing = False
+
+
+@pytest.fixture
+def backend():
+	backend = ProcessBackend(capacity=8, ring_slots=4)		# Never Launched, The Test Reads The Ring Itself
+	yield backend
+	backend.shutdown()
+
+
+def _drain(backend: ProcessBackend) -> list:
+	"""Reads Every Published Record The Way The Child Does"""
+	commands = []
+	tail = int(backend.ctrl[TAIL])
+	while tail < int(backend.ctrl[HEAD]):
+		offset = (tail % backend.ring_slots) * RECORD_SIZE
+		op, slot, value, _, length = _RECORD.unpack_from(backend.records, offset)
+		text = bytes(backend.records[offset + _RECORD.size:offset + _RECORD.size + length]).decode("utf-8")
+		commands.append((op, slot, value, text))
+		tail += 1
+	backend.ctrl[TAIL] = tail
+	return commands
+
+
+def test_commands_arrive_in_order(backend):
+	node = Node("forest.ogg")
+
+	backend.open(node)
+	backend.stop(node)
+
+	assert _drain(backend) == [(LOAD, node.slot, -1, "forest.ogg"), (STOP, node.slot, 0, "")]
+
+
+def test_full_ring_queues_without_dropping(backend):
+	nodes = [Node(f"{i}.ogg") for i in range(6)]
+	for node in nodes:
+		backend.open(node)
+
+	assert backend.stats()["queued_commands"] == 6
+	assert len(_drain(backend)) == 4
+	with backend._lock:
+		backend._flush()
+	assert [text for _, _, _, text in _drain(backend)] == ["4.ogg", "5.ogg"]
+	assert backend.stats()["queued_commands"] == 0
+
+
+def test_ring_wraps_around(backend):
+	node = Node("a.ogg")
+	backend.open(node)
+	for _ in range(10):
+		backend.start(node)
+		backend.stop(node)
+		_drain(backend)
+
+	backend._push(PLAY, node.slot, -1)
+
+	assert _drain(backend) == [(PLAY, node.slot, -1, "")]
+	assert backend.ctrl[HEAD] == 22
+
+
+def test_free_returns_the_slot(backend):
+	node = Node("a.ogg")
+	backend.open(node)
+	slot = node.slot
+	backend.set_gains([node], [0.5])
+
+	backend.free(node)
+
+	assert node.slot is None
+	assert backend.gains[slot] == 0
+	assert not backend.is_loading(node)
+	assert _drain(backend)[-1] == (FREE, slot, 0, "")
+	other = Node("b.ogg")
+	backend.open(other)
+	assert other.slot == slot
+
+
+def test_priorities_are_forwarded_once_they_move(backend):
+	near, far = Node("near.ogg", "near"), Node("far.ogg", "far")
+	backend.open(near)
+	backend.open(far)
+	_drain(backend)
+
+	backend.prioritize({"near": 10.0, "far": 400.0, "unknown": 1.0})
+	backend.prioritize({"near": 12.0, "far": 400.0})
+	backend.prioritize({"near": 100.0})
+
+	assert _drain(backend) == [
+		(PRIORITY, near.slot, 10.0, ""),
+		(PRIORITY, far.slot, 400.0, ""),
+		(PRIORITY, near.slot, 100.0, ""),
+	]
+
+
+def test_loading_state_comes_from_the_segment(backend):
+	node = Node("a.ogg")
+	backend.open(node)
+
+	assert backend.is_loading(node)
+	backend.loading[node.slot] = 0
+	backend.ctrl[PENDING_LOADS] = 3
+	assert not backend.is_loading(node)
+	assert backend.pending_loads() == 3
+
+
+def test_out_of_slots_raises(backend):
+	for i in range(backend.capacity):
+		backend.open(Node(f"{i}.ogg"))
+
+	with pytest.raises(RuntimeError):
+		backend.open(Node("one too many.ogg"))
+
+
+def test_overlong_path_is_rejected(backend):
+	with pytest.raises(ValueError):
+		backend.open(Node("x" * (TEXT_SIZE + 1)))
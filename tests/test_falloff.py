@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from enums import Falloff
+from map.falloff import (
+	DEFAULT_SPLINE, FALLOFFS, LUT_SIZE, FalloffTable, format_points, normalize_points, parse_points, spline
+)
+
+D = np.linspace(0, 1, 2001)
+
+
+def test_builtin_rows_start_full_and_end_silent():
+	table = FalloffTable.Get()
+	for falloff in FALLOFFS:
+		row = table.lut[table.row(falloff)]
+		assert row[0] == pytest.approx(1.0)
+		assert row[-1] == 0
+		assert np.all(np.diff(row) <= 1e-6), falloff
+
+
+def test_gains_match_the_curve_within_half_a_step():
+	table = FalloffTable.Get()
+	rows = np.full(len(D), table.row(Falloff.LINEAR))
+	gains = table.gains(rows, D * 100, np.full(len(D), 100.0))
+
+	assert np.abs(gains - np.where(D < 1, 1 - D, 0)).max() <= 0.5 / (LUT_SIZE - 1) + 1e-6
+
+
+def test_gains_are_zero_outside_the_radius():
+	table = FalloffTable.Get()
+	rows = np.array([table.row(falloff) for falloff in FALLOFFS])
+
+	gains = table.gains(rows, np.full(len(rows), 250.0), np.full(len(rows), 100.0))
+
+	assert np.all(gains == 0)
+
+
+def test_custom_rows_are_shared_per_spline():
+	table = FalloffTable.Get()
+	points = ((0, 1), (0.3, 0.9), (1, 0))
+
+	row = table.row(Falloff.CUSTOM, points)
+
+	assert table.row(Falloff.CUSTOM, list(points)) == row
+	assert table.row(Falloff.CUSTOM, ((0, 1), (0.3, 0.8), (1, 0))) != row
+	assert table.row(Falloff.CUSTOM) == table.row(Falloff.CUSTOM, DEFAULT_SPLINE)
+
+
+def test_unknown_falloff_is_rejected():
+	with pytest.raises(ValueError):
+		FalloffTable.Get().row("nonsense")
+
+
+def test_spline_passes_through_its_points():
+	points = normalize_points(((0, 1), (0.2, 0.95), (0.5, 0.4), (0.8, 0.1), (1, 0)))
+	px, py = zip(*points)
+
+	assert np.allclose(spline(points, np.array(px)), py)
+
+
+@pytest.mark.parametrize("points", [
+	((0, 1), (0.1, 0.99), (0.2, 0.2), (1, 0)),					# Steep Drop That Overshoots A Plain Cubic
+	((0, 1), (0.5, 0.5), (0.51, 0.5), (1, 0)),					# Flat Step
+	((0, 1), (0.05, 0.0), (1, 0)),
+	((0, 1), (0.3, 1), (0.6, 0.1), (0.9, 0.1), (1, 0)),
+])
+def test_monotone_points_give_a_monotone_curve(points):
+	curve = spline(normalize_points(points), D)
+
+	assert np.all(np.diff(curve) <= 1e-9)
+	assert curve.max() <= 1 + 1e-9
+	assert curve.min() >= -1e-9
+
+
+def test_rising_points_stay_inside_their_range():
+	points = normalize_points(((0, 0.2), (0.4, 0.25), (0.5, 0.9), (1, 1)))
+	curve = spline(points, D)
+
+	assert np.all(np.diff(curve) >= -1e-9)
+
+
+def test_points_are_cleaned_and_round_trip_as_text():
+	points = parse_points("1:0, 0:1.5; 0.5:0.7, 0.5:0.6,")
+
+	assert points == ((0.0, 1.0), (0.5, 0.6), (1.0, 0.0))
+	assert parse_points(format_points(points)) == points
+
+
+def test_a_single_point_is_not_a_spline():
+	with pytest.raises(ValueError):
+		normalize_points(((0.5, 1), (0.5, 0)))
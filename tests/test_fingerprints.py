@@ -0,0 +1,80 @@
+import json
+import os
+
+from audio.fingerprints import INDEX_VERSION, FingerprintIndex, fingerprint_file
+
+HEADER = b"RIFF" + bytes(40)
+
+
+def _write(path, data: bytes, mtime_ns: int = None):
+	path.write_bytes(data)
+	if mtime_ns is not None:
+		os.utime(path, ns=(mtime_ns, mtime_ns))
+	return str(path)
+
+
+def test_same_length_files_differing_anywhere_get_different_fingerprints(tmp_path):
+	size = 600_000
+	base = HEADER + bytes(size)
+	for offset in (100, 70_000, size // 2, size - 10):
+		changed = bytearray(base)
+		changed[offset] = 1
+		a = _write(tmp_path / "a.wav", base)
+		b = _write(tmp_path / "b.wav", bytes(changed))
+		assert fingerprint_file(a) != fingerprint_file(b), offset
+
+
+def test_copies_share_a_fingerprint(tmp_path):
+	data = HEADER + os.urandom(200_000)
+	a = _write(tmp_path / "a.wav", data)
+	b = _write(tmp_path / "b.wav", data)
+
+	index = FingerprintIndex(str(tmp_path / "index.json"))
+
+	assert index.get(a) == index.get(b) == fingerprint_file(a)
+	assert index.path_for(index.get(b)) == a
+
+
+def test_unreadable_file_has_no_fingerprint(tmp_path):
+	index = FingerprintIndex(str(tmp_path / "index.json"))
+
+	assert index.get(str(tmp_path / "missing.wav")) is None
+
+
+def test_rewritten_file_is_rehashed_in_the_same_run(tmp_path):
+	path = _write(tmp_path / "a.wav", HEADER + bytes(1000), 1_000_000_000)
+	index = FingerprintIndex(str(tmp_path / "index.json"))
+	before = index.get(path)
+
+	_write(tmp_path / "a.wav", HEADER + b"\x01" + bytes(999), 2_000_000_000)
+
+	assert index.get(path) != before
+	assert index.get(path) == fingerprint_file(path)
+
+
+def test_index_survives_a_save_and_skips_unchanged_files(tmp_path, monkeypatch):
+	path = _write(tmp_path / "a.wav", HEADER + bytes(1000))
+	index_file = str(tmp_path / "index.json")
+	index = FingerprintIndex(index_file)
+	fingerprint = index.get(path)
+	index.save()
+
+	def fail(_):
+		raise AssertionError("Unchanged File Was Rehashed")
+	monkeypatch.setattr("audio.fingerprints.fingerprint_file", fail)
+
+	assert FingerprintIndex(index_file).get(path) == fingerprint
+
+
+def test_index_from_an_older_version_is_discarded(tmp_path):
+	path = _write(tmp_path / "a.wav", HEADER + bytes(1000))
+	stat = os.stat(path)
+	index_file = tmp_path / "index.json"
+	resolved = os.path.normcase(os.path.realpath(path))
+	index_file.write_text(json.dumps({resolved: [stat.st_mtime_ns, stat.st_size, "sampled"]}))
+
+	index = FingerprintIndex(str(index_file))
+
+	assert index.get(path) == fingerprint_file(path)
+	index.save()
+	assert json.loads(index_file.read_text())["version"] == INDEX_VERSION
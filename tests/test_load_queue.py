@@ -0,0 +1,95 @@
+from threading import Event, Lock
+
+from audio.load_queue import LoadQueue
+
+
+class Loader:
+	"""Blocks On The First Load So Later Ones Queue Up Behind It"""
+	def __init__(self):
+		self.order = []
+		self.started = Event()
+		self.release = Event()
+		self._lock = Lock()
+
+	def __call__(self, path: str) -> str:
+		if not self.started.is_set():
+			self.started.set()
+			self.release.wait(5)
+		with self._lock:
+			self.order.append(path)
+		return f"sound {path}"
+
+
+def _queue_behind_blocker(priorities: dict) -> tuple[LoadQueue, Loader, dict]:
+	loader = Loader()
+	queue = LoadQueue(loader, 1)
+	blocker = queue.submit("blocker", 0)
+	assert loader.started.wait(5)
+	futures = {path: queue.submit(path, priority) for path, priority in priorities.items()}
+	futures["blocker"] = blocker
+	return queue, loader, futures
+
+
+def _finish(loader: Loader, futures: dict):
+	loader.release.set()
+	for future in futures.values():
+		if not future.cancelled():
+			future.result(5)
+
+
+def test_loads_lowest_priority_first():
+	queue, loader, futures = _queue_behind_blocker({"far": 50, "near": 1, "mid": 10})
+
+	_finish(loader, futures)
+
+	assert loader.order == ["blocker", "near", "mid", "far"]
+	assert futures["near"].result() == "sound near"
+
+
+def test_equal_priorities_load_in_submit_order():
+	queue, loader, futures = _queue_behind_blocker({"a": 1, "b": 1, "c": 1})
+
+	_finish(loader, futures)
+
+	assert loader.order == ["blocker", "a", "b", "c"]
+
+
+def test_reprioritize_many_reorders_queued_loads():
+	queue, loader, futures = _queue_behind_blocker({"a": 1, "b": 2, "c": 3})
+
+	queue.reprioritize_many({"c": 0, "a": 5, "missing": -1})
+	_finish(loader, futures)
+
+	assert loader.order == ["blocker", "c", "b", "a"]
+
+
+def test_resubmit_reprioritizes_instead_of_duplicating():
+	queue, loader, futures = _queue_behind_blocker({"a": 1, "b": 2})
+
+	again = queue.submit("b", 0)
+	_finish(loader, futures)
+
+	assert again is futures["b"]
+	assert loader.order == ["blocker", "b", "a"]
+
+
+def test_heap_stays_bounded_under_reprioritizing():
+	queue, loader, futures = _queue_behind_blocker({str(i): i for i in range(5)})
+
+	for step in range(1000):
+		queue.reprioritize_many({str(i): (i * 7 + step) % 11 for i in range(5)})
+
+	assert len(queue._heap) == 5
+	_finish(loader, futures)
+	assert sorted(loader.order) == ["0", "1", "2", "3", "4", "blocker"]
+
+
+def test_cancel_skips_a_queued_load():
+	queue, loader, futures = _queue_behind_blocker({"a": 1, "b": 2})
+
+	assert queue.cancel("a")
+	assert not queue.cancel("a")
+	_finish(loader, futures)
+
+	assert futures["a"].cancelled()
+	assert loader.order == ["blocker", "b"]
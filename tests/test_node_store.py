@@ -0,0 +1,90 @@
+import numpy as np
+
+from enums import PlayStyle
+from map.node_store import NodeStore, playstyle_code
+
+
+class Node:
+	def __init__(self, name: str):
+		self.name = name
+		self.audio_node = f"audio {name}"
+		self.row = None
+
+
+def _fill(store: NodeStore, count: int) -> list:
+	nodes = []
+	for i in range(count):
+		node = Node(str(i))
+		node.row = store.add(node, i, i * 10, i + 1, i % 2 == 0, PlayStyle.LOOP_FOREVER, falloff=i)
+		nodes.append(node)
+	return nodes
+
+
+def test_add_grows_past_capacity():
+	store = NodeStore(capacity=2)
+	nodes = _fill(store, 5)
+
+	assert len(store) == 5
+	assert [node.row for node in nodes] == list(range(5))
+	assert np.array_equal(store.x, np.arange(5))
+	assert np.array_equal(store.falloff, np.arange(5))
+	assert not store.visible.any()						# Shown By The First Cull
+
+
+def test_remove_compacts_rows():
+	store = NodeStore(capacity=4)
+	nodes = _fill(store, 6)
+
+	store.remove(nodes[2])
+
+	assert nodes[2].row is None
+	assert len(store) == 5
+	assert [node.row for node in store.nodes] == list(range(5))
+	assert [node.name for node in store.nodes] == ["0", "1", "3", "4", "5"]
+	assert store.audio == [node.audio_node for node in store.nodes]
+	assert np.array_equal(store.x, [0, 1, 3, 4, 5])
+	assert np.array_equal(store.y, [0, 10, 30, 40, 50])
+	assert np.array_equal(store.radius, [1, 2, 4, 5, 6])
+	assert np.array_equal(store.enabled, [True, False, False, True, False])
+	assert np.array_equal(store.falloff, [0, 1, 3, 4, 5])
+
+
+def test_remove_first_and_last():
+	store = NodeStore()
+	nodes = _fill(store, 3)
+
+	store.remove(nodes[2])
+	store.remove(nodes[0])
+
+	assert len(store) == 1
+	assert store.nodes == [nodes[1]]
+	assert nodes[1].row == 0
+	assert store.x[0] == 1
+
+
+def test_add_after_remove_reuses_the_tail():
+	store = NodeStore(capacity=2)
+	nodes = _fill(store, 2)
+	store.remove(nodes[0])
+
+	node = Node("new")
+	node.row = store.add(node, 7, 8, 9, True, PlayStyle.CURSOR_ENTER)
+
+	assert node.row == 1
+	assert np.array_equal(store.x, [1, 7])
+	assert store.playstyle[1] == playstyle_code(PlayStyle.CURSOR_ENTER)
+
+
+def test_clear_drops_every_row():
+	store = NodeStore()
+	nodes = _fill(store, 3)
+
+	store.clear()
+
+	assert len(store) == 0
+	assert all(node.row is None for node in nodes)
+	assert len(store.x) == 0
+
+
+def test_unknown_playstyle_code():
+	assert playstyle_code("nonsense") == -1
@@ -0,0 +1,69 @@
+from audio.sound_cache import SoundCache
+
+
+def _sound(size: int) -> bytearray:
+	return bytearray(size)						# Sized Like A Sound Through The Buffer Protocol
+
+
+def test_least_recently_used_is_evicted_first():
+	cache = SoundCache(300)
+	cache.put("a", _sound(100))
+	cache.put("b", _sound(100))
+	cache.put("c", _sound(100))
+	cache.get("a")
+
+	cache.put("d", _sound(100))
+
+	assert "b" not in cache
+	assert all(key in cache for key in "acd")
+	assert cache.used_bytes == 300
+	assert cache.evictions == 1
+
+
+def test_pinned_sounds_survive_until_unpinned():
+	cache = SoundCache(200)
+	cache.put("a", _sound(100))
+	cache.pin("a")
+	cache.pin("a")
+
+	cache.put("b", _sound(100))
+	cache.put("c", _sound(100))
+	assert "a" in cache and "b" not in cache
+
+	cache.unpin("a")
+	assert cache.is_pinned("a")
+	cache.put("d", _sound(100))
+	assert "a" in cache
+
+	cache.unpin("a")
+	cache.set_budget(100)
+	assert "a" not in cache
+	assert cache.used_bytes <= 100
+
+
+def test_pins_can_hold_the_cache_over_budget():
+	cache = SoundCache(100)
+	for key in "ab":
+		cache.pin(key)
+		cache.put(key, _sound(100))
+
+	assert len(cache) == 2
+	assert not cache.has_room()
+
+
+def test_put_keeps_the_first_sound_for_a_key():
+	cache = SoundCache(1000)
+	first = cache.put("a", _sound(10))
+
+	assert cache.put("a", _sound(20)) is first
+	assert cache.size_of("a") == 10
+
+
+def test_stats_count_hits_and_misses():
+	cache = SoundCache(1000)
+	cache.put("a", _sound(10))
+	cache.get("a")
+	cache.get("missing")
+
+	stats = cache.stats()
+	assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
@@ -0,0 +1,45 @@
+from map.spatial_index import SpatialGrid
+
+
+def test_query_finds_items_whose_box_covers_the_point():
+	grid = SpatialGrid(cell_size=100)
+	grid.insert("a", 50, 50, 10)
+	grid.insert("b", 250, 50, 120)
+
+	assert grid.query(55, 55) == {"a"}
+	assert grid.query(150, 50) == {"b"}
+	assert grid.query(-500, -500) == set()
+
+
+def test_move_refiles_the_item():
+	grid = SpatialGrid(cell_size=100)
+	grid.insert("a", 50, 50, 10)
+
+	grid.insert("a", 950, 950, 10)
+
+	assert len(grid) == 1
+	assert grid.query(50, 50) == set()
+	assert grid.query(950, 950) == {"a"}
+
+
+def test_remove_leaves_no_empty_cells():
+	grid = SpatialGrid(cell_size=100)
+	grid.insert("a", 0, 0, 250)
+	grid.insert("b", 0, 0, 10)
+
+	grid.remove("a")
+	grid.remove("a")
+
+	assert "a" not in grid
+	assert grid.query(0, 0) == {"b"}
+	assert all(grid._cells.values())
+	grid.remove("b")
+	assert grid._cells == {}
+
+
+def test_negative_coordinates_floor_into_their_own_cells():
+	grid = SpatialGrid(cell_size=100)
+	grid.insert("a", -50, -50, 10)
+
+	assert grid.query(-1, -1) == {"a"}
+	assert grid.query(1, 1) == set()
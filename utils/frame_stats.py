@@ -0,0 +1,57 @@
+import math
+from collections import deque
+
+
+class FrameStats:
+	"""Rolling Frame Interval Stats Against A Target Interval"""
+	LATE_FACTOR = 1.5		# A Frame Is Late Once It Takes This Many Target Intervals
+
+	def __init__(self, target: float, window: int = 240):
+		self.target = target
+		self.frames = 0
+		self.late = 0
+
+		self._intervals = deque(maxlen=window)
+
+	def record(self, interval: float):
+		"""Adds One Measured Frame Interval
+
+		Args:
+			interval (float): Seconds Since The Previous Frame
+		"""
+		self.frames += 1
+		if interval > self.target * self.LATE_FACTOR:
+			self.late += 1
+		self._intervals.append(interval)
+
+	def stats(self) -> dict:
+		"""Gets Interval Stats Over The Window
+
+		Returns:
+			dict: Mean, Jitter (Std Dev), P50, P95, P99 And Max In ms, Plus Late And Total Frame Counts
+		"""
+		intervals = sorted(self._intervals)
+		if not intervals:
+			return {
+				"mean_ms": 0.0, "jitter_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0,
+				"late": self.late, "frames": self.frames
+			}
+
+		mean = sum(intervals) / len(intervals)
+		variance = sum((i - mean) ** 2 for i in intervals) / len(intervals)
+		return {
+			"mean_ms": mean * 1000,
+			"jitter_ms": math.sqrt(variance) * 1000,
+			"p50_ms": intervals[len(intervals) // 2] * 1000,
+			"p95_ms": intervals[int(len(intervals) * 0.95)] * 1000,
+			"p99_ms": intervals[int(len(intervals) * 0.99)] * 1000,
+			"max_ms": intervals[-1] * 1000,
+			"late": self.late,
+			"frames": self.frames,
+		}
+
+	def reset(self, target: float):
+		self.target = target
+		self.frames = 0
+		self.late = 0
+		self._intervals.clear()
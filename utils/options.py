@@ -6,8 +6,23 @@ OPTIONS_FILE = "./options.json"
 DEFAULT_OPTIONS = {
 	"snap_to_grid": True,
 	"glide_mode": "linear",
+	"glide_tick_hz": 60,
 	"simple_ui": False,
 	"theme": "Default",
+	"sound_cache_mb": 1024,
+	"stream_min_seconds": 300,
+	"stream_min_mb": 64,
+	"disk_cache_mb": 4096,
+	"max_voices": 256,
+	"voice_idle_release_s": 5,
+	"voice_loop_idle_release_s": 60,
+	"audio_backend": "channels",
+	"software_mixer_block": 1024,
+	"gain_epsilon": 0.004,
+	"gain_ramp_ms": 80,
+	"mixer_profile": "balanced",
+	"audio_thread": True,
+	"audio_control_hz": 100,
 	"files": {}
 }
 
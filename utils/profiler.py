@@ -0,0 +1,125 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+TRACE_DIR = "./profiles"
+
+
+class Profiler:
+	"""Rolling Timings For Named Hot Paths And A Trace Of Recent Calls
+
+	Off By Default, While Off A Profiled Call Costs One Attribute Check
+	"""
+	_instance = None
+
+	def __init__(self, window: int = 240, trace_size: int = 50000):
+		if Profiler._instance is not None:
+			raise RuntimeError("Use Get()")
+		Profiler._instance = self
+
+		self.enabled = False
+		self.window = window
+
+		self._timings = {}							# Name -> Deque Of Recent Durations
+		self._calls = {}							# Name -> Calls Since Reset
+		self._trace = deque(maxlen=trace_size)		# (Name, Start, Duration, Thread Id)
+		self._origin = time.perf_counter()
+
+	@classmethod
+	def Get(cls):
+		if cls._instance is None:
+			cls._instance = cls()
+
+		return cls._instance
+
+	def record(self, name: str, start: float, end: float):
+		"""Adds One Timed Call
+
+		Args:
+			name (str): The Hot Path
+			start (float): perf_counter At The Start
+			end (float): perf_counter At The End
+		"""
+		timings = self._timings.get(name)
+		if timings is None:
+			timings = self._timings.setdefault(name, deque(maxlen=self.window))
+		timings.append(end - start)
+		self._calls[name] = self._calls.get(name, 0) + 1
+		self._trace.append((name, start, end - start, threading.get_ident()))
+
+	def stats(self) -> dict:
+		"""Gets Timings Per Hot Path Over The Window
+
+		Returns:
+			dict: Name -> Calls, Mean, P95 And Max In ms
+		"""
+		stats = {}
+		for name, timings in list(self._timings.items()):
+			durations = sorted(timings)
+			if not durations:
+				continue
+			stats[name] = {
+				"calls": self._calls.get(name, 0),
+				"mean_ms": sum(durations) / len(durations) * 1000,
+				"p95_ms": durations[int(len(durations) * 0.95)] * 1000,
+				"max_ms": durations[-1] * 1000,
+			}
+		return stats
+
+	def reset(self):
+		self._timings.clear()
+		self._calls.clear()
+		self._trace.clear()
+
+	def dump(self, path: str | None = None) -> str:
+		"""Writes The Trace As Chrome Trace Events, Viewable In Perfetto Or chrome://tracing
+
+		Args:
+			path (str | None): Where To Write, A Timestamped File In TRACE_DIR If None
+
+		Returns:
+			str: The Written Path
+		"""
+		if path is None:
+			os.makedirs(TRACE_DIR, exist_ok=True)
+			path = os.path.join(TRACE_DIR, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+
+		events = [
+			{
+				"name": name,
+				"ph": "X",
+				"ts": (start - self._origin) * 1e6,
+				"dur": duration * 1e6,
+				"pid": os.getpid(),
+				"tid": tid,
+			}
+			for name, start, duration, tid in list(self._trace)
+		]
+		with open(path, "w", encoding="utf-8") as f:
+			json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+		return path
+
+
+def profiled(name: str):
+	"""Times Every Call Of The Wrapped Function While The Profiler Is On
+
+	Args:
+		name (str): The Hot Path Name Shown In The Overlay And Trace
+	"""
+	profiler = Profiler.Get()
+
+	def wrap(func):
+		@functools.wraps(func)
+		def timed(*args, **kwargs):
+			if not profiler.enabled:
+				return func(*args, **kwargs)
+			start = time.perf_counter()
+			try:
+				return func(*args, **kwargs)
+			finally:
+				profiler.record(name, start, time.perf_counter())
+		return timed
+	return wrap
@@ -0,0 +1,37 @@
+import time
+
+
+class StartupProfile:
+	"""Times Named Startup Phases Up To The First Frame
+
+	Does Nothing Unless Enabled, So Marks Can Stay In The Startup Path
+	"""
+	def __init__(self, start: float, enabled: bool = False):
+		self.enabled = enabled
+		self.start = start
+		self.phases = []		# (Name, Seconds)
+
+		self._last = start
+
+	def mark(self, name: str):
+		"""Ends The Current Phase
+
+		Args:
+			name (str): What The Phase Was Doing
+		"""
+		if not self.enabled:
+			return
+		now = time.perf_counter()
+		self.phases.append((name, now - self._last))
+		self._last = now
+
+	def report(self) -> str:
+		"""Formats Every Phase And The Total
+
+		Returns:
+			str: One Line Per Phase
+		"""
+		width = max((len(name) for name, _ in self.phases), default=0)
+		lines = [f"{name:<{width}}  {seconds * 1000:8.1f} ms" for name, seconds in self.phases]
+		lines.append(f"{'Total':<{width}}  {(self._last - self.start) * 1000:8.1f} ms")
+		return "\n".join(lines)